@@ -10,13 +10,149 @@ Agent Visual Workflow Tool - เครื่องมือช่วย Agent 
 Usage:
     python agent_visual_workflow.py --request-image SC-09
     python agent_visual_workflow.py --prepare-layout SC-09 --elements-detected "profile_image,textfield,button"
+    python agent_visual_workflow.py batch --manifests "wireframes/*/wireframes-manifest.yml" --action prepare-layout --output-dir out --jobs 4
+    python agent_visual_workflow.py batch --manifests wireframes-manifest.yml --action prepare-layout --detect-elements --emit-layouts \\
+        | python layout_helper.py --generate-flutter-layout --layout-jsonl - --jsonl-output
+    python agent_visual_workflow.py pipeline --manifests "wireframes/*/wireframes-manifest.yml" --detect-elements --ocr --output-dir lib/generated
+    python agent_visual_workflow.py --request-image SC-09 --manifest wireframes-manifest.yml --cache-stats
+    python agent_visual_workflow.py --prepare-layout SC-09 --manifest wireframes-manifest.yml --detect-elements
+    python agent_visual_workflow.py --prepare-layout SC-09 --manifest wireframes-manifest.yml --detect-elements --ocr
+    python agent_visual_workflow.py --detect-changes --manifest wireframes-manifest.yml
+    python agent_visual_workflow.py --coverage --manifest wireframes-manifest.yml
+    python agent_visual_workflow.py --timings - batch --manifests wireframes-manifest.yml --jsonl out.jsonl
+    python agent_visual_workflow.py --profile batch.prof batch --manifests wireframes-manifest.yml --jobs 1
 """
 
+import os
+import sys
 import json
+import hashlib
 import argparse
+from bisect import bisect_left
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import yaml
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+import instrumentation
+
+# yaml, pickle, glob, concurrent.futures และ cv2/numpy ถูก import เฉพาะใน code path ที่ใช้
+# เพื่อให้ --help และการสร้าง prompt เริ่มได้เร็ว (ดู startup_benchmark.py)
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "manifests"
+_CACHE_FORMAT = 1
+
+FINGERPRINTS_VERSION = 1
+
+MANIFEST_CACHE = {"enabled": True, "dir": DEFAULT_CACHE_DIR}
+MANIFEST_CACHE_STATS = {"hits": 0, "misses": 0}
+
+def configure_manifest_cache(enabled: bool = True, cache_dir: Optional[str] = None) -> None:
+    """ตั้งค่า cache ของ parsed manifest (ใช้เป็น initializer ของ worker processes ได้)"""
+    MANIFEST_CACHE["enabled"] = enabled
+    MANIFEST_CACHE["dir"] = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+def _parse_yaml(raw: bytes) -> Any:
+    import yaml
+    
+    # ใช้ libyaml (C loader) ถ้ามี - เร็วกว่า pure-Python loader หลายเท่า
+    with instrumentation.stage("manifest.parse"):
+        return yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+def load_manifest(manifest_path: str) -> Any:
+    """โหลด manifest YAML โดยใช้ cache บน disk (key: path + mtime + content hash)"""
+    path = Path(manifest_path).resolve()
+    raw = path.read_bytes()
+    instrumentation.count("manifest.bytes_read", len(raw))
+    
+    if not MANIFEST_CACHE["enabled"]:
+        return _parse_yaml(raw)
+    
+    import pickle
+    
+    key = {
+        "format": _CACHE_FORMAT,
+        "path": str(path),
+        "mtime_ns": path.stat().st_mtime_ns,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+    cache_file = MANIFEST_CACHE["dir"] / f"{hashlib.sha1(str(path).encode('utf-8')).hexdigest()}.pickle"
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get("key") == key:
+            MANIFEST_CACHE_STATS["hits"] += 1
+            instrumentation.count("manifest.cache_hits")
+            return cached["data"]
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, TypeError):
+        pass
+    
+    MANIFEST_CACHE_STATS["misses"] += 1
+    instrumentation.count("manifest.cache_misses")
+    data = _parse_yaml(raw)
+    
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({"key": key, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # cache เป็นแค่ optimization - เขียนไม่ได้ก็ไม่เป็นไร
+        pass
+    
+    return data
+
+class ManifestIndex:
+    """Index ของ screens/widgets ใน manifest สร้างครั้งเดียวตอนโหลด"""
+    
+    SECTIONS = ("screens", "widgets")
+    
+    def __init__(self, manifest_data: Optional[Dict[str, Any]]):
+        self.by_id: Dict[str, Dict[str, Dict[str, Any]]] = {section: {} for section in self.SECTIONS}
+        self.by_path: Dict[str, Dict[str, Any]] = {}
+        self._names: List[tuple] = []
+        
+        duplicates = []
+        for section in self.SECTIONS:
+            entries = (manifest_data or {}).get(section) or []
+            for entry in entries:
+                entry_id = entry["id"]
+                if entry_id in self.by_id[section]:
+                    duplicates.append(f"{section}: {entry_id}")
+                    continue
+                self.by_id[section][entry_id] = entry
+                
+                if entry.get("path"):
+                    self.by_path[Path(entry["path"]).as_posix()] = entry
+                if entry.get("name"):
+                    self._names.append((str(entry["name"]).casefold(), entry_id, entry))
+        
+        if duplicates:
+            raise ValueError(f"Duplicate ids in manifest: {', '.join(duplicates)}")
+        
+        self._names.sort(key=lambda item: (item[0], item[1]))
+        self._name_keys = [item[0] for item in self._names]
+    
+    def get(self, section: str, entry_id: str) -> Optional[Dict[str, Any]]:
+        """ค้นหา entry ตาม id แบบ O(1)"""
+        instrumentation.count("manifest.lookups")
+        return self.by_id[section].get(entry_id)
+    
+    def get_by_path(self, path: str) -> Optional[Dict[str, Any]]:
+        """ค้นหา entry ตาม path ของภาพ wireframe"""
+        instrumentation.count("manifest.lookups")
+        return self.by_path.get(Path(path).as_posix())
+    
+    def find_by_name_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        """ค้นหา entries ที่ชื่อขึ้นต้นด้วย prefix (ไม่สนตัวพิมพ์)"""
+        prefix = prefix.casefold()
+        start = bisect_left(self._name_keys, prefix)
+        matches = []
+        for name, _, entry in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.append(entry)
+        return matches
 
 class AgentVisualWorkflow:
     """Helper class สำหรับ Agent visual workflow"""
@@ -24,20 +160,22 @@ class AgentVisualWorkflow:
     def __init__(self, manifest_path: Optional[str] = None):
         self.manifest_path = manifest_path
         self.manifest_data = None
+        self.index = ManifestIndex(None)
         
         if manifest_path and Path(manifest_path).exists():
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                self.manifest_data = yaml.safe_load(f)
+            with instrumentation.stage("manifest.load"):
+                self.manifest_data = load_manifest(manifest_path)
+            with instrumentation.stage("manifest.index"):
+                self.index = ManifestIndex(self.manifest_data)
     
     def get_screen_info(self, screen_id: str) -> Dict[str, Any]:
         """ดึงข้อมูล screen จาก manifest"""
         if not self.manifest_data:
             return {"error": "No manifest loaded"}
         
-        # หา screen ใน manifest
-        for screen in self.manifest_data.get("screens", []):
-            if screen["id"] == screen_id:
-                return screen
+        screen = self.index.get("screens", screen_id)
+        if screen is not None:
+            return screen
         
         return {"error": f"Screen {screen_id} not found in manifest"}
     
@@ -46,10 +184,9 @@ class AgentVisualWorkflow:
         if not self.manifest_data:
             return {"error": "No manifest loaded"}
         
-        # หา widget ใน manifest
-        for widget in self.manifest_data.get("widgets", []):
-            if widget["id"] == widget_id:
-                return widget
+        widget = self.index.get("widgets", widget_id)
+        if widget is not None:
+            return widget
         
         return {"error": f"Widget {widget_id} not found in manifest"}
     
@@ -166,47 +303,120 @@ Please attach the {widget_id} wireframe image now.
             }
         }
     
-    def generate_layout_structure_template(self, elements_detected: List[str]) -> Dict[str, Any]:
-        """สร้าง template structure จาก elements ที่ Agent detect ได้"""
-        containers = []
+    def resolve_image_path(self, entry: Dict[str, Any]) -> Optional[Path]:
+        """แปลง path ของภาพใน manifest entry (relative กับโฟลเดอร์ manifest) เป็น path จริง"""
+        if not entry.get("path") or not self.manifest_path:
+            return None
+        return Path(self.manifest_path).resolve().parent / entry["path"]
+    
+    def iter_images(self, sections: tuple = ManifestIndex.SECTIONS):
+        """คืน (id, path ของภาพ) ของทุก entry ที่มี path ใน manifest"""
+        for section in sections:
+            for entry_id, entry in self.index.by_id[section].items():
+                image_path = self.resolve_image_path(entry)
+                if image_path is not None:
+                    yield entry_id, image_path
+    
+    def detect_changes(self, previous: Optional[Dict[str, Any]] = None, jobs: int = 1) -> tuple:
+        """เทียบภาพ wireframe กับ fingerprints ของ revision ก่อน คืน (report, fingerprints ใหม่)
         
-        # Group elements into logical containers
-        current_container = {
-            "type": "column",
-            "elements": [],
-            "spacing": 16.0,
-            "alignment": "stretch"
-        }
+        ภาพที่ไฟล์เหมือนเดิม (sha256 เท่าเดิม) จะไม่ถูก decode เลย ส่วนภาพที่ re-export
+        ใหม่จะเทียบด้วย perceptual hash และ region diff เพื่อบอกเฉพาะส่วนที่เปลี่ยนจริง
+        ภาพที่ decode ไม่ได้จะอยู่ใน report["errors"] (เก็บ fingerprint เดิมไว้ให้ตรวจใหม่รอบหน้า)
+        """
+        import numpy as np
+        from wireframe_preprocess import (
+            ImageHashIndex, DEFAULT_CACHE_DIR as IMAGE_CACHE_DIR, DEFAULT_MAX_WIDTH,
+            cache_file_for, cells_to_regions, compare_fingerprints, compute_fingerprint,
+            image_size, preprocess_images,
+        )
         
-        for element in elements_detected:
-            element_config = {
-                "type": element,
-                "id": f"{element}_{len(current_container['elements'])}",
-                "properties": {}
-            }
+        previous_entries = (previous or {}).get("entries", {})
+        report: Dict[str, List[Any]] = {"changed": [], "unchanged": [], "new": [], "missing": [], "removed": [],
+                                        "errors": []}
+        entries: Dict[str, Dict[str, Any]] = {}
+        
+        hash_index = ImageHashIndex(IMAGE_CACHE_DIR)
+        to_decode = []
+        for entry_id, image_path in self.iter_images():
+            if not image_path.exists():
+                report["missing"].append(entry_id)
+                continue
+            digest = hash_index.digest(image_path)
+            old = previous_entries.get(entry_id)
+            if old and old.get("sha256") == digest:
+                entries[entry_id] = old
+                report["unchanged"].append(entry_id)
+            else:
+                to_decode.append((entry_id, image_path, digest))
+        hash_index.save()
+        
+        records = preprocess_images([(entry_id, path) for entry_id, path, _ in to_decode], jobs=jobs)
+        
+        for (entry_id, image_path, digest), record in zip(to_decode, records):
+            old = previous_entries.get(entry_id)
+            try:
+                if "error" in record:
+                    raise ValueError(record["error"])
+                image = np.load(cache_file_for(digest, DEFAULT_MAX_WIDTH, IMAGE_CACHE_DIR), mmap_mode="r")
+                fingerprint = compute_fingerprint(image)
+                width, height = image_size(str(image_path))
+            except (OSError, ValueError) as e:
+                report["errors"].append({"id": entry_id, "path": str(image_path), "error": str(e)})
+                if old:
+                    entries[entry_id] = old
+                continue
+            entries[entry_id] = {"sha256": digest, "size": [width, height], "fingerprint": fingerprint}
             
-            # Add element-specific properties
-            if element == "profile_image":
-                element_config["properties"] = {
-                    "shape": "circle",
-                    "size": 80,
-                    "placeholder": "person"
-                }
-            elif element == "textfield":
-                element_config["properties"] = {
-                    "label": "Field Label*",
-                    "required": True,
-                    "validation": "required"
-                }
-            elif element == "button":
-                element_config["properties"] = {
-                    "text": "Button Text",
-                    "style": "primary"
-                }
+            if not old:
+                report["new"].append(entry_id)
+                continue
             
-            current_container["elements"].append(element_config)
+            diff = compare_fingerprints(old["fingerprint"], fingerprint)
+            if not diff["changed_cells"]:
+                # re-export ที่หน้าตาเหมือนเดิม
+                report["unchanged"].append(entry_id)
+                continue
+            report["changed"].append({
+                "id": entry_id,
+                "path": str(image_path),
+                "hash_distance": diff["hash_distance"],
+                "regions": cells_to_regions(diff["changed_cells"], fingerprint["grid_size"], width, height),
+            })
+        
+        report["removed"] = sorted(set(previous_entries) - set(entries) - set(report["missing"]))
+        report["needs_regeneration"] = [c["id"] for c in report["changed"]] + report["new"]
+        return report, {"version": FINGERPRINTS_VERSION, "entries": entries}
+    
+    def detect_screen_elements(self, screen_id: str, ocr: bool = False) -> List[Dict[str, Any]]:
+        """ตรวจจับ elements จากภาพ wireframe ของ screen (ต้องมี OpenCV) เรียงตามลำดับการอ่าน
+        
+        ocr=True จะอ่านข้อความของ labels/ปุ่มด้วย wireframe_ocr (ต้องมี pytesseract + tesseract)
+        """
+        screen_info = self.get_screen_info(screen_id)
+        if "error" in screen_info:
+            raise ValueError(screen_info["error"])
         
-        containers.append(current_container)
+        image_path = self.resolve_image_path(screen_info)
+        if image_path is None or not image_path.exists():
+            raise ValueError(f"Wireframe image for {screen_id} not found: {image_path}")
+        
+        from wireframe_detect import detect_elements
+        elements = detect_elements(str(image_path))
+        if ocr:
+            with instrumentation.stage("ocr.labels"):
+                elements = _get_ocr_reader().label_elements(str(image_path), elements)
+        return elements
+    
+    def generate_layout_structure_template(self, elements_detected: List[Any]) -> Dict[str, Any]:
+        """สร้าง template structure จาก elements ที่ Agent detect ได้
+        
+        elements_detected เป็นชื่อ type (str) หรือ dict จาก wireframe_detect ที่มี type/bbox ก็ได้
+        """
+        from layout_helper import BUILDER_CACHE
+        
+        # elements ชุดเดียวกันซ้ำกันหลาย screen ใน batch/pipeline - ใช้ผลจาก BUILDER_CACHE
+        containers = [BUILDER_CACHE.as_dict("create_detected_column", list(elements_detected))]
         
         return {
             "layout_structure": containers,
@@ -218,21 +428,515 @@ Please attach the {widget_id} wireframe image now.
             ]
         }
 
+BATCH_ACTIONS = {
+    # action: (manifest section, output extension)
+    "request-image": ("screens", "md"),
+    "request-widget": ("widgets", "md"),
+    "prepare-layout": ("screens", "json"),
+}
+
+# cache ของ workflow ต่อ process เพื่อให้แต่ละ worker โหลด manifest ครั้งเดียว
+_WORKFLOW_CACHE: Dict[Optional[str], AgentVisualWorkflow] = {}
+
+def _get_cached_workflow(manifest_path: Optional[str]) -> AgentVisualWorkflow:
+    workflow = _WORKFLOW_CACHE.get(manifest_path)
+    if workflow is None:
+        workflow = AgentVisualWorkflow(manifest_path)
+        _WORKFLOW_CACHE[manifest_path] = workflow
+    return workflow
+
+# OCR reader ต่อ process (โหลด label dictionary ครั้งเดียว)
+_OCR_READER = None
+
+# ค่า ocr ของ batch task: worker detect อย่างเดียว แล้ว OCR ทุก screen รวมกันใน process หลัก
+OCR_DEFERRED = "deferred"
+# จำนวน screens ที่รวม regions เป็น run_ocr ครั้งเดียว
+OCR_WINDOW = 32
+
+def _get_ocr_reader(jobs: Optional[int] = None):
+    """WireframeOCR ของ process นี้ (สร้างครั้งแรกที่เรียก) - jobs = จำนวน OCR worker processes"""
+    global _OCR_READER
+    if _OCR_READER is None:
+        from wireframe_ocr import WireframeOCR
+        _OCR_READER = WireframeOCR()
+    if jobs is not None:
+        _OCR_READER.jobs = jobs
+    return _OCR_READER
+
+def label_batch_records(records: Iterable[Dict[str, Any]], jobs: int = 1,
+                        window: int = OCR_WINDOW) -> Iterator[Dict[str, Any]]:
+    """OCR records จาก tasks ที่ใช้ OCR_DEFERRED แล้วสร้าง layout template ใหม่จาก elements ที่มีข้อความ
+    
+    regions ของทุก screen ใน window เข้า run_ocr ครั้งเดียว (batch ผ่าน process pool ขนาด jobs
+    และ region ซ้ำข้าม screen OCR ครั้งเดียว) - คืน records ตามลำดับเดิม
+    """
+    buffer: List[Dict[str, Any]] = []
+    
+    def flush() -> Iterator[Dict[str, Any]]:
+        pending = [record for record in buffer if "_detected" in record]
+        screens = [(record["_detected"]["image"], record["_detected"]["elements"]) for record in pending]
+        try:
+            with instrumentation.stage("ocr.labels"):
+                labelled = _get_ocr_reader(jobs).label_screens(screens) if screens else []
+        except (OSError, ValueError) as e:
+            for record in pending:
+                record.pop("output", None)
+                record["error"] = str(e)
+            labelled = []
+        for record, elements in zip(pending, labelled):
+            if not elements:
+                continue
+            workflow = _get_cached_workflow(record["manifest"])
+            with instrumentation.stage("layout.template"):
+                record["output"]["layout_template"] = workflow.generate_layout_structure_template(elements)
+        for record in buffer:
+            record.pop("_detected", None)
+            yield record
+        buffer.clear()
+    
+    for record in records:
+        buffer.append(record)
+        if len(buffer) >= window:
+            yield from flush()
+    yield from flush()
+
+def run_action(workflow: AgentVisualWorkflow, action: str, target_id: str,
+               elements: Optional[List[Any]] = None, detect: bool = False, ocr: bool = False) -> Any:
+    """รัน action เดียว (request-image, request-widget, prepare-layout) สำหรับ id ที่กำหนด
+    
+    detect=True จะตรวจจับ elements จากภาพ wireframe แทน elements ที่พิมพ์มาเอง
+    ocr=True (ใช้กับ detect) เติม labels/ข้อความปุ่มจาก OCR แทน placeholder
+    """
+    with instrumentation.stage(f"action.{action}"):
+        return _run_action(workflow, action, target_id, elements, detect, ocr)
+
+def _run_action(workflow: AgentVisualWorkflow, action: str, target_id: str,
+                elements: Optional[List[Any]], detect: bool, ocr: bool) -> Any:
+    if action == "request-image":
+        return workflow.generate_image_request_prompt(target_id)
+    if action == "request-widget":
+        return workflow.generate_widget_request_prompt(target_id)
+    if action == "prepare-layout":
+        guide = workflow.prepare_layout_analysis_guide(target_id)
+        if detect:
+            with instrumentation.stage("detect.elements"):
+                elements = workflow.detect_screen_elements(target_id, ocr)
+        if elements:
+            with instrumentation.stage("layout.template"):
+                guide["layout_template"] = workflow.generate_layout_structure_template(elements)
+            instrumentation.count("layout.elements", len(elements))
+        return guide
+    raise ValueError(f"Unknown action: {action}")
+
+def _run_batch_task(task: tuple) -> Dict[str, Any]:
+    """Worker สำหรับ process pool - ต้องอยู่ระดับ module เพื่อให้ pickle ได้"""
+    manifest_path, action, target_id, elements, detect, ocr = task
+    workflow = _get_cached_workflow(manifest_path)
+    record = {"manifest": manifest_path, "id": target_id, "action": action}
+    try:
+        if ocr == OCR_DEFERRED and detect and action == "prepare-layout":
+            # label_batch_records จะ OCR และสร้าง template ใหม่ใน process หลัก
+            with instrumentation.stage("detect.elements"):
+                elements = workflow.detect_screen_elements(target_id)
+            image_path = workflow.resolve_image_path(workflow.get_screen_info(target_id))
+            record["_detected"] = {"image": str(image_path), "elements": elements}
+            detect = ocr = False
+        record["output"] = run_action(workflow, action, target_id, elements, detect, ocr)
+    except ValueError as e:
+        # ภาพหายหรือ decode ไม่ได้ไม่ควรทำให้ batch ทั้งชุดล้ม
+        record["error"] = str(e)
+    return record
+
+def _init_batch_worker(cache_enabled: bool, cache_dir: str, instrumented: bool) -> None:
+    configure_manifest_cache(cache_enabled, cache_dir)
+    instrumentation.enable(instrumented)
+
+def _run_instrumented_batch_task(task: tuple) -> Dict[str, Any]:
+    """Worker ที่ส่ง timers/counters ของ task กลับมาให้ process หลัก merge"""
+    instrumentation.reset()
+    record = _run_batch_task(task)
+    record["_instrumentation"] = instrumentation.snapshot()
+    return record
+
+def collect_batch_tasks(manifest_patterns: List[str], action: str, ids: Optional[List[str]] = None,
+                        elements: Optional[List[str]] = None, detect: bool = False, ocr: bool = False) -> List[tuple]:
+    """สร้างรายการ tasks แบบ deterministic (เรียงตาม manifest path แล้วตามลำดับใน manifest)"""
+    import glob
+    
+    section = BATCH_ACTIONS[action][0]
+    manifest_paths = sorted({
+        Path(path).as_posix()
+        for pattern in manifest_patterns
+        for path in glob.glob(pattern, recursive=True)
+    })
+    
+    if not manifest_paths:
+        return [(None, action, target_id, elements, detect, ocr) for target_id in ids or []]
+    
+    tasks = []
+    found = set()
+    for manifest_path in manifest_paths:
+        index = AgentVisualWorkflow(manifest_path).index
+        entry_ids = list(index.by_id[section])
+        if ids:
+            entry_ids = [target_id for target_id in ids if target_id in index.by_id[section]]
+        found.update(entry_ids)
+        tasks.extend((manifest_path, action, target_id, elements, detect, ocr) for target_id in entry_ids)
+    
+    missing = [target_id for target_id in ids or [] if target_id not in found]
+    if missing:
+        print(f"Not found in any manifest: {', '.join(missing)}", file=sys.stderr)
+    
+    return tasks
+
+def run_batch(tasks: List[tuple], jobs: int = 1):
+    """รัน tasks ผ่าน process pool โดยคืนผลลัพธ์ตามลำดับเดิมของ tasks"""
+    if jobs <= 1 or len(tasks) <= 1:
+        yield from map(_run_batch_task, tasks)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    instrumented = instrumentation.ENABLED
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                             initargs=(MANIFEST_CACHE["enabled"], str(MANIFEST_CACHE["dir"]), instrumented)) as executor:
+        if not instrumented:
+            yield from executor.map(_run_batch_task, tasks, chunksize=chunksize)
+            return
+        for record in executor.map(_run_instrumented_batch_task, tasks, chunksize=chunksize):
+            instrumentation.merge(record.pop("_instrumentation"))
+            yield record
+
+def _format_output(output: Any) -> str:
+    if isinstance(output, str):
+        return output
+    return json.dumps(output, indent=2, ensure_ascii=False)
+
+def layout_from_record(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """แปลงผล prepare-layout ของ batch เป็น layout หนึ่ง screen ที่ layout_helper.py อ่านได้"""
+    output = record.get("output")
+    template = output.get("layout_template") if isinstance(output, dict) else None
+    if not template:
+        return None
+    return {"screen_id": record["id"], "layout_structure": template["layout_structure"]}
+
+def batch_main(args) -> None:
+    """Entry point ของ subcommand batch"""
+    from jsonl_io import STDIO_PATH, open_text, write_jsonl_record
+    
+    if args.emit_layouts and args.action != "prepare-layout":
+        raise ValueError("--emit-layouts requires --action prepare-layout")
+    if args.ocr and not args.detect_elements:
+        raise ValueError("--ocr requires --detect-elements")
+    
+    ids = [i.strip() for i in args.ids.split(",") if i.strip()] if args.ids else None
+    elements = [e.strip() for e in args.elements_detected.split(",")] if args.elements_detected else None
+    with instrumentation.stage("batch.collect"):
+        tasks = collect_batch_tasks(args.manifests or [], args.action, ids, elements,
+                                    args.detect_elements, OCR_DEFERRED if args.ocr else False)
+    instrumentation.count("batch.tasks", len(tasks))
+    
+    if not tasks:
+        print("No ids to process", file=sys.stderr)
+        return
+    
+    extension = BATCH_ACTIONS[args.action][1]
+    nested = len({task[0] for task in tasks}) > 1
+    # ไม่ระบุปลายทาง = stream JSONL ออก stdout
+    jsonl_path = args.jsonl or (None if args.output_dir else STDIO_PATH)
+    
+    records = run_batch(tasks, args.jobs)
+    if args.ocr:
+        records = label_batch_records(records, args.jobs)
+    
+    failed: List[str] = []
+    with open_text(jsonl_path or os.devnull, 'w') as jsonl_file:
+        for record in records:
+            if "error" in record:
+                print(f"{record['id']}: {record['error']}", file=sys.stderr)
+                instrumentation.count("batch.errors")
+                failed.append(record["id"])
+            elif args.output_dir:
+                out_dir = Path(args.output_dir)
+                if nested:
+                    out_dir = out_dir / Path(record["manifest"]).parent.name
+                out_dir.mkdir(parents=True, exist_ok=True)
+                text = _format_output(record["output"])
+                (out_dir / f"{record['id']}.{extension}").write_text(text, encoding='utf-8')
+                if instrumentation.ENABLED:
+                    instrumentation.count("output.bytes_written", len(text.encode('utf-8')))
+            
+            line = record
+            if args.emit_layouts:
+                line = layout_from_record(record)
+                if line is None and "error" not in record:
+                    print(f"{record['id']}: no layout template (pass --elements-detected or --detect-elements)",
+                          file=sys.stderr)
+            if line is not None and jsonl_path:
+                write_jsonl_record(line, jsonl_file)
+                instrumentation.count("output.records")
+    
+    destinations = [d for d in (args.jsonl, args.output_dir) if d and d != STDIO_PATH]
+    if destinations:
+        print(f"Processed {len(tasks) - len(failed)} ids, {len(failed)} failed -> {', '.join(destinations)}",
+              file=sys.stderr if jsonl_path == STDIO_PATH else sys.stdout)
+    if failed:
+        # exit code ไม่เป็น 0 ให้ script และ pipe ที่ต่อจาก batch รู้ว่ามีบาง id ไม่สำเร็จ
+        sys.exit(f"{len(failed)} of {len(tasks)} ids failed: {', '.join(failed)}")
+
+PIPELINE_QUEUE_SIZE = 32
+_PIPELINE_DONE = object()
+
+def iter_pipelined(source: Iterable[Any], maxsize: int = PIPELINE_QUEUE_SIZE) -> Iterator[Any]:
+    """ดึง source ใน producer thread แล้ว yield ผ่าน bounded queue
+    
+    ขั้นตอนก่อนหน้า (source) ทำงานต่อไปได้ระหว่างที่ผู้เรียกประมวลผล item ก่อนหน้าอยู่
+    แต่ไม่เกิน maxsize items - ถ้าผู้เรียกหยุดกลางทาง producer จะหยุดตาม
+    """
+    import queue
+    import threading
+    
+    items: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+    failure: List[BaseException] = []
+    
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except BaseException as e:
+            failure.append(e)
+        finally:
+            put(_PIPELINE_DONE)
+    
+    producer = threading.Thread(target=produce, name="pipeline-producer", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _PIPELINE_DONE:
+                break
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+    if failure:
+        raise failure[0]
+
+def pipeline_main(args) -> None:
+    """Entry point ของ subcommand pipeline: manifest → guide/template → Flutter code ในงานเดียว
+    
+    guide และ template ของแต่ละ screen ถูกสร้างใน workers (run_batch) ขณะที่ thread หลัก
+    generate code ของ screen ที่เสร็จแล้ว - ส่งต่อกันผ่าน queue ขนาด --queue-size
+    """
+    from layout_helper import LAZY_LIST_THRESHOLD, MODE_EMITTERS, IncrementalBuilder, LayoutHelper, load_emitter_plugins
+    
+    if args.lazy_threshold is None:
+        args.lazy_threshold = LAZY_LIST_THRESHOLD
+    if not args.detect_elements and not args.elements_detected:
+        raise ValueError("pipeline needs --detect-elements or --elements-detected to build layouts")
+    if args.ocr and not args.detect_elements:
+        raise ValueError("--ocr requires --detect-elements")
+    load_emitter_plugins(args.plugin)
+    if args.mode not in MODE_EMITTERS:
+        raise ValueError(f"unknown codegen mode {args.mode!r} (choose from {', '.join(sorted(MODE_EMITTERS))})")
+    
+    validate_layout = None
+    if not args.no_validate:
+        from layout_schema import validate_layout
+    
+    ids = [i.strip() for i in args.ids.split(",") if i.strip()] if args.ids else None
+    elements = [e.strip() for e in args.elements_detected.split(",")] if args.elements_detected else None
+    with instrumentation.stage("batch.collect"):
+        tasks = collect_batch_tasks(args.manifests, "prepare-layout", ids, elements,
+                                    args.detect_elements, OCR_DEFERRED if args.ocr else False)
+    instrumentation.count("batch.tasks", len(tasks))
+    
+    if not tasks:
+        print("No ids to process", file=sys.stderr)
+        return
+    
+    failed: List[str] = []
+    
+    def iter_layouts():
+        records = run_batch(tasks, args.jobs)
+        if args.ocr:
+            records = label_batch_records(records, args.jobs)
+        for record in iter_pipelined(records, args.queue_size):
+            if "error" in record:
+                problems = [record["error"]]
+            else:
+                layout = layout_from_record(record)
+                if layout is None:
+                    problems = ["no layout template"]
+                else:
+                    problems = [f"{e['path']}: {e['message']}" for e in validate_layout(layout)] if validate_layout else []
+            if problems:
+                for problem in problems:
+                    print(f"{record['id']}: {problem}", file=sys.stderr)
+                failed.append(record["id"])
+                continue
+            instrumentation.count("pipeline.screens")
+            yield record["id"], layout
+    
+    if args.output_dir:
+        builder = IncrementalBuilder(args.output_dir, None, args.mode, args.lazy_threshold)
+        summary = builder.build(iter_layouts(), force=not args.incremental)
+        # --ids หรือ screen ที่ fail = ไม่เห็นทุก screen จึงไม่ลบ output เก่า
+        removed = [] if args.no_prune or ids or failed else builder.prune()
+        print(f"Built {len(summary['built'])} screen(s), skipped {len(summary['skipped'])} unchanged, "
+              f"removed {len(removed)}, {len(failed)} failed -> {args.output_dir}")
+    else:
+        from jsonl_io import write_jsonl_record
+        
+        # ไม่ระบุ --output-dir = stream {"screen_id", "code"} ทีละบรรทัดออก stdout
+        for screen_id, layout in iter_layouts():
+            code = LayoutHelper.generate_flutter_widgets(layout, args.mode, args.lazy_threshold)
+            write_jsonl_record({"screen_id": screen_id, "code": code}, sys.stdout)
+        if failed:
+            print(f"{len(failed)} screen(s) failed: {', '.join(failed)}", file=sys.stderr)
+
+def default_fingerprints_path(manifest_path: str) -> Path:
+    digest = hashlib.sha1(str(Path(manifest_path).resolve()).encode('utf-8')).hexdigest()
+    return DEFAULT_CACHE_DIR.parent / "fingerprints" / f"{digest}.json"
+
+def detect_changes_main(workflow: AgentVisualWorkflow, args) -> None:
+    """--detect-changes: list screens/widgets ที่ต้อง regenerate เทียบกับ revision ก่อน"""
+    fingerprints_path = Path(args.fingerprints) if args.fingerprints else default_fingerprints_path(args.manifest)
+    try:
+        previous = json.loads(fingerprints_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        previous = None
+    if previous and previous.get("version") != FINGERPRINTS_VERSION:
+        previous = None
+    
+    report, fingerprints = workflow.detect_changes(previous, args.jobs)
+    
+    if not args.keep_fingerprints:
+        fingerprints_path.parent.mkdir(parents=True, exist_ok=True)
+        fingerprints_path.write_text(json.dumps(fingerprints), encoding='utf-8')
+    
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Change report saved to {args.output}")
+    else:
+        print(output)
+
+def _add_cache_arguments(parser: argparse.ArgumentParser, suppress_defaults: bool = False) -> None:
+    defaults = {"default": argparse.SUPPRESS} if suppress_defaults else {}
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse manifest YAML", **defaults)
+    parser.add_argument("--cache-dir", help="Directory for parsed-manifest cache", **defaults)
+    parser.add_argument("--cache-stats", action="store_true", help="Report manifest cache hits/misses to stderr", **defaults)
+
 def main():
     parser = argparse.ArgumentParser(description="Agent Visual Workflow Tool")
     parser.add_argument("--request-image", help="Generate image request prompt for screen/widget ID")
     parser.add_argument("--request-widget", help="Generate widget image request prompt")
     parser.add_argument("--prepare-layout", help="Prepare layout analysis guide for screen ID")
     parser.add_argument("--elements-detected", help="Comma-separated list of detected elements")
+    parser.add_argument("--detect-elements", action="store_true",
+                        help="Detect elements from the screen's wireframe image (needs OpenCV)")
+    parser.add_argument("--ocr", action="store_true",
+                        help="With --detect-elements, fill labels and button text via OCR (needs tesseract)")
+    parser.add_argument("--detect-changes", action="store_true",
+                        help="List screens/widgets whose wireframe changed since the last run")
+    parser.add_argument("--fingerprints", help="Fingerprint file of the previous revision (--detect-changes)")
+    parser.add_argument("--keep-fingerprints", action="store_true",
+                        help="Do not overwrite the fingerprint file with this revision")
+    parser.add_argument("--coverage", action="store_true",
+                        help="Report which manifest screens/widgets already have Dart files in alumni_app")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
     parser.add_argument("--manifest", help="Path to wireframes manifest file")
     parser.add_argument("--output", help="Output file path")
+    _add_cache_arguments(parser)
+    instrumentation.add_arguments(parser)
+    
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser("batch", help="Process many ids/manifests in one run")
+    batch_parser.add_argument("--manifests", nargs="+", help="Manifest paths or glob patterns")
+    batch_parser.add_argument("--ids", help="Comma-separated screen/widget ids (default: all in manifests)")
+    batch_parser.add_argument("--action", choices=sorted(BATCH_ACTIONS), default="prepare-layout",
+                              help="Action to run for each id")
+    batch_parser.add_argument("--elements-detected", help="Comma-separated list of detected elements (prepare-layout)")
+    batch_parser.add_argument("--detect-elements", action="store_true",
+                              help="Detect elements from each screen's wireframe image (prepare-layout)")
+    batch_parser.add_argument("--ocr", action="store_true", default=argparse.SUPPRESS,
+                              help="With --detect-elements, fill labels and button text via OCR (cached per region)")
+    batch_parser.add_argument("--output-dir", help="Write one output file per id into this directory")
+    batch_parser.add_argument("--jsonl", help="Write all results into one JSONL file (- for stdout)")
+    batch_parser.add_argument("--emit-layouts", action="store_true",
+                              help="With prepare-layout, write one layout per line for layout_helper.py --layout-jsonl")
+    batch_parser.add_argument("--jobs", type=int, default=argparse.SUPPRESS, help="Number of worker processes")
+    _add_cache_arguments(batch_parser, suppress_defaults=True)
+    instrumentation.add_arguments(batch_parser, suppress_defaults=True)
+    
+    pipeline_parser = subparsers.add_parser(
+        "pipeline", help="Build Flutter code for every manifest screen in one job (guide -> template -> codegen)")
+    pipeline_parser.add_argument("--manifests", nargs="+", required=True, help="Manifest paths or glob patterns")
+    pipeline_parser.add_argument("--ids", help="Comma-separated screen ids (default: all screens in manifests)")
+    pipeline_parser.add_argument("--elements-detected", help="Comma-separated element types used for every screen")
+    pipeline_parser.add_argument("--detect-elements", action="store_true",
+                                 help="Detect elements from each screen's wireframe image")
+    pipeline_parser.add_argument("--ocr", action="store_true", default=argparse.SUPPRESS,
+                                 help="With --detect-elements, fill labels and button text via OCR")
+    pipeline_parser.add_argument("--output-dir", help="Write <screen_id>.dart files here (default: JSONL to stdout)")
+    pipeline_parser.add_argument("--incremental", action="store_true",
+                                 help="Only rewrite screens whose layout changed since the last build")
+    pipeline_parser.add_argument("--no-prune", action="store_true",
+                                 help="Keep outputs of screens that are no longer in the manifests")
+    # ตรวจกับ MODE_EMITTERS ใน pipeline_main หลังโหลด --plugin แล้ว (plugin เพิ่ม mode ได้)
+    pipeline_parser.add_argument("--mode", default="default",
+                                 help="Codegen mode: default, performance or a mode added by --plugin")
+    # default ตั้งใน pipeline_main จาก layout_helper.LAZY_LIST_THRESHOLD (ไม่ import layout_helper ตอน startup)
+    pipeline_parser.add_argument("--lazy-threshold", type=int,
+                                 help="Use ListView.builder above this many elements (--mode performance, "
+                                      "default: layout_helper.LAZY_LIST_THRESHOLD)")
+    pipeline_parser.add_argument("--plugin", action="append", default=[],
+                                 help="Emitter plugin module or .py file (repeatable)")
+    pipeline_parser.add_argument("--no-validate", action="store_true", help="Skip layout schema validation")
+    pipeline_parser.add_argument("--queue-size", type=int, default=PIPELINE_QUEUE_SIZE,
+                                 help="Screens buffered between template and codegen stages")
+    pipeline_parser.add_argument("--jobs", type=int, default=argparse.SUPPRESS, help="Number of worker processes")
+    _add_cache_arguments(pipeline_parser, suppress_defaults=True)
+    instrumentation.add_arguments(pipeline_parser, suppress_defaults=True)
     
     args = parser.parse_args()
+    configure_manifest_cache(not args.no_cache, args.cache_dir)
     
+    try:
+        with instrumentation.session(args.profile, args.timings):
+            if args.command == "batch":
+                batch_main(args)
+            elif args.command == "pipeline":
+                pipeline_main(args)
+            else:
+                run_cli(parser, args)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if args.cache_stats:
+            print(f"Manifest cache: {MANIFEST_CACHE_STATS['hits']} hits, "
+                  f"{MANIFEST_CACHE_STATS['misses']} misses", file=sys.stderr)
+
+def run_cli(parser: argparse.ArgumentParser, args) -> None:
+    """โหมดเดิม: ประมวลผล id เดียวต่อการเรียก"""
     workflow = AgentVisualWorkflow(args.manifest)
     
     if args.request_image:
-        prompt = workflow.generate_image_request_prompt(args.request_image)
+        prompt = run_action(workflow, "request-image", args.request_image)
         
         if args.output:
             Path(args.output).write_text(prompt, encoding='utf-8')
@@ -241,7 +945,7 @@ def main():
             print(prompt)
     
     elif args.request_widget:
-        prompt = workflow.generate_widget_request_prompt(args.request_widget)
+        prompt = run_action(workflow, "request-widget", args.request_widget)
         
         if args.output:
             Path(args.output).write_text(prompt, encoding='utf-8')
@@ -249,13 +953,36 @@ def main():
         else:
             print(prompt)
     
-    elif args.prepare_layout:
-        guide = workflow.prepare_layout_analysis_guide(args.prepare_layout)
+    elif args.detect_changes:
+        if not workflow.manifest_data:
+            parser.error("--detect-changes requires --manifest")
+        detect_changes_main(workflow, args)
+    
+    elif args.coverage:
+        if not workflow.manifest_data:
+            parser.error("--coverage requires --manifest")
+        from coverage_index import CoverageIndex
         
-        if args.elements_detected:
-            elements = [e.strip() for e in args.elements_detected.split(",")]
-            layout_template = workflow.generate_layout_structure_template(elements)
-            guide["layout_template"] = layout_template
+        index = CoverageIndex()
+        index.update()
+        entries = ((section, entry) for section in ManifestIndex.SECTIONS
+                   for entry in workflow.index.by_id[section].values())
+        output = json.dumps(index.coverage(entries), indent=2, ensure_ascii=False)
+        
+        if args.output:
+            Path(args.output).write_text(output, encoding='utf-8')
+            print(f"Coverage report saved to {args.output}")
+        else:
+            print(output)
+    
+    elif args.prepare_layout:
+        elements = [e.strip() for e in args.elements_detected.split(",")] if args.elements_detected else None
+        if args.ocr and not args.detect_elements:
+            parser.error("--ocr requires --detect-elements")
+        if args.ocr:
+            # regions ของ screen นี้แบ่ง OCR ตาม --jobs
+            _get_ocr_reader(args.jobs)
+        guide = run_action(workflow, "prepare-layout", args.prepare_layout, elements, args.detect_elements, args.ocr)
         
         output = json.dumps(guide, indent=2, ensure_ascii=False)
         
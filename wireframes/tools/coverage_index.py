@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Coverage Index - จับคู่ screen/widget ids ใน manifest (SC-XX, WG-XX) กับ Dart files ของ alumni_app
+
+ค่าเริ่มต้นเดินเฉพาะ alumni_app/lib/presentation (screens/widgets) - data/ และ domain/ อ้าง id ได้
+(เช่น model หรือ route constants) แต่ไม่ใช่ implementation ของ screen
+
+เดิน Flutter tree ครั้งเดียวแล้วเก็บ index ของแต่ละไฟล์ (ids ที่อ้างถึง + widget classes) ลง disk
+ครั้งต่อไปอ่านใหม่เฉพาะไฟล์ที่ mtime/size เปลี่ยน แล้วสร้าง inverted index ใน memory:
+- id → files: ไฟล์ที่ชื่อหรือเนื้อหาอ้าง id ตรง ๆ (เช่น sc_09_page.dart, // SC-09, generated SC-09.dart)
+- ชื่อ class → files: ใช้จับคู่กับชื่อ entry ใน manifest เมื่อไม่มีไฟล์อ้าง id (เช่น "Profile Card" → ProfileCard)
+
+Usage:
+    python coverage_index.py --manifest "../UC-01.1/wireframes-manifest.yml"
+    python coverage_index.py --manifest "../*/wireframes-manifest.yml" --missing-only
+    python coverage_index.py --manifest m.yml --root ../../alumni_app/lib --output coverage.json
+    python coverage_index.py --lookup SC-09
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_ROOT = Path(__file__).resolve().parents[2] / "alumni_app" / "lib" / "presentation"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "coverage"
+INDEX_VERSION = 1
+
+# id ในเนื้อหาไฟล์ต้องเป็นตัวใหญ่ (SC-09, WG_13) ส่วนชื่อไฟล์ไม่สนตัวพิมพ์ (sc09_page.dart)
+_CONTENT_ID_RE = re.compile(r"\b(SC|WG)[-_](\d+)\b")
+_FILENAME_ID_RE = re.compile(r"(?<![a-z])(sc|wg)[-_]?(\d+)(?![0-9])", re.IGNORECASE)
+_CLASS_RE = re.compile(r"\bclass\s+(\w+)(?:<[^>{]*>)?\s+extends\s+(\w+)")
+WIDGET_BASES = frozenset({
+    "StatelessWidget", "StatefulWidget", "GetView", "GetWidget", "GetResponsiveView",
+    "ConsumerWidget", "ConsumerStatefulWidget", "HookWidget",
+})
+# suffix ของชื่อ class ที่ตัดออกก่อนเทียบกับชื่อ entry ใน manifest
+CLASS_NAME_SUFFIXES = ("Page", "Screen", "View", "Widget")
+
+def normalize_id(prefix: str, number: str) -> str:
+    """sc9 / SC_09 / SC-09 → SC-09"""
+    return f"{prefix.upper()}-{int(number):02d}"
+
+def canonical_id(entry_id: str) -> str:
+    match = _FILENAME_ID_RE.fullmatch(entry_id.strip())
+    return normalize_id(*match.groups()) if match else entry_id
+
+def name_key(name: str) -> str:
+    """key สำหรับเทียบชื่อ: ตัวอักษร/ตัวเลขตัวเล็กติดกัน ("Profile Card" / ProfileCard → profilecard)"""
+    return re.sub(r"[^0-9a-z]", "", name.lower())
+
+def class_name_key(class_name: str) -> str:
+    for suffix in CLASS_NAME_SUFFIXES:
+        if class_name.endswith(suffix) and len(class_name) > len(suffix):
+            class_name = class_name[:-len(suffix)]
+            break
+    return name_key(class_name)
+
+def scan_dart_file(path: Path, rel_path: str) -> Dict[str, Any]:
+    """อ่าน Dart file หนึ่งไฟล์ คืน ids ที่อ้างถึงและ widget classes"""
+    text = path.read_text(encoding='utf-8', errors='replace')
+    ids = {normalize_id(prefix, number) for prefix, number in _CONTENT_ID_RE.findall(text)}
+    ids.update(normalize_id(prefix, number) for prefix, number in _FILENAME_ID_RE.findall(Path(rel_path).stem))
+    classes = [name for name, base in _CLASS_RE.findall(text) if base in WIDGET_BASES]
+    return {"ids": sorted(ids), "classes": classes}
+
+def iter_dart_files(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """เดิน tree ด้วย os.scandir คืน (relative path แบบ posix, stat) ของทุก .dart"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."):
+                    stack.append(Path(entry.path))
+            elif entry.name.endswith(".dart"):
+                yield Path(entry.path).relative_to(root).as_posix(), entry.stat()
+
+class CoverageIndex:
+    """Index ของ Dart files ใต้ root - เก็บบน disk และอัปเดตเฉพาะไฟล์ที่เปลี่ยน"""
+    
+    def __init__(self, root: Optional[str] = None, cache_dir: Optional[str] = None):
+        self.root = Path(root).resolve() if root else DEFAULT_ROOT
+        cache_root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.path = cache_root / f"{hashlib.sha1(str(self.root).encode('utf-8')).hexdigest()}.json"
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"files": 0, "parsed": 0, "reused": 0, "removed": 0}
+        self.by_id: Dict[str, List[str]] = {}
+        self.by_class_key: Dict[str, List[Tuple[str, str]]] = {}
+        
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") == INDEX_VERSION and data.get("root") == str(self.root):
+                self.files = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self._build_inverted()
+    
+    def update(self) -> Dict[str, int]:
+        """เดิน tree แล้ว parse ใหม่เฉพาะไฟล์ที่ mtime/size เปลี่ยน (ไฟล์ที่หายไปถูกลบจาก index)"""
+        files = {}
+        parsed = reused = 0
+        for rel_path, stat in iter_dart_files(self.root):
+            previous = self.files.get(rel_path)
+            if previous and previous["mtime_ns"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+                files[rel_path] = previous
+                reused += 1
+                continue
+            try:
+                entry = scan_dart_file(self.root / rel_path, rel_path)
+            except OSError:
+                continue
+            files[rel_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, **entry}
+            parsed += 1
+        
+        removed = len(set(self.files) - set(files))
+        changed = parsed > 0 or removed > 0
+        self.files = files
+        self.stats = {"files": len(files), "parsed": parsed, "reused": reused, "removed": removed}
+        if changed:
+            self._build_inverted()
+            self.save()
+        return self.stats
+    
+    def _build_inverted(self) -> None:
+        by_id: Dict[str, List[str]] = {}
+        by_class_key: Dict[str, List[Tuple[str, str]]] = {}
+        for rel_path in sorted(self.files):
+            entry = self.files[rel_path]
+            for entry_id in entry["ids"]:
+                by_id.setdefault(entry_id, []).append(rel_path)
+            for class_name in entry["classes"]:
+                by_class_key.setdefault(class_name_key(class_name), []).append((rel_path, class_name))
+        self.by_id = by_id
+        self.by_class_key = by_class_key
+    
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"version": INDEX_VERSION, "root": str(self.root), "files": self.files}),
+                            encoding='utf-8')
+        os.replace(tmp_path, self.path)
+    
+    def lookup(self, entry_id: str, name: Optional[str] = None) -> Dict[str, Any]:
+        """หา Dart files/classes ของ id - อ้าง id ตรง ๆ ก่อน ถ้าไม่มีจึงจับคู่ชื่อ entry กับชื่อ class"""
+        files = self.by_id.get(canonical_id(entry_id), [])
+        if files:
+            classes = [c for f in files for c in self.files[f]["classes"]]
+            return {"implemented": True, "match": "id", "files": list(files), "classes": classes}
+        
+        matches = self.by_class_key.get(name_key(name), []) if name else []
+        if matches:
+            return {"implemented": True, "match": "name",
+                    "files": sorted({f for f, _ in matches}), "classes": [c for _, c in matches]}
+        return {"implemented": False, "match": None, "files": [], "classes": []}
+    
+    def coverage(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Coverage ของ (section, entry) ทั้งหมด - ใช้แค่ dict lookups ต่อ entry"""
+        results = []
+        for section, entry in entries:
+            result = {"id": entry["id"], "section": section, "name": entry.get("name")}
+            result.update(self.lookup(entry["id"], entry.get("name")))
+            results.append(result)
+        
+        implemented = sum(1 for r in results if r["implemented"])
+        return {
+            "root": str(self.root),
+            "total": len(results),
+            "implemented": implemented,
+            "missing": [r["id"] for r in results if not r["implemented"]],
+            "coverage_ratio": round(implemented / len(results), 4) if results else 0.0,
+            "entries": results,
+        }
+
+def iter_manifest_entries(manifest_patterns: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(section, entry) ของทุก screen/widget ในทุก manifest ที่ตรงกับ patterns"""
+    from agent_visual_workflow import AgentVisualWorkflow, ManifestIndex
+    
+    paths = sorted({path for pattern in manifest_patterns for path in glob.glob(pattern, recursive=True)})
+    for manifest_path in paths:
+        index = AgentVisualWorkflow(manifest_path).index
+        for section in ManifestIndex.SECTIONS:
+            for entry in index.by_id[section].values():
+                yield section, entry
+
+def main():
+    parser = argparse.ArgumentParser(description="Manifest-to-codebase Coverage Index")
+    parser.add_argument("--manifest", nargs="+", help="Manifest paths or glob patterns to report coverage for")
+    parser.add_argument("--lookup", nargs="+", metavar="ID", help="Show Dart files/classes for these ids")
+    parser.add_argument("--root", help=f"Flutter source root (default: {DEFAULT_ROOT})")
+    parser.add_argument("--cache-dir", help="Directory for the persistent index")
+    parser.add_argument("--no-update", action="store_true", help="Use the saved index without re-scanning the tree")
+    parser.add_argument("--missing-only", action="store_true", help="Only list entries without an implementation")
+    parser.add_argument("--output", help="Output file path")
+    
+    args = parser.parse_args()
+    
+    if not args.manifest and not args.lookup:
+        parser.print_help()
+        return
+    
+    index = CoverageIndex(args.root, args.cache_dir)
+    if not args.no_update:
+        stats = index.update()
+        print(f"Indexed {stats['files']} Dart files ({stats['parsed']} parsed, {stats['reused']} unchanged, "
+              f"{stats['removed']} removed)", file=sys.stderr)
+    
+    if args.manifest:
+        result: Any = index.coverage(iter_manifest_entries(args.manifest))
+        if args.missing_only:
+            result["entries"] = [e for e in result["entries"] if not e["implemented"]]
+    else:
+        result = {entry_id: index.lookup(entry_id) for entry_id in args.lookup}
+    
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Coverage report saved to {args.output}")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
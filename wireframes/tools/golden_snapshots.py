@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Golden Snapshots - ตรวจว่า Flutter code ที่ LayoutHelper generate ยังตรงกับ golden Dart files ทุก byte
+
+รัน corpus ของ layouts (SC-09 จาก --generate-structure, form SC-09 จาก BUILDER_CACHE, layouts ใน
+snapshots/layouts และ layout JSON ที่ให้ผ่าน --corpus) แบบขนานผ่าน generators:
+    widgets, column  generate_flutter_widgets / generate_flutter_column ทุก mode
+    dedupe           generate_shared_widgets (--dedupe)
+    frames           LayoutSolver frames หลาย viewport (และตรวจว่า ViewportEvaluator ได้ค่าเดียวกันถ้ามี NumPy)
+    schema           layout ที่ไม่ผ่าน layout_schema snapshot เฉพาะ validation errors (generator อื่นไม่รัน)
+เทียบ sha256 กับ hash index ใน .cache/golden ก่อน (hash ใหม่เฉพาะ golden ที่ mtime/size เปลี่ยน)
+อ่าน golden file และทำ diff เฉพาะ case ที่ hash ไม่ตรง
+รายงานผ่าน/ไม่ผ่านพร้อมเวลาของแต่ละ case เป็น JSON (case ไม่ผ่าน = exit code 1)
+
+golden ของ built-in SC-09 cases อยู่ใน snapshots/ ใน repo - ถ้าแก้ codegen แล้ว output เปลี่ยนโดยตั้งใจ
+ให้รัน --update แล้ว review diff ของ golden files ใน commit เดียวกัน (hash index เก็บ mtime ของเครื่องนี้
+จึงอยู่ใน .cache ไม่ได้ commit)
+
+Usage:
+    python golden_snapshots.py --update
+    python golden_snapshots.py
+    python golden_snapshots.py --corpus "layouts/*.json" --golden-dir snapshots --jobs 8
+    python golden_snapshots.py --modes default --output golden_report.json
+"""
+
+import os
+import sys
+import json
+import glob
+import math
+import time
+import difflib
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+DEFAULT_GOLDEN_DIR = Path(__file__).resolve().parent / "snapshots"
+DEFAULT_CORPUS_DIR = DEFAULT_GOLDEN_DIR / "layouts"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "golden"
+INDEX_VERSION = 2
+GENERATORS = ("widgets", "column", "dedupe", "frames")
+# generators ที่ output ขึ้นกับ codegen mode - ที่เหลือ snapshot ครั้งเดียวต่อ case
+MODE_GENERATORS = ("widgets", "column")
+JSON_GENERATORS = ("frames", "schema")
+# (viewport width, text scale) ของ frames golden
+FRAME_VIEWPORTS = ((320.0, 1.0), (375.0, 1.0), (414.0, 1.3))
+# จำนวนบรรทัด diff สูงสุดต่อ case ที่ใส่ใน report
+MAX_DIFF_LINES = 200
+
+# (ชื่อ case, layout dict หรือ path ของ layout JSON)
+Case = Tuple[str, Any]
+
+# {golden file: {"sha256", "size", "mtime_ns"}} ของ process นี้ - ตั้งครั้งเดียวใน _init_worker แทนการส่งไปกับทุก task
+_HASHES: Dict[str, Dict[str, Any]] = {}
+
+def builtin_cases() -> List[Case]:
+    from layout_benchmark import sc09_layout
+    from layout_helper import sample_layout_structure
+    
+    return ([("sc09_structure", sample_layout_structure()), ("sc09_form", sc09_layout(1))]
+            + corpus_cases([str(DEFAULT_CORPUS_DIR)]))
+
+def corpus_cases(patterns: List[str]) -> List[Case]:
+    """layout JSON files ที่ตรงกับ patterns (directory = *.json ข้างใน) ชื่อ case = ชื่อไฟล์"""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.json")
+        paths.update(glob.glob(pattern, recursive=True))
+    return [(Path(path).stem, path) for path in sorted(paths)]
+
+def golden_name(case: str, generator: str, mode: Optional[str] = None) -> str:
+    """mode=None สำหรับ generator ที่ output ไม่ขึ้นกับ codegen mode"""
+    extension = "json" if generator in JSON_GENERATORS else "dart"
+    return f"{case}.{generator}.{mode}.{extension}" if mode else f"{case}.{generator}.{extension}"
+
+def check_evaluator_agreement(layout_data: Dict[str, Any]) -> None:
+    """ViewportEvaluator ต้องได้ frames, overflow และความสูงเดียวกับ LayoutSolver ทุก FRAME_VIEWPORTS
+    
+    ไม่ตรง = ValueError (ไม่มี NumPy = ข้าม เพราะ ViewportEvaluator ใช้ไม่ได้)
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    from layout_helper import LayoutHelper, LayoutSolver, ViewportEvaluator
+    
+    widths = [width for width, _ in FRAME_VIEWPORTS]
+    scales = [scale for _, scale in FRAME_VIEWPORTS]
+    for c, container in enumerate(LayoutHelper.layout_containers(layout_data)):
+        if isinstance(container, dict):
+            container = LayoutHelper.container_from_dict(container)
+        packed = ViewportEvaluator.pack(container)
+        evaluated = ViewportEvaluator.evaluate_container(packed, widths, scales)
+        shape = (len(widths), len(packed["ids"]))
+        frames = np.stack([np.broadcast_to(evaluated[k], shape) for k in ("x", "y", "width", "height")], axis=-1)
+        overflow = np.broadcast_to(evaluated["overflow"], shape)
+        
+        for v, (width, scale) in enumerate(FRAME_VIEWPORTS):
+            solved = LayoutSolver.solve(container, width, scale)
+            where = f"container {c} at width {width:g}, text scale {scale:g}"
+            if solved.frames and not np.allclose(frames[v], np.array(solved.frames), atol=1e-6):
+                raise ValueError(f"ViewportEvaluator frames differ from LayoutSolver in {where}")
+            if [i for i, flag in zip(packed["ids"], overflow[v]) if flag] != solved.overflow:
+                raise ValueError(f"ViewportEvaluator overflow differs from LayoutSolver in {where}")
+            if not math.isclose(float(evaluated["content_height"][v]), solved.content_height, abs_tol=1e-6):
+                raise ValueError(f"ViewportEvaluator content height differs from LayoutSolver in {where}")
+
+def render(layout_data: Dict[str, Any], generator: str, mode: Optional[str], lazy_threshold: int) -> str:
+    """output ของ layout จาก generator หนึ่งตัว (widgets = ทั้ง screen, column = ทีละ container)"""
+    from layout_helper import LayoutHelper
+    
+    if generator == "schema":
+        from layout_schema import validate_layout
+        return json.dumps(validate_layout(layout_data), indent=2, ensure_ascii=False)
+    if generator == "dedupe":
+        return LayoutHelper.generate_shared_widgets([layout_data])[0]
+    if generator == "frames":
+        check_evaluator_agreement(layout_data)
+        return json.dumps([result.to_dict() for width, scale in FRAME_VIEWPORTS
+                           for result in LayoutHelper.solve_screen(layout_data, width, scale)],
+                          indent=2, ensure_ascii=False)
+    if generator == "widgets":
+        return LayoutHelper.generate_flutter_widgets(layout_data, mode, lazy_threshold)
+    columns = []
+    for container in LayoutHelper.layout_containers(layout_data):
+        if isinstance(container, dict):
+            container = LayoutHelper.container_from_dict(container)
+        columns.append(LayoutHelper.generate_flutter_column(container, mode, lazy_threshold))
+    return "\n\n".join(columns)
+
+def index_path(golden_dir: Path) -> Path:
+    """hash index ของ golden dir หนึ่ง - หนึ่งไฟล์ต่อ golden dir ใน DEFAULT_CACHE_DIR"""
+    digest = hashlib.sha1(str(Path(golden_dir).resolve()).encode('utf-8')).hexdigest()
+    return DEFAULT_CACHE_DIR / f"{digest}.json"
+
+def load_index(golden_dir: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(index_path(golden_dir).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data.get("hashes", {}) if data.get("version") == INDEX_VERSION else {}
+
+def save_index(golden_dir: Path, hashes: Dict[str, Dict[str, Any]]) -> None:
+    path = index_path(golden_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": INDEX_VERSION, "golden_dir": str(Path(golden_dir).resolve()),
+            "hashes": dict(sorted(hashes.items()))}
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+def golden_hash(path: Path) -> Optional[Dict[str, Any]]:
+    """index entry ของ golden file - ใช้ hash จาก index ถ้า mtime/size ยังตรง ไม่งั้น hash ไฟล์ใหม่"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    entry = _HASHES.get(path.name)
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry
+    return {"sha256": hashlib.sha256(path.read_bytes()).hexdigest(), "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns}
+
+def _init_worker(plugins: List[str], hashes: Dict[str, Dict[str, Any]]) -> None:
+    from layout_helper import load_emitter_plugins
+    
+    load_emitter_plugins(plugins)
+    _HASHES.clear()
+    _HASHES.update(hashes)
+
+def check_case(task: Tuple[Case, List[str], int, str, bool]) -> List[Dict[str, Any]]:
+    """Generate ทุก (generator, mode) ของ case หนึ่งแล้วเทียบกับ golden - hash ก่อน แล้ว diff เมื่อไม่ตรง"""
+    (case, source), modes, lazy_threshold, golden_dir, update = task
+    results = []
+    start = time.perf_counter()
+    try:
+        layout_data = source if isinstance(source, dict) else json.loads(Path(source).read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        return [{"case": case, "golden": None, "status": "error", "error": f"cannot read layout: {e}",
+                 "ms": round((time.perf_counter() - start) * 1000, 3)}]
+    
+    from layout_schema import validate_layout
+    
+    if validate_layout(layout_data):
+        # layout ที่ไม่ผ่าน schema (ใส่ไว้ใน corpus โดยตั้งใจ) snapshot เฉพาะ errors ของ validator
+        snapshots: List[Tuple[str, Optional[str]]] = [("schema", None)]
+    else:
+        snapshots = [(generator, mode) for generator in GENERATORS
+                     for mode in (modes if generator in MODE_GENERATORS else [None])]
+    
+    for generator, mode in snapshots:
+        name = golden_name(case, generator, mode)
+        result: Dict[str, Any] = {"case": case, "golden": name}
+        start = time.perf_counter()
+        try:
+            code = render(layout_data, generator, mode, lazy_threshold)
+        except Exception as e:
+            result.update(status="error", error=f"{type(e).__name__}: {e}",
+                          ms=round((time.perf_counter() - start) * 1000, 3))
+            results.append(result)
+            continue
+        generate_seconds = time.perf_counter() - start
+        
+        data = code.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        golden_path = Path(golden_dir) / name
+        entry = golden_hash(golden_path)
+        expected = entry["sha256"] if entry else None
+        
+        if expected == digest:
+            result["status"] = "pass"
+        elif update:
+            tmp_path = golden_path.with_name(f"{name}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, golden_path)
+            stat = golden_path.stat()
+            entry = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            result["status"] = "updated"
+        elif expected is None:
+            result["status"] = "missing"
+        else:
+            golden = golden_path.read_text(encoding='utf-8') if golden_path.exists() else ""
+            diff = list(difflib.unified_diff(golden.splitlines(), code.splitlines(),
+                                             f"golden/{name}", f"generated/{name}", lineterm=""))
+            result.update(status="fail", diff=diff[:MAX_DIFF_LINES])
+        
+        result.update(sha256=digest, bytes=len(data), generate_ms=round(generate_seconds * 1000, 3),
+                      ms=round((time.perf_counter() - start) * 1000, 3))
+        if entry:
+            result["index"] = entry
+        results.append(result)
+    return results
+
+def run_snapshots(cases: List[Case], golden_dir: Path, modes: List[str], lazy_threshold: int,
+                  update: bool = False, jobs: Optional[int] = None, plugins: Optional[List[str]] = None) -> Dict[str, Any]:
+    """ตรวจทุก case (แบบขนานถ้า jobs > 1) คืน report พร้อม summary - update=True เขียน golden ที่ไม่ตรงใหม่"""
+    plugins = plugins or []
+    if update:
+        golden_dir.mkdir(parents=True, exist_ok=True)
+    hashes = load_index(golden_dir)
+    tasks = [(case, modes, lazy_threshold, str(golden_dir), update) for case in cases]
+    jobs = jobs or os.cpu_count() or 1
+    
+    start = time.perf_counter()
+    if jobs > 1 and len(tasks) > 1:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=_init_worker,
+                                 initargs=(plugins, hashes)) as executor:
+            results = [r for case_results in executor.map(check_case, tasks, chunksize=chunksize)
+                       for r in case_results]
+    else:
+        _init_worker(plugins, hashes)
+        results = [r for task in tasks for r in check_case(task)]
+    wall = time.perf_counter() - start
+    
+    # entry ของ golden ที่มีอยู่ (หรือเพิ่งเขียน) ถูกต้องเสมอ - เก็บไว้ให้รอบถัดไปไม่ต้อง hash ใหม่
+    entries = {r["golden"]: r.pop("index") for r in results if "index" in r}
+    if entries != {name: hashes.get(name) for name in entries}:
+        hashes.update(entries)
+        save_index(golden_dir, hashes)
+    
+    statuses: Dict[str, int] = {}
+    for r in results:
+        statuses[r["status"]] = statuses.get(r["status"], 0) + 1
+    return {
+        "golden_dir": str(golden_dir),
+        "summary": {"cases": len(cases), "snapshots": len(results), "wall_ms": round(wall * 1000, 3),
+                    "jobs": jobs, **dict(sorted(statuses.items()))},
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden-output regression check for generated Flutter code")
+    parser.add_argument("--corpus", nargs="+", default=[],
+                        help="Layout JSON files, directories or glob patterns to snapshot (in addition to the built-in cases)")
+    parser.add_argument("--no-builtin", action="store_true", help="Skip the built-in SC-09 cases and the snapshots/layouts corpus")
+    parser.add_argument("--golden-dir", default=str(DEFAULT_GOLDEN_DIR),
+                        help=f"Directory of golden .dart files (default: {DEFAULT_GOLDEN_DIR})")
+    parser.add_argument("--modes", default="default,performance", help="Comma-separated codegen modes to check")
+    parser.add_argument("--lazy-threshold", type=int,
+                        help="Use ListView.builder above this many elements (--mode performance, "
+                             "default: layout_helper.LAZY_LIST_THRESHOLD)")
+    parser.add_argument("--plugin", action="append", default=[],
+                        help="Emitter plugin module or .py file (repeatable)")
+    parser.add_argument("--update", action="store_true", help="Write current output as the new golden files")
+    parser.add_argument("--jobs", type=int, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    
+    args = parser.parse_args()
+    
+    from layout_helper import LAZY_LIST_THRESHOLD, MODE_EMITTERS, load_emitter_plugins
+    
+    if args.lazy_threshold is None:
+        args.lazy_threshold = LAZY_LIST_THRESHOLD
+    # plugin อาจเพิ่ม mode - โหลดก่อนตรวจ --modes (workers โหลดซ้ำเองใน _init_worker)
+    load_emitter_plugins(args.plugin)
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODE_EMITTERS]
+    if unknown:
+        parser.error(f"unknown codegen mode(s): {', '.join(unknown)}")
+    
+    cases = ([] if args.no_builtin else builtin_cases()) + corpus_cases(args.corpus)
+    names = [name for name, _ in cases]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        parser.error(f"duplicate case names (rename the layout files): {', '.join(duplicates)}")
+    if not cases:
+        parser.error("no cases to check")
+    
+    report = run_snapshots(cases, Path(args.golden_dir), modes, args.lazy_threshold,
+                           args.update, args.jobs, args.plugin)
+    
+    for r in report["results"]:
+        if r["status"] == "fail":
+            print("\n".join(r["diff"]), file=sys.stderr)
+        elif r["status"] in ("missing", "error"):
+            print(f"{r['golden'] or r['case']}: {r['status']} {r.get('error', '(run with --update)')}",
+                  file=sys.stderr)
+    
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Golden report saved to {args.output}")
+    else:
+        print(output)
+    
+    if not args.update and any(r["status"] != "pass" for r in report["results"]):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
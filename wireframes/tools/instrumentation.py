@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Instrumentation - จับเวลาแต่ละ stage, นับ counters และ cProfile สำหรับ wireframe tools
+
+ปิดอยู่โดย default: stage() คืน context manager ว่างตัวเดียวกันทุกครั้ง และ count() แค่เช็ค flag
+จึงแทบไม่มี overhead ใน code path ปกติ เปิดด้วย --profile / --timings ของ
+agent_visual_workflow.py และ layout_helper.py แล้วจะได้ JSON summary ตอนจบคำสั่ง
+
+Usage:
+    python agent_visual_workflow.py --timings - batch --manifests m.yml --jsonl out.jsonl
+    python layout_helper.py --generate-flutter-layout --layout layouts/*.json --output-dir out --profile layout.prof
+    python -m pstats layout.prof
+"""
+
+import sys
+import json
+import time
+import argparse
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Iterator, List, Optional
+
+ENABLED = False
+
+# stage -> [จำนวนครั้ง, วินาทีรวม]
+_STAGES: Dict[str, List[float]] = {}
+_COUNTERS: Dict[str, int] = {}
+_NULL_STAGE = nullcontext()
+
+def enable(enabled: bool = True) -> None:
+    """เปิด/ปิดการเก็บ timers และ counters (ใช้เป็นส่วนหนึ่งของ initializer ของ worker processes ได้)"""
+    global ENABLED
+    ENABLED = enabled
+
+def reset() -> None:
+    _STAGES.clear()
+    _COUNTERS.clear()
+
+@contextmanager
+def _timed(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = _STAGES.get(name)
+        if entry is None:
+            entry = _STAGES[name] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += time.perf_counter() - start
+
+def stage(name: str):
+    """Context manager จับเวลา stage - ถ้าปิดอยู่คืน nullcontext ตัวเดียวกันเสมอ"""
+    if not ENABLED:
+        return _NULL_STAGE
+    return _timed(name)
+
+def count(name: str, amount: int = 1) -> None:
+    if ENABLED:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+def snapshot() -> Dict[str, Any]:
+    """คืนค่าดิบที่ pickle ได้ สำหรับส่งจาก worker process กลับมา merge()"""
+    return {"stages": {name: list(entry) for name, entry in _STAGES.items()}, "counters": dict(_COUNTERS)}
+
+def merge(raw: Dict[str, Any]) -> None:
+    for name, (calls, seconds) in raw.get("stages", {}).items():
+        entry = _STAGES.setdefault(name, [0, 0.0])
+        entry[0] += calls
+        entry[1] += seconds
+    for name, amount in raw.get("counters", {}).items():
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+def summary(wall_seconds: Optional[float] = None) -> Dict[str, Any]:
+    stages = {
+        name: {"calls": int(calls), "total_ms": round(seconds * 1000, 3),
+               "mean_ms": round(seconds * 1000 / calls, 3) if calls else 0.0}
+        for name, (calls, seconds) in sorted(_STAGES.items())
+    }
+    report: Dict[str, Any] = {"stages": stages, "counters": dict(sorted(_COUNTERS.items()))}
+    if wall_seconds is not None:
+        report = {"wall_ms": round(wall_seconds * 1000, 3), **report}
+    return report
+
+@contextmanager
+def session(profile_path: Optional[str] = None, timings_path: Optional[str] = None) -> Iterator[None]:
+    """ครอบทั้งคำสั่ง CLI: เปิด timers (และ cProfile ถ้าให้ profile_path) แล้วเขียน summary ตอนจบ
+    
+    timings_path "-" หรือไม่ระบุแต่มี profile_path = เขียน summary ไป stderr
+    """
+    if not profile_path and not timings_path:
+        yield
+        return
+    
+    reset()
+    enable()
+    profiler = None
+    if profile_path:
+        import cProfile
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        enable(False)
+        
+        output = json.dumps(summary(wall), indent=2)
+        if timings_path and timings_path != "-":
+            with open(timings_path, 'w', encoding='utf-8') as f:
+                f.write(output)
+        else:
+            print(output, file=sys.stderr)
+        if profiler is not None:
+            print(f"Profile saved to {profile_path} (view with: python -m pstats {profile_path})", file=sys.stderr)
+
+def add_arguments(parser: argparse.ArgumentParser, suppress_defaults: bool = False) -> None:
+    defaults = {"default": argparse.SUPPRESS} if suppress_defaults else {}
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Run under cProfile and write pstats data to PATH (implies --timings -)", **defaults)
+    parser.add_argument("--timings", metavar="PATH",
+                        help="Write per-stage timings and counters as JSON to PATH (- for stderr)", **defaults)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+JSONL I/O - อ่าน/เขียน JSON ทีละบรรทัดแบบ streaming สำหรับ wireframe tools
+
+ใช้ต่อ pipe ระหว่าง agent_visual_workflow.py กับ layout_helper.py ได้โดยไม่ต้องโหลด
+ทุก screen เข้า memory พร้อมกัน - path "-" หมายถึง stdin/stdout
+
+Usage:
+    python agent_visual_workflow.py batch --manifests m.yml --action prepare-layout --detect-elements --emit-layouts \\
+        | python layout_helper.py --generate-flutter-layout --layout-jsonl - --jsonl-output
+"""
+
+import sys
+import json
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, TextIO
+
+STDIO_PATH = "-"
+
+@contextmanager
+def open_text(path: str, mode: str = 'r'):
+    """เปิดไฟล์ข้อความ หรือ stdin/stdout ถ้า path เป็น "-" (ไม่ปิด stdio ตอนจบ)"""
+    if path == STDIO_PATH:
+        yield sys.stdin if 'r' in mode else sys.stdout
+        return
+    with open(path, mode, encoding='utf-8') as f:
+        yield f
+
+def iter_jsonl(stream: TextIO, errors: Optional[List[Tuple[int, str]]] = None) -> Iterator[Tuple[int, Any]]:
+    """Yield (เลขบรรทัด, object) ทีละบรรทัด ข้ามบรรทัดว่าง
+    
+    บรรทัดที่ JSON เสียจะ raise ValueError - หรือถ้าให้ errors มา จะบันทึก (เลขบรรทัด, ข้อความ) แล้วข้ามไป
+    """
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError as e:
+            if errors is None:
+                raise ValueError(f"line {line_number}: invalid JSON: {e}") from None
+            errors.append((line_number, f"invalid JSON: {e}"))
+            continue
+        yield line_number, value
+
+def write_jsonl_record(record: Dict[str, Any], stream: TextIO) -> None:
+    """เขียน record หนึ่งบรรทัดแล้ว flush ทันทีเพื่อให้ process ถัดไปใน pipe เริ่มทำงานได้"""
+    stream.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    stream.flush()
+
+def write_jsonl(records: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    count = 0
+    for record in records:
+        write_jsonl_record(record, stream)
+        count += 1
+    return count
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Layout Benchmark - วัด throughput ของ LayoutHelper ตั้งแต่ 10 ถึง 100k elements
+
+วัด create_form_layout, create_button_row, generate_flutter_column และ generate_flutter_widgets
+ทั้งบน layout สังเคราะห์และ form แบบ SC-09 (profile header + textfields + button row)
+รายงาน elements/sec, peak memory (tracemalloc) และ output bytes/sec เป็น JSON
+และเทียบกับ baseline ที่บันทึกไว้ - throughput ลดลงเกิน tolerance ถือเป็น regression (exit code 1)
+
+Usage:
+    python layout_benchmark.py
+    python layout_benchmark.py --sizes 10,1000,100000 --output bench.json
+    python layout_benchmark.py --save-baseline benchmarks/layout_baseline.json
+    python layout_benchmark.py --baseline benchmarks/layout_baseline.json --tolerance 0.25
+"""
+
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from layout_helper import BUILDER_CACHE, LayoutHelper
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+DEFAULT_TOLERANCE = 0.25
+# จำนวน elements รวมขั้นต่ำต่อการวัดหนึ่งครั้ง - size เล็กจะถูกรันซ้ำหลายรอบให้เวลาวัดได้นิ่ง
+MIN_ELEMENTS_PER_SAMPLE = 20000
+
+SC09_FIELDS = [
+    {"type": "textfield", "id": "first_name", "label": "ชื่อ*"},
+    {"type": "textfield", "id": "last_name", "label": "นามสกุล*"},
+    {"type": "textfield", "id": "nickname", "label": "ชื่อเล่น"},
+    {"type": "textfield", "id": "student_id", "label": "รหัสนักศึกษา*"},
+    {"type": "textfield", "id": "graduation_year", "label": "ปีที่จบการศึกษา*"},
+]
+SC09_BUTTONS = [
+    {"id": "cancel_button", "text": "ยกเลิก", "style": "secondary"},
+    {"id": "save_button", "text": "บันทึก", "style": "primary"},
+]
+
+def synthetic_fields(count: int) -> List[Dict[str, str]]:
+    types = ("textfield", "text", "button", "textfield")
+    return [{"type": types[i % len(types)], "id": f"field_{i}", "label": f"Field {i}"} for i in range(count)]
+
+def synthetic_buttons(count: int) -> List[Dict[str, str]]:
+    return [{"id": f"button_{i}", "text": f"Button {i}", "style": "primary" if i % 2 else "secondary"}
+            for i in range(count)]
+
+def sc09_layout(count: int) -> Dict[str, Any]:
+    """สร้าง layout แบบ SC-09 ซ้ำหลายชุดจนได้ประมาณ count elements (ชุดซ้ำได้จาก BUILDER_CACHE)"""
+    per_form = 2 + len(SC09_FIELDS) + len(SC09_BUTTONS)
+    containers = []
+    for _ in range(max(1, count // per_form)):
+        containers.append(BUILDER_CACHE.as_dict("create_profile_header"))
+        containers.append(BUILDER_CACHE.as_dict("create_form_layout", SC09_FIELDS))
+        containers.append(BUILDER_CACHE.as_dict("create_button_row", SC09_BUTTONS))
+    return {"screen_id": "SC-09", "containers": containers}
+
+def count_elements(layout_data: Dict[str, Any]) -> int:
+    return sum(len(container.get("elements", [])) for container in layout_data["containers"])
+
+# แต่ละ case: setup(size) -> (function ที่จะวัด, จำนวน elements จริง)
+def _case_form_layout(size: int) -> Tuple[Callable[[], Any], int]:
+    fields = synthetic_fields(size)
+    return lambda: LayoutHelper.create_form_layout(fields), size
+
+def _case_button_row(size: int) -> Tuple[Callable[[], Any], int]:
+    buttons = synthetic_buttons(size)
+    return lambda: LayoutHelper.create_button_row(buttons), size
+
+def _case_flutter_column(size: int) -> Tuple[Callable[[], Any], int]:
+    container = LayoutHelper.create_form_layout(synthetic_fields(size))
+    return lambda: LayoutHelper.generate_flutter_column(container), size
+
+def _case_flutter_widgets(size: int) -> Tuple[Callable[[], Any], int]:
+    layout_data = {"screen_id": "SC-BENCH", "containers": [
+        asdict(LayoutHelper.create_form_layout(synthetic_fields(min(50, size - start))))
+        for start in range(0, size, 50)
+    ]}
+    return lambda: LayoutHelper.generate_flutter_widgets(layout_data), size
+
+def _case_sc09_widgets(size: int) -> Tuple[Callable[[], Any], int]:
+    layout_data = sc09_layout(size)
+    return lambda: LayoutHelper.generate_flutter_widgets(layout_data), count_elements(layout_data)
+
+BENCHMARK_CASES: Dict[str, Callable[[int], Tuple[Callable[[], Any], int]]] = {
+    "create_form_layout": _case_form_layout,
+    "create_button_row": _case_button_row,
+    "generate_flutter_column": _case_flutter_column,
+    "generate_flutter_widgets": _case_flutter_widgets,
+    "sc09_flutter_widgets": _case_sc09_widgets,
+}
+
+def measure(func: Callable[[], Any], elements: int) -> Dict[str, Any]:
+    """วัดเวลาที่ดีที่สุดจากหลายรอบ แล้ววัด peak memory แยกอีกรอบ (tracemalloc ทำให้ช้าลง)"""
+    rounds = max(1, MIN_ELEMENTS_PER_SAMPLE // elements)
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            result = func()
+        best = min(best, (time.perf_counter() - start) / rounds)
+    
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    record = {
+        "elements": elements,
+        "seconds": best,
+        "elements_per_sec": round(elements / best, 1),
+        "peak_memory_bytes": peak,
+    }
+    if isinstance(result, str):
+        output_bytes = len(result.encode('utf-8'))
+        record["output_bytes"] = output_bytes
+        record["output_bytes_per_sec"] = round(output_bytes / best, 1)
+    return record
+
+def run_benchmarks(sizes: List[int], cases: Optional[List[str]] = None) -> Dict[str, Any]:
+    results = {}
+    for name in cases or BENCHMARK_CASES:
+        for size in sizes:
+            func, elements = BENCHMARK_CASES[name](size)
+            results[f"{name}@{size}"] = {"case": name, "size": size, **measure(func, elements)}
+    return {"python": sys.version.split()[0], "sizes": sizes, "results": results}
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """คืนรายการ case ที่ throughput ลดลงเกิน tolerance เทียบกับ baseline"""
+    regressions = []
+    for key, result in report["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if not base:
+            continue
+        ratio = result["elements_per_sec"] / base["elements_per_sec"]
+        result["baseline_ratio"] = round(ratio, 3)
+        if ratio < 1.0 - tolerance:
+            regressions.append({"benchmark": key, "ratio": round(ratio, 3),
+                                "elements_per_sec": result["elements_per_sec"],
+                                "baseline_elements_per_sec": base["elements_per_sec"]})
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Layout Benchmark")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated element counts")
+    parser.add_argument("--cases", help=f"Comma-separated subset of: {', '.join(BENCHMARK_CASES)}")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against this saved report")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed throughput drop vs baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="Save this run as the new baseline file")
+    
+    args = parser.parse_args()
+    
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    cases = [c.strip() for c in args.cases.split(",")] if args.cases else None
+    unknown = [c for c in cases or [] if c not in BENCHMARK_CASES]
+    if unknown:
+        parser.error(f"Unknown benchmark case(s): {', '.join(unknown)}")
+    
+    report = run_benchmarks(sizes, cases)
+    
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        report["regressions"] = regressions
+    
+    for key, result in report["results"].items():
+        line = f"{key:32} {result['elements_per_sec']:>14,.0f} el/s  peak {result['peak_memory_bytes'] / 1024:>10,.0f} KiB"
+        if "output_bytes_per_sec" in result:
+            line += f"  {result['output_bytes_per_sec'] / 1e6:8.1f} MB/s"
+        if "baseline_ratio" in result:
+            line += f"  x{result['baseline_ratio']:.2f}"
+        print(line)
+    
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Benchmark report saved to {args.output}")
+    if args.save_baseline:
+        Path(args.save_baseline).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.save_baseline).write_text(output, encoding='utf-8')
+        print(f"Baseline saved to {args.save_baseline}")
+    
+    if regressions:
+        for regression in regressions:
+            print(f"REGRESSION {regression['benchmark']}: {regression['ratio']:.2f}x of baseline", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,108 @@ Usage:
     python layout_helper.py --generate-structure
     python layout_helper.py --create-spacing-guide
     python layout_helper.py --generate-flutter-layout --elements "button,textfield,image"
+    python layout_helper.py --generate-flutter-layout --elements "card,icon" --plugin my_emitters.py
+    python layout_helper.py --generate-flutter-layout --layout layouts/*.json --output-dir lib/generated --incremental
+    python layout_helper.py --generate-flutter-layout --layout layouts/*.json --dedupe --output lib/generated/screens.dart
+    python layout_helper.py --generate-flutter-layout --layout layouts/SC-09.json --mode performance --lazy-threshold 20
+    python layout_helper.py --generate-structure --jsonl-output | python layout_helper.py --generate-flutter-layout --layout-jsonl - --jsonl-output
+    python layout_helper.py --solve-layout --layout layouts/SC-09.json --viewports 320,375,414
+    python layout_helper.py --evaluate-viewports --layout layouts/*.json --devices 320x568,375x812 --text-scales 1.0,1.3
+    python layout_helper.py --memory-benchmark 100000
+    python layout_helper.py --generate-flutter-layout --layout layouts/*.json --output-dir out --profile layout.prof
 """
 
+import os
+import sys
 import json
+import math
+import re
+import hashlib
+import string
 import argparse
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+import importlib
+import importlib.util
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, replace
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Mapping, NamedTuple, TextIO, Tuple
 from pathlib import Path
 
+import instrumentation
+
+# Insets เก็บเป็น tuple (top, bottom, left, right) ลำดับเดียวกับ key ใน dict
+Insets = Tuple[float, float, float, float]
+INSET_KEYS = ("top", "bottom", "left", "right")
+
+DEFAULT_ELEMENT_MARGIN: Insets = (8.0, 8.0, 16.0, 16.0)
+DEFAULT_ELEMENT_PADDING: Insets = (12.0, 12.0, 16.0, 16.0)
+DEFAULT_CONTAINER_PADDING: Insets = (16.0, 16.0, 16.0, 16.0)
+
+# ขนาด placeholder ที่ใช้แทน match_parent / wrap_content ตอนสร้าง element
+PLACEHOLDER_WIDTH = 100.0
+PLACEHOLDER_HEIGHT = 40.0
+
+class FrozenDict(dict):
+    """dict แบบอ่านอย่างเดียว - ใช้เป็นค่า default ที่ทุก element ใช้ร่วมกัน
+    
+    copy/deepcopy/pickle และ asdict() ได้ dict ธรรมดาที่แก้ไขได้ ถ้าจะเปลี่ยนค่าให้ assign dict ใหม่แทน
+    """
+    
+    __slots__ = ()
+    
+    def __new__(cls, *args, **kwargs):
+        # asdict() สร้าง dict ใหม่ด้วย type(obj)(items) - ให้ได้ dict ธรรมดากลับไป
+        return dict(*args, **kwargs)
+    
+    @classmethod
+    def freeze(cls, data: Mapping[str, Any]) -> "FrozenDict":
+        frozen = dict.__new__(cls)
+        dict.update(frozen, data)
+        return frozen
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("shared default mapping is read-only - assign a new dict instead")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+# properties ว่างที่ใช้ร่วมกันได้ทุก element (แก้ไขไม่ได้)
+EMPTY_PROPERTIES: Mapping[str, Any] = FrozenDict.freeze({})
+
+def insets_to_dict(insets: Insets) -> Dict[str, float]:
+    return dict(zip(INSET_KEYS, insets))
+
+def insets_from_value(value: Any, default: Insets) -> Insets:
+    """แปลง dict/sequence ของ insets เป็น tuple 4 ค่า"""
+    if value is None:
+        return default
+    if isinstance(value, Mapping):
+        return tuple(float(value.get(key, 0.0)) for key in INSET_KEYS)
+    top, bottom, left, right = value
+    return (float(top), float(bottom), float(left), float(right))
+
+# default insets แบบ dict ที่ element/container ทุกตัวใช้ร่วมกัน
+SHARED_ELEMENT_MARGIN: Mapping[str, float] = FrozenDict.freeze(insets_to_dict(DEFAULT_ELEMENT_MARGIN))
+SHARED_ELEMENT_PADDING: Mapping[str, float] = FrozenDict.freeze(insets_to_dict(DEFAULT_ELEMENT_PADDING))
+SHARED_CONTAINER_PADDING: Mapping[str, float] = FrozenDict.freeze(insets_to_dict(DEFAULT_CONTAINER_PADDING))
+
+def slotted(cls):
+    """สร้าง dataclass ใหม่ที่ใช้ __slots__ แทน __dict__ (เหมือน dataclass(slots=True) ของ Python 3.10+)"""
+    names = tuple(cls.__dataclass_fields__)
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names + ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@slotted
 @dataclass
 class LayoutElement:
-    """Element สำหรับการจัด layout"""
+    """Element สำหรับการจัด layout
+    
+    margin/padding/properties ที่ไม่ได้ระบุจะใช้ FrozenDict ตัวเดียวกันทุก element (แก้ไขไม่ได้)
+    """
     type: str  # button, textfield, text, image, container, etc.
     id: str
     x: float = 0.0
@@ -28,15 +119,18 @@ class LayoutElement:
     margin: Dict[str, float] = None
     padding: Dict[str, float] = None
     properties: Dict[str, Any] = None
-
+    
     def __post_init__(self):
+        self.type = sys.intern(self.type)
+        self.alignment = sys.intern(self.alignment)
         if self.margin is None:
-            self.margin = {"top": 8.0, "bottom": 8.0, "left": 16.0, "right": 16.0}
+            self.margin = SHARED_ELEMENT_MARGIN
         if self.padding is None:
-            self.padding = {"top": 12.0, "bottom": 12.0, "left": 16.0, "right": 16.0}
-        if self.properties is None:
-            self.properties = {}
+            self.padding = SHARED_ELEMENT_PADDING
+        if not self.properties:
+            self.properties = EMPTY_PROPERTIES
 
+@slotted
 @dataclass
 class LayoutContainer:
     """Container สำหรับจัดกลุ่ม elements"""
@@ -45,10 +139,291 @@ class LayoutContainer:
     spacing: float = 16.0
     alignment: str = "center"
     padding: Dict[str, float] = None
-
+    
     def __post_init__(self):
         if self.padding is None:
-            self.padding = {"top": 16.0, "bottom": 16.0, "left": 16.0, "right": 16.0}
+            self.padding = SHARED_CONTAINER_PADDING
+
+def memory_benchmark(count: int) -> Dict[str, Any]:
+    """วัด memory ของ LayoutElement (slots + default ที่แชร์กัน) เทียบกับ element ที่มี dict ของตัวเองทุกตัว"""
+    import tracemalloc
+    
+    def measure(build: Callable[[], Any]) -> int:
+        tracemalloc.start()
+        try:
+            result = build()
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        return current
+    
+    def props(i: int) -> Dict[str, Any]:
+        # ครึ่งหนึ่งไม่มี properties แบบเดียวกับ element ที่สร้างจาก create_element ทั่วไป
+        return {"text": f"Field {i}"} if i % 2 else None
+    
+    def unshared(i: int) -> LayoutElement:
+        # แบบเดิม: margin/padding/properties เป็น dict ใหม่ทุก element
+        return LayoutElement("textfield", f"f{i}", margin=insets_to_dict(DEFAULT_ELEMENT_MARGIN),
+                             padding=insets_to_dict(DEFAULT_ELEMENT_PADDING), properties=props(i) or {})
+    
+    results = {
+        "unshared": measure(lambda: [unshared(i) for i in range(count)]),
+        "shared": measure(lambda: [LayoutElement("textfield", f"f{i}", properties=props(i)) for i in range(count)]),
+    }
+    
+    sample = LayoutElement("textfield", "f1", properties={"text": "Field 1"})
+    data = asdict(LayoutElement("textfield", "f0"))
+    round_trip = (LayoutElement(**asdict(sample)) == sample
+                  and all(type(data[key]) is dict for key in ("margin", "padding", "properties")))
+    
+    return {
+        "elements": count,
+        "bytes": results,
+        "bytes_per_element": {name: round(value / max(count, 1), 1) for name, value in results.items()},
+        "savings": f"{(1 - results['shared'] / results['unshared']) * 100:.1f}%",
+        "round_trip_asdict": round_trip,
+    }
+
+class CompiledTemplate:
+    """Code template ที่ parse ครั้งเดียว แล้ว render ด้วยการต่อ string ตรง ๆ"""
+    
+    _formatter = string.Formatter()
+    
+    def __init__(self, template: str):
+        self.template = template
+        self.parts = [
+            (literal, field_name)
+            for literal, field_name, _, _ in self._formatter.parse(template)
+        ]
+    
+    def render(self, **values: Any) -> str:
+        return "".join(
+            literal if field_name is None else f"{literal}{values[field_name]}"
+            for literal, field_name in self.parts
+        )
+
+# Emitter: รับ LayoutElement แล้วคืน Flutter code ของ element นั้น
+WidgetEmitter = Callable[[LayoutElement], str]
+
+WIDGET_EMITTERS: Dict[str, WidgetEmitter] = {}
+# emitters เฉพาะ mode - type ที่ไม่มีใน mode นั้นจะใช้ emitter ของ default mode
+PERFORMANCE_EMITTERS: Dict[str, WidgetEmitter] = {}
+MODE_EMITTERS: Dict[str, Dict[str, WidgetEmitter]] = {
+    "default": WIDGET_EMITTERS,
+    "performance": PERFORMANCE_EMITTERS,
+}
+# container ที่มี elements เกินนี้จะใช้ ListView.builder ใน performance mode
+LAZY_LIST_THRESHOLD = 20
+
+# เพิ่มทุกครั้งที่ registry เปลี่ยน - code ที่ cache ไว้จาก version เก่าจะไม่ถูกใช้
+_EMITTERS_VERSION = 0
+
+EMITTER_ENTRY_POINT_GROUP = "layout_helper.emitters"
+EMITTER_PLUGINS_ENV = "LAYOUT_HELPER_PLUGINS"
+
+def register_emitter(element_type: str, emitter: Optional[WidgetEmitter] = None, replace: bool = True,
+                     mode: str = "default"):
+    """ลงทะเบียน emitter สำหรับ element type (และ codegen mode) - ใช้เป็น decorator ได้"""
+    if mode not in MODE_EMITTERS:
+        raise ValueError(f"Unknown codegen mode: {mode}")
+    emitters = MODE_EMITTERS[mode]
+    
+    def decorator(func: WidgetEmitter) -> WidgetEmitter:
+        global _EMITTERS_VERSION
+        if not replace and element_type in emitters:
+            raise ValueError(f"Emitter for '{element_type}' is already registered")
+        emitters[element_type] = func
+        _EMITTERS_VERSION += 1
+        return func
+    
+    if emitter is not None:
+        return decorator(emitter)
+    return decorator
+
+def _import_plugin(spec: str):
+    if spec.endswith(".py"):
+        module_name = f"layout_helper_plugin_{Path(spec).stem}"
+        module_spec = importlib.util.spec_from_file_location(module_name, spec)
+        if module_spec is None or module_spec.loader is None:
+            raise ImportError(f"Cannot load emitter plugin from {spec}")
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        return module
+    return importlib.import_module(spec)
+
+def load_emitter_plugins(plugins: Iterable[str] = (), include_entry_points: bool = True) -> List[str]:
+    """โหลด emitter plugins จาก entry points, env LAYOUT_HELPER_PLUGINS และ module/ไฟล์ที่ระบุ
+    
+    Plugin แต่ละตัวจะเรียก register_emitter ตอน import หรือมีฟังก์ชัน
+    register_emitters(register) ให้ layout_helper เรียกก็ได้
+    """
+    loaded = []
+    hooks = []
+    
+    if include_entry_points:
+        # importlib.metadata ดึง email/zipfile ตามมา - import เฉพาะตอนโหลด plugins
+        import importlib.metadata
+        
+        entry_points = importlib.metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            group = entry_points.select(group=EMITTER_ENTRY_POINT_GROUP)
+        else:
+            group = entry_points.get(EMITTER_ENTRY_POINT_GROUP, [])
+        for entry_point in group:
+            hooks.append(entry_point.load())
+            loaded.append(entry_point.name)
+    
+    env_plugins = [p.strip() for p in os.environ.get(EMITTER_PLUGINS_ENV, "").split(",") if p.strip()]
+    for spec in [*env_plugins, *plugins]:
+        module = _import_plugin(spec)
+        hook = getattr(module, "register_emitters", None)
+        if hook is not None:
+            hooks.append(hook)
+        loaded.append(spec)
+    
+    for hook in hooks:
+        if callable(hook):
+            hook(register_emitter)
+    
+    return loaded
+
+_TEXTFIELD_TEMPLATE = CompiledTemplate("""TextFormField(
+  decoration: InputDecoration(
+    labelText: '{label}',
+    hintText: '{hint}',
+  ),
+),""")
+
+_BUTTON_TEMPLATE = CompiledTemplate("""{button_type}(
+  onPressed: () {{}},
+  child: Text('{text}'),
+),""")
+
+_TEXT_TEMPLATE = CompiledTemplate("""Text(
+  '{text}',
+  style: Theme.of(context).textTheme.bodyMedium{style_suffix},
+),""")
+
+_PROFILE_IMAGE_TEMPLATE = CompiledTemplate("""CircleAvatar(
+  radius: {radius},
+  backgroundImage: _profileImage != null 
+    ? FileImage(_profileImage!) 
+    : null,
+  child: _profileImage == null 
+    ? Icon(Icons.person, size: {icon_size}) 
+    : null,
+),""")
+
+@register_emitter("textfield")
+def emit_textfield(element: LayoutElement) -> str:
+    return _TEXTFIELD_TEMPLATE.render(
+        label=element.properties.get("label", ""),
+        hint=element.properties.get("hint", ""),
+    )
+
+@register_emitter("button")
+def emit_button(element: LayoutElement) -> str:
+    style = element.properties.get("style", "primary")
+    return _BUTTON_TEMPLATE.render(
+        button_type="ElevatedButton" if style == "primary" else "OutlinedButton",
+        text=element.properties.get("text", "Button"),
+    )
+
+@register_emitter("text")
+def emit_text(element: LayoutElement) -> str:
+    weight = element.properties.get("font_weight", "normal")
+    return _TEXT_TEMPLATE.render(
+        text=element.properties.get("text", ""),
+        style_suffix=f".copyWith(fontWeight: FontWeight.{weight})" if weight != "normal" else "",
+    )
+
+@register_emitter("profile_image")
+def emit_profile_image(element: LayoutElement) -> str:
+    return _PROFILE_IMAGE_TEMPLATE.render(
+        radius=element.width / 2,
+        icon_size=element.width * 0.6,
+    )
+
+# Performance mode: ส่วนที่รู้ค่าตอน compile เป็น const เพื่อให้ Flutter ข้ามการ rebuild
+_PERF_TEXTFIELD_TEMPLATE = CompiledTemplate("""TextFormField(
+  decoration: {const}InputDecoration(
+    labelText: '{label}',
+    hintText: '{hint}',
+  ),
+)""")
+
+_PERF_BUTTON_TEMPLATE = CompiledTemplate("""{button_type}(
+  onPressed: () {{}},
+  child: {const}Text('{text}'),
+)""")
+
+_PERF_PROFILE_IMAGE_TEMPLATE = CompiledTemplate("""CircleAvatar(
+  radius: {radius},
+  backgroundImage: _profileImage != null
+    ? FileImage(_profileImage!)
+    : null,
+  child: _profileImage == null
+    ? const Icon(Icons.person, size: {icon_size})
+    : null,
+)""")
+
+def _const(*values: Any) -> str:
+    """คืน "const " ถ้าทุกค่าเป็น literal ได้ (string ที่มี $ อาจเป็น interpolation)"""
+    return "" if any("$" in str(value) for value in values) else "const "
+
+@register_emitter("textfield", mode="performance")
+def emit_textfield_performance(element: LayoutElement) -> str:
+    label = element.properties.get("label", "")
+    hint = element.properties.get("hint", "")
+    return _PERF_TEXTFIELD_TEMPLATE.render(const=_const(label, hint), label=label, hint=hint)
+
+@register_emitter("button", mode="performance")
+def emit_button_performance(element: LayoutElement) -> str:
+    style = element.properties.get("style", "primary")
+    text = element.properties.get("text", "Button")
+    return _PERF_BUTTON_TEMPLATE.render(
+        button_type="ElevatedButton" if style == "primary" else "OutlinedButton",
+        const=_const(text),
+        text=text,
+    )
+
+@register_emitter("text", mode="performance")
+def emit_text_performance(element: LayoutElement) -> str:
+    # Material ตั้ง DefaultTextStyle เป็น bodyMedium อยู่แล้ว จึงไม่ต้องอ่าน Theme.of(context) และเป็น const ได้
+    text = element.properties.get("text", "")
+    weight = element.properties.get("font_weight", "normal")
+    const = _const(text)
+    # ถ้า Text เป็น const ไม่ได้ (มี interpolation) ก็ยังให้ TextStyle เป็น const
+    style = f", style: {'' if const else 'const '}TextStyle(fontWeight: FontWeight.{weight})" if weight != "normal" else ""
+    return f"{const}Text('{text}'{style})"
+
+@register_emitter("profile_image", mode="performance")
+def emit_profile_image_performance(element: LayoutElement) -> str:
+    return _PERF_PROFILE_IMAGE_TEMPLATE.render(
+        radius=element.width / 2,
+        icon_size=element.width * 0.6,
+    )
+
+def _indent(code: str, spaces: int) -> str:
+    return code.replace("\n", "\n" + " " * spaces)
+
+def stateless_widget_source(name: str, fields: List[Tuple[str, str]], body: str) -> str:
+    """Dart source ของ StatelessWidget ที่มี final fields (dart type, name) และ build คืน body"""
+    constructor = ", ".join(["super.key"] + [f"required this.{field_name}" for _, field_name in fields])
+    lines = [f"class {name} extends StatelessWidget {{", f"  const {name}({{{constructor}}});", ""]
+    if fields:
+        lines += [f"  final {dart_type} {field_name};" for dart_type, field_name in fields] + [""]
+    lines += [
+        "  @override",
+        "  Widget build(BuildContext context) {",
+        f"    return {_indent(body.rstrip().rstrip(','), 4)};",
+        "  }",
+        "}",
+    ]
+    return "\n".join(lines)
+
+_ELEMENT_FIELDS = frozenset(LayoutElement.__dataclass_fields__)
 
 class LayoutHelper:
     """Helper class สำหรับการจัด layout"""
@@ -77,16 +452,63 @@ class LayoutHelper:
     @classmethod
     def create_element(cls, element_type: str, element_id: str, **kwargs) -> LayoutElement:
         """สร้าง LayoutElement ตาม type"""
-        size = cls.ELEMENT_SIZES.get(element_type, {"width": 100.0, "height": 40.0})
+        size = cls.ELEMENT_SIZES.get(element_type, {"width": PLACEHOLDER_WIDTH, "height": PLACEHOLDER_HEIGHT})
+        kwargs.setdefault("width", size["width"] if isinstance(size["width"], (int, float)) else PLACEHOLDER_WIDTH)
+        kwargs.setdefault("height", size["height"] if isinstance(size["height"], (int, float)) else PLACEHOLDER_HEIGHT)
         
         return LayoutElement(
             type=element_type,
             id=element_id,
-            width=size["width"] if isinstance(size["width"], (int, float)) else 100.0,
-            height=size["height"] if isinstance(size["height"], (int, float)) else 40.0,
             **kwargs
         )
     
+    @classmethod
+    def solve_layout(cls, container: LayoutContainer, viewport_width: float,
+                     text_scale: float = 1.0) -> "LayoutResult":
+        """คำนวณ frame (x, y, width, height) ของทุก element สำหรับ viewport ที่กำหนด"""
+        return LayoutSolver.solve(container, viewport_width, text_scale)
+    
+    @classmethod
+    def solve_screen(cls, layout_data: Dict[str, Any], viewport_width: float,
+                     text_scale: float = 1.0) -> List["LayoutResult"]:
+        """คำนวณ frames ของทุก container ใน screen โดยวาง containers ต่อกันในแนวตั้ง"""
+        results = []
+        offset_y = 0.0
+        for container_data in LayoutHelper.layout_containers(layout_data):
+            container = cls.container_from_dict(container_data) if isinstance(container_data, dict) else container_data
+            result = LayoutSolver.solve(container, viewport_width, text_scale).offset(offset_y)
+            results.append(result)
+            offset_y += result.content_height
+        return results
+    
+    @classmethod
+    def evaluate_viewports(cls, layouts: Iterable[Tuple[str, Dict[str, Any]]],
+                           viewports: Optional[List[Tuple[float, float]]] = None,
+                           text_scales: Optional[List[float]] = None) -> Iterator[Dict[str, Any]]:
+        """ตรวจ overflow/clipping ของหลาย screen กับหลาย viewport พร้อมกัน (ต้องมี NumPy) - yield ทีละ screen"""
+        return ViewportEvaluator.iter_evaluate(layouts, viewports, text_scales)
+    
+    @classmethod
+    def container_from_dict(cls, data: Dict[str, Any]) -> LayoutContainer:
+        """แปลง container dict (จาก JSON) เป็น LayoutContainer รวมถึง elements ข้างใน
+        
+        key ที่เป็น metadata (เช่น bbox จาก wireframe_detect) จะถูกข้าม - ตรวจ key ผิดด้วย layout_schema
+        """
+        elements = [
+            LayoutElement(**{k: v for k, v in element.items() if k in _ELEMENT_FIELDS})
+            if isinstance(element, dict) else element
+            for element in data.get("elements", [])
+        ]
+        return LayoutContainer(**{**data, "elements": elements})
+    
+    @staticmethod
+    def layout_containers(layout_data: Dict[str, Any]) -> List[Any]:
+        """containers ของ layout - รองรับทั้ง "containers" และ "layout_structure" (จาก --prepare-layout)"""
+        containers = layout_data.get("containers")
+        if containers is None:
+            containers = layout_data.get("layout_structure", [])
+        return containers
+    
     @classmethod
     def create_form_layout(cls, fields: List[Dict[str, str]]) -> LayoutContainer:
         """สร้าง form layout จาก list ของ fields"""
@@ -206,71 +628,1401 @@ class LayoutHelper:
         }
     
     @classmethod
-    def generate_flutter_column(cls, container: LayoutContainer) -> str:
-        """Generate Flutter Column widget code"""
-        children = []
+    def create_detected_column(cls, elements_detected: List[Any]) -> Dict[str, Any]:
+        """สร้าง column container (dict) จาก elements ที่ detect ได้ - ใช้เป็น layout template ของ --prepare-layout
+        
+        elements_detected เป็นชื่อ type (str) หรือ dict จาก wireframe_detect ที่มี type/bbox ก็ได้
+        """
+        # Group elements into logical containers
+        current_container = {
+            "type": "column",
+            "elements": [],
+            "spacing": 16.0,
+            "alignment": "stretch"
+        }
+        
+        for detected in elements_detected:
+            detected = detected if isinstance(detected, dict) else {"type": detected}
+            element = detected["type"]
+            element_config = {
+                "type": element,
+                "id": f"{element}_{len(current_container['elements'])}",
+                "properties": {}
+            }
+            
+            # Add element-specific properties
+            if element == "profile_image":
+                element_config["properties"] = {
+                    "shape": "circle",
+                    "size": 80,
+                    "placeholder": "person"
+                }
+            elif element == "textfield":
+                element_config["properties"] = {
+                    "label": "Field Label*",
+                    "required": True,
+                    "validation": "required"
+                }
+            elif element == "button":
+                element_config["properties"] = {
+                    "text": "Button Text",
+                    "style": "primary"
+                }
+            
+            if detected.get("properties"):
+                element_config["properties"].update(detected["properties"])
+            if "bbox" in detected:
+                element_config["bbox"] = detected["bbox"]
+            
+            current_container["elements"].append(element_config)
         
+        return current_container
+    
+    @classmethod
+    def generate_element_code(cls, element: LayoutElement, mode: str = "default") -> str:
+        """Generate Flutter code ของ element เดียวผ่าน emitter registry"""
+        emitter = MODE_EMITTERS[mode].get(element.type) or WIDGET_EMITTERS.get(element.type)
+        instrumentation.count("codegen.elements")
+        if emitter is None:
+            return f"// TODO: Implement {element.type} widget"
+        return emitter(element)
+    
+    @staticmethod
+    def column_separator(container: LayoutContainer) -> str:
+        """code ระหว่าง children สองตัวใน Column (ระยะห่างตาม container.spacing)"""
+        spacing_widget = f"SizedBox(height: {container.spacing})," if container.spacing > 0 else ""
+        return f",\n      {spacing_widget}\n      "
+    
+    @staticmethod
+    def iter_column_fragments(container: LayoutContainer, children: Iterable[str]) -> Iterator[str]:
+        """Yield โครง Column ของ container โดยใช้ code ของ children ที่ให้มา"""
+        separator = LayoutHelper.column_separator(container)
+        
+        yield "Column(\n  crossAxisAlignment: CrossAxisAlignment.stretch,\n  children: [\n      "
+        for i, child in enumerate(children):
+            if i:
+                yield separator
+            yield child
+        yield "\n  ],\n)"
+    
+    @classmethod
+    def iter_flutter_column(cls, container: LayoutContainer, mode: str = "default",
+                            lazy_threshold: int = LAZY_LIST_THRESHOLD) -> Iterator[str]:
+        """Yield Flutter Column code ทีละ fragment (ไม่ต้องสร้าง string ทั้งก้อนใน memory)"""
+        if mode == "performance":
+            return cls.iter_performance_column(container, lazy_threshold)
+        return cls.iter_column_fragments(container, map(cls.generate_element_code, container.elements))
+    
+    @classmethod
+    def iter_performance_column(cls, container: LayoutContainer,
+                                lazy_threshold: int = LAZY_LIST_THRESHOLD, nested: bool = False) -> Iterator[str]:
+        """Yield container แบบ performance mode: children เป็น const เท่าที่ทำได้
+        และใช้ ListView.builder (build เฉพาะที่เห็นบนจอ) เมื่อ elements เกิน lazy_threshold
+        
+        nested=True คือ list อยู่ใน scroll view อื่น: ใช้ shrinkWrap และไม่ scroll เอง
+        (ความสูงไม่จำกัดจึงใส่ Expanded ไม่ได้ - แลกกับการ build ทุก item)
+        """
+        children = []
         for element in container.elements:
-            if element.type == "textfield":
-                widget_code = f"""TextFormField(
-  decoration: InputDecoration(
-    labelText: '{element.properties.get("label", "")}',
-    hintText: '{element.properties.get("hint", "")}',
-  ),
-),"""
-            elif element.type == "button":
-                style = element.properties.get("style", "primary")
-                button_type = "ElevatedButton" if style == "primary" else "OutlinedButton"
-                widget_code = f"""{button_type}(
-  onPressed: () {{}},
-  child: Text('{element.properties.get("text", "Button")}'),
-),"""
-            elif element.type == "text":
-                weight = element.properties.get("font_weight", "normal")
-                style_suffix = f".copyWith(fontWeight: FontWeight.{weight})" if weight != "normal" else ""
-                widget_code = f"""Text(
-  '{element.properties.get("text", "")}',
-  style: Theme.of(context).textTheme.bodyMedium{style_suffix},
-),"""
-            elif element.type == "profile_image":
-                widget_code = f"""CircleAvatar(
-  radius: {element.width / 2},
-  backgroundImage: _profileImage != null 
-    ? FileImage(_profileImage!) 
-    : null,
-  child: _profileImage == null 
-    ? Icon(Icons.person, size: {element.width * 0.6}) 
-    : null,
-),"""
+            code = cls.generate_element_code(element, "performance").rstrip().rstrip(",")
+            if code.startswith("//"):
+                code = f"const Placeholder(/* {code[2:].strip()} */)"
+            children.append(code)
+        spacing = f"const SizedBox(height: {container.spacing})" if container.spacing > 0 else None
+        
+        if len(children) > lazy_threshold:
+            yield "ListView.builder(\n"
+            if nested:
+                yield "  shrinkWrap: true,\n  physics: const NeverScrollableScrollPhysics(),\n"
+            yield f"  itemCount: {2 * len(children) - 1 if spacing else len(children)},\n"
+            yield "  itemBuilder: (context, index) {\n"
+            if spacing:
+                # index คี่เป็นระยะห่างระหว่าง elements
+                yield f"    if (index.isOdd) return {spacing};\n"
+            yield f"    return switch ({'index ~/ 2' if spacing else 'index'}) {{\n"
+            for i, child in enumerate(children):
+                yield f"      {i} => {_indent(child, 6)},\n"
+            yield "      _ => const SizedBox.shrink(),\n    };\n  },\n)"
+            return
+        
+        yield "Column(\n  crossAxisAlignment: CrossAxisAlignment.stretch,\n  children: [\n"
+        for i, child in enumerate(children):
+            if i and spacing:
+                yield f"    {spacing},\n"
+            yield f"    {_indent(child, 4)},\n"
+        yield "  ],\n)"
+    
+    @classmethod
+    def iter_performance_widgets(cls, layout_data: Dict[str, Any],
+                                 lazy_threshold: int = LAZY_LIST_THRESHOLD) -> Iterator[str]:
+        """Yield screen แบบ performance mode: แต่ละ container เป็น StatelessWidget แยก
+        
+        section ที่ไม่อ้าง State เป็น const จึงไม่ถูก rebuild เมื่อ State ของ screen เปลี่ยน
+        
+        section ที่เกิน lazy_threshold ถูกห่อด้วย Expanded ซึ่งใช้ได้เมื่อ Column ของ screen มีความสูงจำกัด
+        (เช่นเป็น body ของ Scaffold) - ถ้า layout มี "scrollable": true (screen อยู่ใน SingleChildScrollView)
+        จะใช้ ListView.builder แบบ shrinkWrap แทน
+        """
+        screen_id = str(layout_data.get("screen_id") or "layout")
+        scrollable = bool(layout_data.get("scrollable"))
+        prefix = "_" + "".join(part.capitalize() for part in re.split(r"[^0-9A-Za-z]+", screen_id) if part)
+        
+        uses = []
+        classes = []
+        containers = [c for c in LayoutHelper.layout_containers(layout_data) if isinstance(c, dict)]
+        for i, container_data in enumerate(containers, 1):
+            container = cls.container_from_dict(container_data)
+            body = "".join(cls.iter_performance_column(container, lazy_threshold, scrollable))
+            state = sorted({f"_{m}" for m in _STATE_MEMBER_RE.findall(body)})
+            name = f"{prefix}Section{i}"
+            
+            arguments = ", ".join(f"{member[1:]}: {member}" for member in state)
+            use = f"{name}({arguments})" if state else f"const {name}()"
+            if len(container.elements) > lazy_threshold and not scrollable:
+                # ListView ใน Column ต้องมีความสูงจำกัด
+                use = f"Expanded(child: {use})"
+            uses.append(use)
+            
+            fields = [(STATE_MEMBER_TYPES.get(member, "dynamic"), member[1:]) for member in state]
+            classes.append(stateless_widget_source(name, fields, _STATE_MEMBER_RE.sub(r"\1", body)))
+        
+        yield "Column(\n  crossAxisAlignment: CrossAxisAlignment.stretch,\n  children: [\n"
+        for use in uses:
+            yield f"    {use},\n"
+        yield "  ],\n)"
+        for source in classes:
+            yield "\n\n"
+            yield source
+    
+    @classmethod
+    def iter_flutter_widgets(cls, layout_data: Dict[str, Any], mode: str = "default",
+                             lazy_threshold: int = LAZY_LIST_THRESHOLD) -> Iterator[str]:
+        """Yield Flutter code ของทุก container ทีละ fragment"""
+        if mode == "performance":
+            yield from cls.iter_performance_widgets(layout_data, lazy_threshold)
+            return
+        first = True
+        for container_data in LayoutHelper.layout_containers(layout_data):
+            if isinstance(container_data, dict):
+                if not first:
+                    yield "\n\n"
+                first = False
+                yield from cls.iter_flutter_column(cls.container_from_dict(container_data))
+    
+    @staticmethod
+    def write_fragments(fragments: Iterable[str], stream: TextIO) -> int:
+        """เขียน fragments ลง file handle ทันที คืนจำนวนตัวอักษรที่เขียน"""
+        written = 0
+        if instrumentation.ENABLED:
+            encoded = 0
+            for fragment in fragments:
+                written += stream.write(fragment)
+                encoded += len(fragment.encode('utf-8'))
+            instrumentation.count("codegen.bytes_written", encoded)
+            return written
+        for fragment in fragments:
+            written += stream.write(fragment)
+        return written
+    
+    @classmethod
+    def write_flutter_column(cls, container: LayoutContainer, stream: TextIO, mode: str = "default",
+                             lazy_threshold: int = LAZY_LIST_THRESHOLD) -> int:
+        """เขียน Flutter Column code ลง stream แบบ streaming"""
+        return cls.write_fragments(cls.iter_flutter_column(container, mode, lazy_threshold), stream)
+    
+    @classmethod
+    def write_flutter_widgets(cls, layout_data: Dict[str, Any], stream: TextIO, mode: str = "default",
+                              lazy_threshold: int = LAZY_LIST_THRESHOLD) -> int:
+        """เขียน Flutter widget code ของทุก container ลง stream แบบ streaming"""
+        instrumentation.count("codegen.screens")
+        with instrumentation.stage("codegen.screen"):
+            return cls.write_fragments(cls.iter_flutter_widgets(layout_data, mode, lazy_threshold), stream)
+    
+    @classmethod
+    def generate_flutter_column(cls, container: LayoutContainer, mode: str = "default",
+                                lazy_threshold: int = LAZY_LIST_THRESHOLD) -> str:
+        """Generate Flutter Column widget code"""
+        return "".join(cls.iter_flutter_column(container, mode, lazy_threshold))
+    
+    @classmethod
+    def generate_flutter_widgets(cls, layout_data: Dict[str, Any], mode: str = "default",
+                                 lazy_threshold: int = LAZY_LIST_THRESHOLD) -> str:
+        """Generate complete Flutter widget code from layout data"""
+        instrumentation.count("codegen.screens")
+        with instrumentation.stage("codegen.screen"):
+            return "".join(cls.iter_flutter_widgets(layout_data, mode, lazy_threshold))
+    
+    @classmethod
+    def generate_shared_widgets(cls, layouts: Iterable[Dict[str, Any]], min_uses: int = 2) -> Tuple[str, Dict[str, Any]]:
+        """Generate Flutter code ของหลาย layouts โดยแยก subtree ที่ซ้ำกันเป็น StatelessWidget ที่ใช้ร่วมกัน
+        
+        คืน (code, report ของ bytes ที่ลดได้)
+        """
+        extractor = SharedWidgetExtractor(min_uses)
+        for layout_data in layouts:
+            for container_data in LayoutHelper.layout_containers(layout_data):
+                if isinstance(container_data, dict):
+                    extractor.add(cls.container_from_dict(container_data))
+        return extractor.generate()
+
+class LayoutFrame(NamedTuple):
+    """ตำแหน่งและขนาดของ element หลังคำนวณ layout"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+@dataclass
+class LayoutResult:
+    """ผลลัพธ์ของ LayoutSolver สำหรับ container หนึ่งใน viewport หนึ่ง"""
+    container_type: str
+    viewport_width: float
+    text_scale: float
+    ids: List[str]
+    frames: List[LayoutFrame]
+    content_width: float
+    content_height: float
+    overflow: List[str]  # ids ของ elements ที่ล้นความกว้าง viewport
+    
+    def frame(self, element_id: str) -> Optional[LayoutFrame]:
+        for i, frame in zip(self.ids, self.frames):
+            if i == element_id:
+                return frame
+        return None
+    
+    def offset(self, dy: float) -> "LayoutResult":
+        if not dy:
+            return self
+        frames = [LayoutFrame(f.x, f.y + dy, f.width, f.height) for f in self.frames]
+        return replace(self, frames=frames)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "container_type": self.container_type,
+            "viewport_width": self.viewport_width,
+            "text_scale": self.text_scale,
+            "frames": {i: f._asdict() for i, f in zip(self.ids, self.frames)},
+            "content_width": self.content_width,
+            "content_height": self.content_height,
+            "overflow": self.overflow,
+        }
+
+class LayoutSolver:
+    """คำนวณ frames ของ column/row/stack จาก SPACING, margin, padding และ alignment
+    
+    วัดขนาดตาม LayoutHelper.ELEMENT_SIZES: match_parent ขยายเต็มพื้นที่, wrap_content
+    ประมาณจากความยาวข้อความ (text) ทุก container ใช้เวลา O(จำนวน elements)
+    ผลลัพธ์ถูก cache ตาม (โครงสร้าง container, viewport, text scale)
+    """
+    
+    FONT_SIZE = 14.0         # bodyMedium
+    LINE_HEIGHT = 20.0       # bodyMedium line height
+    CHAR_WIDTH_EM = 0.55     # ความกว้างเฉลี่ยของตัวอักษรเทียบกับ font size
+    CACHE_SIZE = 1024
+    
+    _cache: "OrderedDict[tuple, LayoutResult]" = OrderedDict()
+    
+    @staticmethod
+    def element_text(element: Any) -> str:
+        return str(element.properties.get("text") or element.properties.get("label") or "")
+    
+    @classmethod
+    def size_modes(cls, element: Any) -> Tuple[Any, Any]:
+        """คืน (width, height) เป็นตัวเลขหรือ 'match_parent' / 'wrap_content'
+        
+        ค่า symbolic ใน ELEMENT_SIZES ใช้เฉพาะเมื่อ element ยังมีขนาด default ที่
+        create_element ให้ไว้ (ถ้าถูกกำหนดขนาดเองจะถือเป็นขนาดตายตัว)
+        """
+        size = LayoutHelper.ELEMENT_SIZES.get(element.type)
+        if not size:
+            return element.width, element.height
+        
+        width, height = size["width"], size["height"]
+        default_size = (
+            PLACEHOLDER_WIDTH if isinstance(width, str) else width,
+            PLACEHOLDER_HEIGHT if isinstance(height, str) else height,
+        )
+        if (element.width, element.height) != default_size:
+            return element.width, element.height
+        return width, height
+    
+    @classmethod
+    def measure(cls, element: Any, max_width: float, text_scale: float) -> Tuple[float, float, bool]:
+        """คืน (width, height, flex) - flex = True ถ้า width เป็น match_parent"""
+        width_mode, height_mode = cls.size_modes(element)
+        padding = insets_from_value(element.padding, DEFAULT_ELEMENT_PADDING)
+        pad_x = padding[2] + padding[3]
+        pad_y = padding[0] + padding[1]
+        max_width = max(max_width, 0.0)
+        lines = 1
+        
+        if width_mode == "match_parent":
+            width = max_width
+        elif width_mode == "wrap_content":
+            if element.type == "text":
+                text_width = len(cls.element_text(element)) * cls.FONT_SIZE * cls.CHAR_WIDTH_EM * text_scale
+                content_width = max(max_width - pad_x, 1.0)
+                lines = max(1, math.ceil(text_width / content_width))
+                width = min(text_width + pad_x, max_width)
+            else:
+                width = min(PLACEHOLDER_WIDTH + pad_x, max_width)
+        else:
+            width = float(width_mode)
+        
+        if height_mode == "wrap_content" or height_mode == "match_parent":
+            if element.type == "text":
+                height = lines * cls.LINE_HEIGHT * text_scale + pad_y
             else:
-                widget_code = f"// TODO: Implement {element.type} widget"
+                height = PLACEHOLDER_HEIGHT + pad_y
+        else:
+            height = float(height_mode)
+        
+        return width, height, width_mode == "match_parent"
+    
+    @staticmethod
+    def signature(container: Any, viewport_width: float, text_scale: float) -> tuple:
+        return (
+            container.type, container.spacing, container.alignment,
+            insets_from_value(container.padding, DEFAULT_CONTAINER_PADDING),
+            viewport_width, text_scale,
+            tuple(
+                (e.type, e.id, e.width, e.height, e.alignment,
+                 insets_from_value(e.margin, DEFAULT_ELEMENT_MARGIN),
+                 insets_from_value(e.padding, DEFAULT_ELEMENT_PADDING),
+                 LayoutSolver.element_text(e))
+                for e in container.elements
+            ),
+        )
+    
+    @classmethod
+    def solve(cls, container: Any, viewport_width: float, text_scale: float = 1.0) -> LayoutResult:
+        key = cls.signature(container, viewport_width, text_scale)
+        cached = cls._cache.get(key)
+        if cached is not None:
+            cls._cache.move_to_end(key)
+            return cached
+        
+        if container.type == "row":
+            result = cls._solve_row(container, viewport_width, text_scale)
+        elif container.type == "stack":
+            result = cls._solve_stack(container, viewport_width, text_scale)
+        else:
+            result = cls._solve_column(container, viewport_width, text_scale)
+        
+        cls._cache[key] = result
+        if len(cls._cache) > cls.CACHE_SIZE:
+            cls._cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _cross_offset(alignment: str, free: float) -> float:
+        if alignment in ("center", "spaceEvenly", "spaceAround", "spaceBetween"):
+            return free / 2
+        if alignment in ("right", "end", "bottom"):
+            return free
+        return 0.0
+    
+    @classmethod
+    def _result(cls, container: Any, viewport_width: float, text_scale: float, ids: List[str],
+                frames: List[LayoutFrame], margins: List[Insets], content_width: float,
+                content_height: float) -> LayoutResult:
+        overflow = [
+            element_id for element_id, frame, margin in zip(ids, frames, margins)
+            if frame.x < 0 or frame.width < 0 or frame.x + frame.width + margin[3] > viewport_width + 1e-6
+        ]
+        return LayoutResult(container.type, viewport_width, text_scale, ids, frames,
+                            content_width, content_height, overflow)
+    
+    @classmethod
+    def _solve_column(cls, container: Any, viewport_width: float, text_scale: float) -> LayoutResult:
+        pad_top, pad_bottom, pad_left, pad_right = insets_from_value(container.padding, DEFAULT_CONTAINER_PADDING)
+        inner_width = viewport_width - pad_left - pad_right
+        stretch = container.alignment == "stretch"
+        ids, frames, margins = [], [], []
+        y = pad_top
+        content_width = 0.0
+        
+        for i, element in enumerate(container.elements):
+            margin = insets_from_value(element.margin, DEFAULT_ELEMENT_MARGIN)
+            slot_width = inner_width - margin[2] - margin[3]
+            width, height, _ = cls.measure(element, slot_width, text_scale)
+            if stretch:
+                width = max(slot_width, 0.0)
+            
+            if i:
+                y += container.spacing
+            y += margin[0]
+            x = pad_left + margin[2] + cls._cross_offset(container.alignment, slot_width - width)
             
-            children.append(widget_code)
+            ids.append(element.id)
+            frames.append(LayoutFrame(x, y, width, height))
+            margins.append(margin)
+            content_width = max(content_width, x + width + margin[3] + pad_right)
+            y += height + margin[1]
         
-        spacing_widget = f"SizedBox(height: {container.spacing})," if container.spacing > 0 else ""
-        children_str = f",\n      {spacing_widget}\n      ".join(children)
+        return cls._result(container, viewport_width, text_scale, ids, frames, margins,
+                           content_width, y + pad_bottom)
+    
+    @classmethod
+    def _solve_row(cls, container: Any, viewport_width: float, text_scale: float) -> LayoutResult:
+        pad_top, pad_bottom, pad_left, pad_right = insets_from_value(container.padding, DEFAULT_CONTAINER_PADDING)
+        inner_width = viewport_width - pad_left - pad_right
+        elements = list(container.elements)
+        count = len(elements)
+        
+        # pass 1: วัดขนาด element ที่ไม่ flex และนับ flex
+        measured = []
+        used = container.spacing * max(count - 1, 0)
+        flex_count = 0
+        for element in elements:
+            margin = insets_from_value(element.margin, DEFAULT_ELEMENT_MARGIN)
+            width, height, flex = cls.measure(element, inner_width - margin[2] - margin[3], text_scale)
+            measured.append((element, margin, width, height, flex))
+            used += margin[2] + margin[3]
+            if flex:
+                flex_count += 1
+            else:
+                used += width
+        
+        free = inner_width - used
+        flex_width = max(free, 0.0) / flex_count if flex_count else 0.0
+        if flex_count:
+            free = min(free, 0.0)
+        
+        gap = container.spacing
+        x = pad_left
+        if container.alignment == "spaceEvenly" and count:
+            x += max(free, 0.0) / (count + 1)
+            gap += max(free, 0.0) / (count + 1)
+        elif container.alignment == "spaceBetween" and count > 1:
+            gap += max(free, 0.0) / (count - 1)
+        elif container.alignment == "spaceAround" and count:
+            x += max(free, 0.0) / (count * 2)
+            gap += max(free, 0.0) / count
+        else:
+            x += cls._cross_offset(container.alignment, max(free, 0.0))
+        
+        row_height = max((h + m[0] + m[1] for _, m, _, h, _ in measured), default=0.0)
+        
+        # pass 2: วางตำแหน่ง
+        ids, frames, margins = [], [], []
+        for i, (element, margin, width, height, flex) in enumerate(measured):
+            if flex:
+                width = flex_width
+            if i:
+                x += gap
+            x += margin[2]
+            y = pad_top + margin[0] + cls._cross_offset(element.alignment, row_height - height - margin[0] - margin[1])
+            ids.append(element.id)
+            frames.append(LayoutFrame(x, y, width, height))
+            margins.append(margin)
+            x += width + margin[3]
+        
+        return cls._result(container, viewport_width, text_scale, ids, frames, margins,
+                           x + pad_right, pad_top + row_height + pad_bottom)
+    
+    @classmethod
+    def _solve_stack(cls, container: Any, viewport_width: float, text_scale: float) -> LayoutResult:
+        pad_top, pad_bottom, pad_left, pad_right = insets_from_value(container.padding, DEFAULT_CONTAINER_PADDING)
+        inner_width = viewport_width - pad_left - pad_right
+        ids, frames, margins = [], [], []
+        content_width = 0.0
+        content_height = pad_top + pad_bottom
         
-        return f"""Column(
-  crossAxisAlignment: CrossAxisAlignment.stretch,
-  children: [
-      {children_str}
-  ],
-)"""
+        for element in container.elements:
+            margin = insets_from_value(element.margin, DEFAULT_ELEMENT_MARGIN)
+            slot_width = inner_width - margin[2] - margin[3]
+            width, height, _ = cls.measure(element, slot_width, text_scale)
+            x = pad_left + margin[2] + cls._cross_offset(element.alignment, slot_width - width)
+            y = pad_top + margin[0]
+            ids.append(element.id)
+            frames.append(LayoutFrame(x, y, width, height))
+            margins.append(margin)
+            content_width = max(content_width, x + width + margin[3] + pad_right)
+            content_height = max(content_height, y + height + margin[1] + pad_bottom)
+        
+        return cls._result(container, viewport_width, text_scale, ids, frames, margins,
+                           content_width, content_height)
 
+class ViewportEvaluator:
+    """ประเมิน layout ของหลาย screen กับหลาย viewport/text scale พร้อมกันด้วย NumPy
+    
+    ใช้กติกาเดียวกับ LayoutSolver แต่ pack ขนาด, insets และ spacing ของ elements
+    เป็น arrays แล้วคำนวณ frames ของทุก viewport ในครั้งเดียว (shape: viewports x elements)
+    """
+    
+    DEVICE_SIZES = [
+        (320, 568), (360, 640), (360, 780), (375, 667), (375, 812), (390, 844),
+        (393, 852), (412, 915), (414, 896), (428, 926), (600, 960), (768, 1024),
+    ]
+    TEXT_SCALES = [1.0, 1.15, 1.3, 2.0]
+    
+    _WIDTH_FIXED, _WIDTH_MATCH, _WIDTH_WRAP_TEXT, _WIDTH_WRAP = range(4)
+    
+    @staticmethod
+    def _alignment_factor(alignment: str) -> float:
+        return LayoutSolver._cross_offset(alignment, 1.0)
+    
     @classmethod
-    def generate_flutter_widgets(cls, layout_data: Dict[str, Any]) -> str:
-        """Generate complete Flutter widget code from layout data"""
-        # Extract layout containers
-        containers = layout_data.get("containers", [])
+    def pack(cls, container: Any) -> Dict[str, Any]:
+        """Pack elements ของ container เป็น NumPy arrays (ทำครั้งเดียวต่อ container)"""
+        import numpy as np
         
-        widget_code = []
+        elements = list(container.elements)
+        count = len(elements)
+        width_mode = np.zeros(count, dtype=np.int8)
+        height_wrap = np.zeros(count, dtype=bool)
+        fixed = np.zeros((count, 2))
+        text_width = np.zeros(count)
+        is_text = np.zeros(count, dtype=bool)
+        has_text = np.zeros(count, dtype=bool)
+        margins = np.zeros((count, 4))
+        paddings = np.zeros((count, 4))
+        align = np.zeros(count)
         
-        for container_data in containers:
-            if isinstance(container_data, dict):
-                container = LayoutContainer(**container_data)
-                widget_code.append(cls.generate_flutter_column(container))
+        for i, element in enumerate(elements):
+            w_mode, h_mode = LayoutSolver.size_modes(element)
+            text = LayoutSolver.element_text(element)
+            is_text[i] = element.type == "text"
+            if w_mode == "match_parent":
+                width_mode[i] = cls._WIDTH_MATCH
+            elif w_mode == "wrap_content":
+                width_mode[i] = cls._WIDTH_WRAP_TEXT if is_text[i] else cls._WIDTH_WRAP
+            else:
+                fixed[i, 0] = w_mode
+            if isinstance(h_mode, str):
+                height_wrap[i] = True
+            else:
+                fixed[i, 1] = h_mode
+            if is_text[i]:
+                text_width[i] = len(text) * LayoutSolver.FONT_SIZE * LayoutSolver.CHAR_WIDTH_EM
+            has_text[i] = bool(text) and element.type in ("text", "button", "textfield")
+            margins[i] = insets_from_value(element.margin, DEFAULT_ELEMENT_MARGIN)
+            paddings[i] = insets_from_value(element.padding, DEFAULT_ELEMENT_PADDING)
+            align[i] = cls._alignment_factor(element.alignment)
+        
+        return {
+            "type": container.type,
+            "alignment": container.alignment,
+            "spacing": float(container.spacing),
+            "padding": insets_from_value(container.padding, DEFAULT_CONTAINER_PADDING),
+            "ids": [element.id for element in elements],
+            "width_mode": width_mode,
+            "height_wrap": height_wrap,
+            "fixed": fixed,
+            "text_width": text_width,
+            "is_text": is_text,
+            "has_text": has_text,
+            "margins": margins,
+            "paddings": paddings,
+            "align": align,
+        }
+    
+    @classmethod
+    def _measure(cls, packed: Dict[str, Any], max_width, scale):
+        """วัดขนาดแบบ vectorized - max_width shape (V, E), scale shape (V, 1)"""
+        import numpy as np
+        
+        mode = packed["width_mode"]
+        paddings = packed["paddings"]
+        pad_x = paddings[:, 2] + paddings[:, 3]
+        pad_y = paddings[:, 0] + paddings[:, 1]
+        max_width = np.maximum(max_width, 0.0)
+        
+        text_width = packed["text_width"] * scale
+        content_width = np.maximum(max_width - pad_x, 1.0)
+        is_wrap_text = mode == cls._WIDTH_WRAP_TEXT
+        lines = np.where(is_wrap_text, np.maximum(1.0, np.ceil(text_width / content_width)), 1.0)
+        
+        width = np.select(
+            [mode == cls._WIDTH_MATCH, is_wrap_text, mode == cls._WIDTH_WRAP],
+            [max_width, np.minimum(text_width + pad_x, max_width),
+             np.minimum(PLACEHOLDER_WIDTH + pad_x, max_width)],
+            default=np.broadcast_to(packed["fixed"][:, 0], max_width.shape),
+        )
+        wrap_height = np.where(packed["is_text"], lines * LayoutSolver.LINE_HEIGHT * scale, PLACEHOLDER_HEIGHT) + pad_y
+        height = np.where(packed["height_wrap"], wrap_height, packed["fixed"][:, 1])
+        
+        # ข้อความใน element ที่สูงตายตัว (button/textfield) ถูกตัดถ้า line height เกินพื้นที่
+        clipped = packed["has_text"] & ~packed["height_wrap"] & (
+            LayoutSolver.LINE_HEIGHT * scale > height - pad_y + 1e-6
+        )
+        return width, height, clipped
+    
+    @classmethod
+    def evaluate_container(cls, packed: Dict[str, Any], widths, scales) -> Dict[str, Any]:
+        """คำนวณ frames ของ container สำหรับทุก viewport - widths/scales shape (V,)"""
+        import numpy as np
+        
+        W = np.asarray(widths, dtype=float)[:, None]
+        S = np.asarray(scales, dtype=float)[:, None]
+        pad_top, pad_bottom, pad_left, pad_right = packed["padding"]
+        margins = packed["margins"]
+        m_top, m_bottom, m_left, m_right = margins[:, 0], margins[:, 1], margins[:, 2], margins[:, 3]
+        count = len(packed["ids"])
+        spacing = packed["spacing"]
+        inner = W - pad_left - pad_right
+        
+        if count == 0:
+            empty = np.zeros((len(W), 0))
+            return {"x": empty, "y": empty, "width": empty, "height": empty,
+                    "content_height": np.full(len(W), pad_top + pad_bottom),
+                    "overflow": empty.astype(bool), "clipped": empty.astype(bool)}
+        
+        slot = inner - m_left - m_right
+        width, height, clipped = cls._measure(packed, slot, S)
+        height = np.broadcast_to(height, width.shape)
+        
+        if packed["type"] == "row":
+            flex = packed["width_mode"] == cls._WIDTH_MATCH
+            flex_count = int(flex.sum())
+            used = (spacing * (count - 1) + (m_left + m_right).sum()
+                    + np.where(flex, 0.0, width).sum(axis=1, keepdims=True))
+            free = inner - used
+            if flex_count:
+                width = np.where(flex, np.maximum(free, 0.0) / flex_count, width)
+                free = np.minimum(free, 0.0)
+            
+            free_pos = np.maximum(free, 0.0)
+            alignment = packed["alignment"]
+            start = np.full_like(W, float(pad_left))
+            gap = np.full_like(W, spacing)
+            if alignment == "spaceEvenly":
+                start = start + free_pos / (count + 1)
+                gap = gap + free_pos / (count + 1)
+            elif alignment == "spaceBetween" and count > 1:
+                gap = gap + free_pos / (count - 1)
+            elif alignment == "spaceAround":
+                start = start + free_pos / (count * 2)
+                gap = gap + free_pos / count
+            else:
+                start = start + cls._alignment_factor(alignment) * free_pos
+            
+            advance = m_left + width + m_right
+            before = np.cumsum(advance, axis=1) - advance
+            x = start + before + np.arange(count) * gap + m_left
+            row_height = (height + m_top + m_bottom).max(axis=1, keepdims=True)
+            y = pad_top + m_top + packed["align"] * (row_height - height - m_top - m_bottom)
+            content_height = (pad_top + row_height + pad_bottom)[:, 0]
+        elif packed["type"] == "stack":
+            x = pad_left + m_left + packed["align"] * (slot - width)
+            y = np.broadcast_to(pad_top + m_top, width.shape)
+            content_height = (y + height + m_bottom).max(axis=1) + pad_bottom
+        else:
+            if packed["alignment"] == "stretch":
+                width = np.maximum(slot, 0.0)
+            x = pad_left + m_left + cls._alignment_factor(packed["alignment"]) * (slot - width)
+            advance = m_top + height + m_bottom
+            before = np.cumsum(advance, axis=1) - advance
+            y = pad_top + before + np.arange(count) * spacing + m_top
+            content_height = pad_top + advance.sum(axis=1) + spacing * (count - 1) + pad_bottom
+        
+        overflow = (x < 0) | (width < 0) | (x + width + m_right > W + 1e-6)
+        return {"x": x, "y": y, "width": width, "height": height,
+                "content_height": content_height, "overflow": overflow, "clipped": clipped}
+    
+    @classmethod
+    def evaluate(cls, layouts: Iterable[Tuple[str, Dict[str, Any]]],
+                 viewports: Optional[List[Tuple[float, float]]] = None,
+                 text_scales: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """คืน report ต่อ screen: viewport/text scale ที่มี overflow หรือ clipping"""
+        return list(cls.iter_evaluate(layouts, viewports, text_scales))
+    
+    @classmethod
+    def iter_evaluate(cls, layouts: Iterable[Tuple[str, Dict[str, Any]]],
+                      viewports: Optional[List[Tuple[float, float]]] = None,
+                      text_scales: Optional[List[float]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield report ทีละ screen (อ่าน layouts แบบ streaming ได้)"""
+        import numpy as np
+        
+        viewports = viewports or cls.DEVICE_SIZES
+        text_scales = text_scales or cls.TEXT_SCALES
+        combos = [(float(w), float(h), float(scale)) for w, h in viewports for scale in text_scales]
+        widths = np.array([c[0] for c in combos])
+        heights = np.array([c[1] for c in combos])
+        scales = np.array([c[2] for c in combos])
+        
+        for screen_id, layout_data in layouts:
+            total_height = np.zeros(len(combos))
+            issues = [{"overflow": [], "clipped": []} for _ in combos]
+            
+            for container_data in LayoutHelper.layout_containers(layout_data):
+                container = (LayoutHelper.container_from_dict(container_data)
+                             if isinstance(container_data, dict) else container_data)
+                packed = cls.pack(container)
+                result = cls.evaluate_container(packed, widths, scales)
+                total_height += result["content_height"]
+                ids = packed["ids"]
+                for v, e in zip(*np.nonzero(result["overflow"])):
+                    issues[v]["overflow"].append(ids[e])
+                for v, e in zip(*np.nonzero(result["clipped"])):
+                    issues[v]["clipped"].append(ids[e])
+            
+            problems = [
+                {
+                    "viewport": [w, h],
+                    "text_scale": scale,
+                    "overflow": issues[v]["overflow"],
+                    "clipped": issues[v]["clipped"],
+                    "content_height": float(total_height[v]),
+                }
+                for v, (w, h, scale) in enumerate(combos)
+                if issues[v]["overflow"] or issues[v]["clipped"]
+            ]
+            
+            yield {
+                "screen_id": screen_id,
+                "viewports_checked": len(combos),
+                "max_content_height": float(total_height.max()) if combos else 0.0,
+                "scrolls_on": [list(combos[v]) for v in np.nonzero(total_height > heights)[0]],
+                "problems": problems,
+            }
+
+# property ที่เป็นเนื้อหา (ไม่ใช่โครงสร้าง) - ค่าที่ต่างกันจะกลายเป็น parameter ของ shared widget
+SHARED_WIDGET_PARAMETERS = ("label", "hint", "text")
+# private State members ที่ template อ้างถึง - StatelessWidget มองไม่เห็น จึงต้องส่งเข้าไปเป็น field
+STATE_MEMBER_TYPES = {"_profileImage": "File?"}
+SHARED_WIDGETS_HEADER = "// Shared widgets (generated by layout_helper.py --dedupe)"
+# element ที่ต่อจาก Text style "label" แล้วนับเป็นคู่ label + field (แยกเป็น widget เดียวกันได้)
+LABELED_FIELD_TYPES = frozenset({"textfield"})
+
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+_STATE_MEMBER_RE = re.compile(r"(?<![\w.$])_([A-Za-z]\w*)")
+
+@dataclass
+class SharedWidgetNode:
+    """subtree หนึ่งแบบหลัง hash-consing (element, pair หรือ column) พร้อม arguments ของทุกจุดที่ใช้"""
+    kind: str
+    base_name: str
+    template: str = ""
+    params: Tuple[str, ...] = ()
+    state: Tuple[str, ...] = ()
+    children: Tuple[int, ...] = ()
+    container: Optional[LayoutContainer] = None
+    uses: List[Dict[str, str]] = None
+    varying: Tuple[str, ...] = ()
+    name: Optional[str] = None
+    
+    def __post_init__(self):
+        if self.uses is None:
+            self.uses = []
+
+def _varying_params(params: Iterable[str], uses: List[Dict[str, str]]) -> Tuple[str, ...]:
+    """parameter ที่ค่าไม่เหมือนกันทุกจุดที่ใช้ (ค่าที่เหมือนกันหมดจะถูกฝังใน widget เลย)"""
+    return tuple(p for p in params if any(use[p] != uses[0][p] for use in uses[1:]))
+
+def _fill(template: str, values: Mapping[str, str]) -> str:
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+def _state_field(member: str) -> str:
+    return member[1:]
+
+class SharedWidgetExtractor:
+    """Hash-cons subtree ที่ซ้ำกันใน LayoutContainer หลายตัว แล้ว emit แต่ละแบบครั้งเดียวเป็น StatelessWidget
+    
+    element ที่ต่างกันแค่ข้อความ (label/hint/text) ถือเป็นโครงสร้างเดียวกัน, Text label + field ที่ติดกัน
+    เป็น pair (ใช้ซ้ำข้าม form ที่ fields ต่างกันได้) และ column ที่ children มีโครงสร้างเดียวกันจะถูกแยกเป็น
+    widget ทั้งก้อน (เช่น profile header, button row)
+    """
+    
+    def __init__(self, min_uses: int = 2, class_prefix: str = "Shared"):
+        self.min_uses = min_uses
+        self.class_prefix = class_prefix
+        # element และ pair nodes - children ของ column/pair อ้างถึง index ใน list นี้
+        self.element_nodes: List[SharedWidgetNode] = []
+        self.column_nodes: List[SharedWidgetNode] = []
+        self._element_keys: Dict[Any, int] = {}
+        self._column_keys: Dict[tuple, int] = {}
+        # (column node, arguments ของ container นั้น) ตามลำดับที่ add
+        self.instances: List[Tuple[int, Dict[str, str]]] = []
+    
+    @staticmethod
+    def element_shape(element: LayoutElement) -> Tuple[str, Dict[str, str]]:
+        """คืน (template, arguments) - template คือ code ของ element ที่ค่า parameter ถูกแทนด้วย ${name}"""
+        sentinels = {}
+        properties = dict(element.properties)
+        for key in SHARED_WIDGET_PARAMETERS:
+            if isinstance(properties.get(key), str):
+                sentinels[key] = f"\x00{key}\x00"
+                properties[key] = sentinels[key]
+        code = LayoutHelper.generate_element_code(replace(element, properties=properties))
+        
+        arguments = {}
+        for key, sentinel in sentinels.items():
+            if sentinel in code:
+                code = code.replace(sentinel, "${" + key + "}")
+                arguments[key] = element.properties[key]
+        return code, arguments
+    
+    @staticmethod
+    def _param_name(node: SharedWidgetNode, param: str, i: int) -> str:
+        """ชื่อ parameter ของ child ลำดับ i ใน node - column: label0, text1 / pair: labelText (Text label), hint"""
+        if node.kind == "pair":
+            return f"label{param.capitalize()}" if i == 0 else param
+        return f"{param}{i}"
+    
+    def _element_node(self, element: LayoutElement) -> Tuple[int, Dict[str, str]]:
+        template, element_arguments = self.element_shape(element)
+        index = self._element_keys.get(template)
+        if index is None:
+            index = self._element_keys[template] = len(self.element_nodes)
+            self.element_nodes.append(SharedWidgetNode(
+                kind="element",
+                base_name="".join(part.capitalize() for part in element.type.split("_")),
+                template=template,
+                params=tuple(element_arguments),
+                state=tuple(sorted({f"_{m}" for m in _STATE_MEMBER_RE.findall(template)})),
+            ))
+        return index, element_arguments
+    
+    def _pair_node(self, label: int, field: int, spacing: float) -> int:
+        """node ของ Text label + field ที่ติดกัน - inline เหมือนเดิม แต่ถ้าแยกเป็น widget จะห่อด้วย Column"""
+        key = ("pair", spacing, label, field)
+        index = self._element_keys.get(key)
+        if index is None:
+            index = self._element_keys[key] = len(self.element_nodes)
+            node = SharedWidgetNode(
+                kind="pair",
+                base_name=f"Labeled{self.element_nodes[field].base_name}",
+                state=tuple(sorted(set(self.element_nodes[label].state) | set(self.element_nodes[field].state))),
+                children=(label, field),
+                container=LayoutContainer(type="column", elements=[], spacing=spacing),
+            )
+            node.params = tuple(self._param_name(node, p, i) for i, child in enumerate(node.children)
+                                for p in self.element_nodes[child].params)
+            self.element_nodes.append(node)
+        return index
+    
+    @staticmethod
+    def _starts_labeled_field(elements: List[LayoutElement], i: int) -> bool:
+        element = elements[i]
+        return (element.type == "text" and element.properties.get("style") == "label"
+                and i + 1 < len(elements) and elements[i + 1].type in LABELED_FIELD_TYPES)
+    
+    def add(self, container: LayoutContainer) -> None:
+        shapes = [self._element_node(element) for element in container.elements]
+        children = []
+        arguments = {}
+        i = 0
+        while i < len(shapes):
+            index, child_arguments = shapes[i]
+            if self._starts_labeled_field(container.elements, i):
+                field, field_arguments = shapes[i + 1]
+                index = self._pair_node(index, field, container.spacing)
+                pair = self.element_nodes[index]
+                child_arguments = {
+                    **{self._param_name(pair, p, 0): value for p, value in child_arguments.items()},
+                    **{self._param_name(pair, p, 1): value for p, value in field_arguments.items()},
+                }
+                i += 1
+            arguments.update((f"{p}{len(children)}", value) for p, value in child_arguments.items())
+            children.append(index)
+            i += 1
+        
+        # code ของ container ขึ้นกับ separator และ children เท่านั้น (type/alignment/padding ไม่ได้ถูก emit)
+        key = (LayoutHelper.column_separator(container), tuple(children))
+        index = self._column_keys.get(key)
+        if index is None:
+            index = self._column_keys[key] = len(self.column_nodes)
+            self.column_nodes.append(SharedWidgetNode(
+                kind="column",
+                # ตั้งชื่อตาม widget ที่ emit จริง (ทุก container emit เป็น Column)
+                base_name="Column",
+                params=tuple(f"{p}{i}" for i, child in enumerate(children) for p in self.element_nodes[child].params),
+                state=tuple(sorted({m for child in children for m in self.element_nodes[child].state})),
+                children=tuple(children),
+                container=container,
+            ))
+        self.column_nodes[index].uses.append(arguments)
+        self.instances.append((index, arguments))
+    
+    def _split(self, node: SharedWidgetNode, fragments: Dict[str, str]) -> List[Dict[str, str]]:
+        """แยก arguments ของ column/pair (label0, text1, ...) เป็นของแต่ละ child"""
+        return [
+            {p: fragments[self._param_name(node, p, i)] for p in self.element_nodes[child].params}
+            for i, child in enumerate(node.children)
+        ]
+    
+    def _children_code(self, node: SharedWidgetNode, fragments: Dict[str, str], in_class: bool) -> Iterator[str]:
+        return (
+            self._use_code(self.element_nodes[child], child_fragments, in_class)
+            for child, child_fragments in zip(node.children, self._split(node, fragments))
+        )
+    
+    def _call(self, node: SharedWidgetNode, fragments: Dict[str, str], in_class: bool) -> str:
+        """จุดเรียก shared widget - const ถ้าทุก argument เป็น literal (ไม่มีตัวแปรหรือ State member)"""
+        arguments = []
+        literal = not node.state
+        for param in node.varying:
+            match = _PLACEHOLDER_RE.fullmatch(fragments[param])
+            # ค่าที่เป็นตัวแปร (${label0}) ส่งต่อตรง ๆ ส่วนข้อความใส่ quote แบบเดียวกับ template
+            arguments.append(f"{param}: {match.group(1)}" if match else f"{param}: '{fragments[param]}'")
+            literal = literal and not match
+        for member in node.state:
+            arguments.append(f"{_state_field(member)}: {_state_field(member) if in_class else member}")
+        const = _const(*(fragments[param] for param in node.varying)) if literal else ""
+        return f"{const}{node.name}({', '.join(arguments)})"
+    
+    def _use_code(self, node: SharedWidgetNode, fragments: Dict[str, str], in_class: bool) -> str:
+        """code ที่จุดใช้งานของ node - เรียก shared widget ถ้าถูกแยกแล้ว ไม่งั้น inline
+        
+        in_class=True คือใช้ภายใน shared widget อื่น ซึ่งอ้าง State members ผ่าน field แทน
+        """
+        if node.name is not None:
+            # column_separator ใส่ comma หลัง child ให้แล้ว
+            return self._call(node, fragments, in_class)
+        if node.kind == "column":
+            return "".join(LayoutHelper.iter_column_fragments(node.container,
+                                                              self._children_code(node, fragments, in_class)))
+        if node.kind == "pair":
+            return LayoutHelper.column_separator(node.container).join(self._children_code(node, fragments, in_class))
+        code = _fill(node.template, fragments)
+        return _STATE_MEMBER_RE.sub(r"\1", code) if in_class else code
+    
+    def _class_fragments(self, node: SharedWidgetNode) -> Dict[str, str]:
+        """ค่าของ parameter ภายใน class - ค่าที่ต่างกันเป็นตัวแปร ส่วนที่เหมือนกันทุกจุดฝังไว้เลย"""
+        return {p: "${" + p + "}" if p in node.varying else node.uses[0][p] for p in node.params}
+    
+    def _class_source(self, node: SharedWidgetNode) -> str:
+        name = node.name
+        node.name = None
+        try:
+            if node.kind == "pair":
+                # widget ต้องคืน widget เดียว - ห่อ label + field ด้วย Column ที่ spacing เท่าเดิม
+                children = self._children_code(node, self._class_fragments(node), True)
+                body = "".join(LayoutHelper.iter_column_fragments(node.container, children))
+            else:
+                body = self._use_code(node, self._class_fragments(node), True)
+        finally:
+            node.name = name
+        
+        fields = [("String", p) for p in node.varying]
+        fields += [(STATE_MEMBER_TYPES.get(m, "dynamic"), _state_field(m)) for m in node.state]
+        return stateless_widget_source(name, fields, body)
+    
+    def _share_if_smaller(self, node: SharedWidgetNode, uses: List[Tuple[Dict[str, str], bool]],
+                          counters: Dict[str, int]) -> None:
+        """ตั้งชื่อ (แยกเป็น widget) เฉพาะเมื่อ class + จุดเรียกสั้นกว่า inline ทุกจุด"""
+        inline_size = sum(len(self._use_code(node, fragments, in_class)) for fragments, in_class in uses)
+        counters[node.base_name] = counters.get(node.base_name, 0) + 1
+        node.name = f"{self.class_prefix}{node.base_name}{counters[node.base_name]}"
+        shared_size = len(self._class_source(node)) + sum(
+            len(self._use_code(node, fragments, in_class)) for fragments, in_class in uses
+        )
+        if shared_size >= inline_size:
+            counters[node.base_name] -= 1
+            node.name = None
+    
+    def _parent_uses(self, node: SharedWidgetNode,
+                     uses: List[Tuple[Dict[str, str], bool]]) -> List[Tuple[SharedWidgetNode, Dict[str, str], bool]]:
+        """จุดที่ children ของ node ถูกใช้: ทุกจุดถ้า node ไม่ถูกแยก หรือใน class ของ node ครั้งเดียว"""
+        if node.name is None:
+            return [(node, fragments, in_class) for fragments, in_class in uses]
+        return [(node, self._class_fragments(node), True)]
+    
+    def _add_child_uses(self, parents: List[Tuple[SharedWidgetNode, Dict[str, str], bool]],
+                        child_uses: List[List[Tuple[Dict[str, str], bool]]]) -> None:
+        for node, fragments, in_class in parents:
+            for child, child_fragments in zip(node.children, self._split(node, fragments)):
+                child_uses[child].append((child_fragments, in_class))
+    
+    def _decide_node(self, node: SharedWidgetNode, uses: List[Tuple[Dict[str, str], bool]],
+                     counters: Dict[str, int]) -> None:
+        node.uses = [fragments for fragments, _ in uses]
+        if len(uses) >= self.min_uses:
+            node.varying = _varying_params(node.params, node.uses)
+            self._share_if_smaller(node, uses, counters)
+    
+    def _decide(self) -> None:
+        """ตัดสินใจจากบนลงล่าง (column → pair → element) - child นับเฉพาะจุดใช้ที่ยังเหลือหลัง parent ถูกแยก"""
+        counters: Dict[str, int] = {}
+        
+        for node in self.column_nodes:
+            if len(node.uses) >= self.min_uses and node.children:
+                node.varying = _varying_params(node.params, node.uses)
+                self._share_if_smaller(node, [(use, False) for use in node.uses], counters)
+        
+        parents = []
+        for node in self.column_nodes:
+            parents += self._parent_uses(node, [(use, False) for use in node.uses])
+        child_uses: List[List[Tuple[Dict[str, str], bool]]] = [[] for _ in self.element_nodes]
+        self._add_child_uses(parents, child_uses)
+        
+        parents = []
+        for node, uses in zip(self.element_nodes, child_uses):
+            if node.kind == "pair":
+                self._decide_node(node, uses, counters)
+                parents += self._parent_uses(node, uses)
+        self._add_child_uses(parents, child_uses)
+        
+        for node, uses in zip(self.element_nodes, child_uses):
+            if node.kind == "element":
+                self._decide_node(node, uses, counters)
+    
+    def generate(self) -> Tuple[str, Dict[str, Any]]:
+        """คืน (Flutter code, report) - code ของแต่ละ container คั่นด้วยบรรทัดว่าง ตามด้วย class ของ shared widgets"""
+        inline_code = "\n\n".join(
+            self._use_code(self.column_nodes[index], arguments, False) for index, arguments in self.instances
+        )
+        self._decide()
+        
+        code = "\n\n".join(
+            self._use_code(self.column_nodes[index], arguments, False) for index, arguments in self.instances
+        )
+        shared_nodes = [node for node in self.column_nodes + self.element_nodes if node.name is not None]
+        if shared_nodes:
+            code += f"\n\n{SHARED_WIDGETS_HEADER}\n\n" + "\n\n".join(map(self._class_source, shared_nodes))
+        
+        inline_bytes = len(inline_code.encode('utf-8'))
+        deduplicated_bytes = len(code.encode('utf-8'))
+        report = {
+            "containers": len(self.instances),
+            "inline_bytes": inline_bytes,
+            "deduplicated_bytes": deduplicated_bytes,
+            "bytes_saved": inline_bytes - deduplicated_bytes,
+            "saved_ratio": round(1 - deduplicated_bytes / inline_bytes, 4) if inline_bytes else 0.0,
+            "shared_widgets": [
+                {"name": node.name, "kind": node.kind, "uses": len(node.uses),
+                 "params": list(node.varying) + [_state_field(m) for m in node.state]}
+                for node in shared_nodes
+            ],
+        }
+        return code, report
+
+def freeze_value(value: Any) -> Any:
+    """แปลง dict/list ซ้อนกันเป็น MappingProxyType/tuple ที่แก้ไขไม่ได้"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_value(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    return value
+
+def thaw_value(value: Any) -> Any:
+    """สำเนาแบบแก้ไขได้ (dict/list) ของค่าที่ผ่าน freeze_value"""
+    if isinstance(value, Mapping):
+        return {key: thaw_value(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_value(item) for item in value]
+    return value
+
+class BuilderCacheEntry:
+    __slots__ = ("snapshot", "code")
+    
+    def __init__(self, snapshot: Mapping[str, Any]):
+        self.snapshot = snapshot
+        # (mode, lazy_threshold, emitters version) -> Flutter code
+        self.code: Dict[tuple, str] = {}
+
+class BuilderCache:
+    """LRU cache ของผลจาก builders ของ LayoutHelper สำหรับ structure ที่ซ้ำกันหลาย screen
+    
+    key คือ sha256 ของ (ชื่อ builder, arguments, keyword arguments) ในรูป canonical JSON แต่ละ entry เก็บผลเป็น
+    snapshot ที่แก้ไขไม่ได้ (freeze_value ของ asdict) และ Flutter code ที่ generate แล้วแยกตาม mode
+    """
+    
+    BUILDERS = ("create_element", "create_form_layout", "create_button_row", "create_profile_header",
+                "create_tab_layout", "create_detected_column")
+    # builders ที่ไม่ได้คืน container - build() คืนตามชนิดเดิมและ flutter_code() ใช้ไม่ได้
+    NON_CONTAINER_BUILDERS = ("create_element", "create_tab_layout")
+    DEFAULT_SIZE = 256
+    
+    def __init__(self, maxsize: int = DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, BuilderCacheEntry]" = OrderedDict()
+        self.reset_stats()
+    
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.code_hits = 0
+        self.code_misses = 0
+    
+    @staticmethod
+    def key(builder: str, args: tuple, kwargs: Optional[Dict[str, Any]] = None) -> str:
+        canonical = json.dumps([builder, args, kwargs or {}], sort_keys=True, separators=(",", ":"),
+                               ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def entry(self, builder: str, *args: Any, **kwargs: Any) -> BuilderCacheEntry:
+        """คืน entry ของ builder(*args, **kwargs) - สร้างและเก็บไว้ถ้ายังไม่มี (ตัดตัวที่ใช้นานที่สุดออกเมื่อเต็ม)"""
+        if builder not in self.BUILDERS:
+            raise ValueError(f"Unknown layout builder: {builder}")
+        key = self.key(builder, args, kwargs)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            instrumentation.count("builder_cache.hits")
+            return entry
         
-        return "\n\n".join(widget_code)
+        self.misses += 1
+        instrumentation.count("builder_cache.misses")
+        result = getattr(LayoutHelper, builder)(*args, **kwargs)
+        entry = BuilderCacheEntry(freeze_value(
+            asdict(result) if isinstance(result, (LayoutContainer, LayoutElement)) else result
+        ))
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+    
+    def snapshot(self, builder: str, *args: Any, **kwargs: Any) -> Mapping[str, Any]:
+        """ผลของ builder เป็น snapshot ที่แก้ไขไม่ได้ - ใช้ร่วมกันได้โดยไม่ต้อง copy"""
+        return self.entry(builder, *args, **kwargs).snapshot
+    
+    def as_dict(self, builder: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """สำเนาที่แก้ไขได้ - เท่ากับ asdict(LayoutHelper.<builder>(*args, **kwargs))"""
+        return thaw_value(self.snapshot(builder, *args, **kwargs))
+    
+    def build(self, builder: str, *args: Any, **kwargs: Any) -> Any:
+        """สำเนาที่แก้ไขได้เป็น LayoutContainer (create_element คืน LayoutElement, create_tab_layout คืน dict)"""
+        data = self.as_dict(builder, *args, **kwargs)
+        if builder == "create_element":
+            return LayoutElement(**data)
+        if builder == "create_tab_layout":
+            return data
+        return LayoutHelper.container_from_dict(data)
+    
+    def flutter_code(self, builder: str, *args: Any, mode: str = "default",
+                     lazy_threshold: int = LAZY_LIST_THRESHOLD) -> str:
+        """Flutter code ของ container จาก builder - generate ครั้งเดียวต่อ mode"""
+        if builder in self.NON_CONTAINER_BUILDERS:
+            raise ValueError(f"{builder} does not build a container")
+        entry = self.entry(builder, *args)
+        code_key = (mode, lazy_threshold, _EMITTERS_VERSION)
+        code = entry.code.get(code_key)
+        if code is not None:
+            self.code_hits += 1
+            return code
+        self.code_misses += 1
+        container = LayoutHelper.container_from_dict(thaw_value(entry.snapshot))
+        code = entry.code[code_key] = LayoutHelper.generate_flutter_column(container, mode, lazy_threshold)
+        return code
+    
+    def clear(self) -> None:
+        """ล้าง entries และตัวนับทั้งหมด"""
+        self._entries.clear()
+        self.reset_stats()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "code_hits": self.code_hits,
+            "code_misses": self.code_misses,
+        }
+
+# cache ต่อ process ที่ server, batch/pipeline (layout template) และ --generate-structure ใช้ร่วมกัน
+BUILDER_CACHE = BuilderCache()
+
+def _generator_fingerprint(options: str = "") -> str:
+    """Fingerprint ของตัว generator - เปลี่ยนเมื่อ layout_helper.py, emitters หรือ codegen options เปลี่ยน"""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(options.encode('utf-8'))
+    for mode, emitters in MODE_EMITTERS.items():
+        for element_type in sorted(emitters):
+            emitter = emitters[element_type]
+            digest.update(f"{mode}:{element_type}={emitter.__module__}.{getattr(emitter, '__qualname__', '')}".encode('utf-8'))
+    return digest.hexdigest()
+
+class IncrementalBuilder:
+    """สร้าง Flutter code ใหม่เฉพาะ screen ที่ layout input เปลี่ยน
+    
+    เก็บ content hash ของแต่ละ screen ไว้ใน build state file (JSON) แล้วข้าม screen
+    ที่ hash เดิมและไฟล์ output ยังอยู่ - screen ที่หายไปจาก input ลบได้ด้วย prune()
+    """
+    
+    STATE_VERSION = 1
+    STATE_FILENAME = ".layout_build_state.json"
+    
+    def __init__(self, output_dir: str, state_path: Optional[str] = None, mode: str = "default",
+                 lazy_threshold: int = LAZY_LIST_THRESHOLD):
+        self.output_dir = Path(output_dir)
+        self.state_path = Path(state_path) if state_path else self.output_dir / self.STATE_FILENAME
+        self.mode = mode
+        self.lazy_threshold = lazy_threshold
+        self.generator = _generator_fingerprint(f"{mode}:{lazy_threshold}")
+        self.screens: Dict[str, Dict[str, str]] = {}
+        self.seen: set = set()
+        
+        try:
+            state = json.loads(self.state_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            state = {}
+        if state.get("version") == self.STATE_VERSION and state.get("generator") == self.generator:
+            self.screens = state.get("screens", {})
+    
+    @staticmethod
+    def layout_hash(layout_data: Dict[str, Any]) -> str:
+        content: Any = LayoutHelper.layout_containers(layout_data)
+        if layout_data.get("scrollable"):
+            # scrollable เปลี่ยน code ของ performance mode (hash ของ layout ปกติคงเดิม)
+            content = {"containers": content, "scrollable": True}
+        canonical = json.dumps(content, sort_keys=True,
+                               separators=(",", ":"), ensure_ascii=False, default=asdict)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def build(self, layouts: Iterable[Tuple[str, Dict[str, Any]]], force: bool = False) -> Dict[str, List[str]]:
+        """Build screens ที่เปลี่ยน (หรือทั้งหมดถ้า force) คืน dict ของ screen ids ที่ built/skipped
+        
+        screen_id ซ้ำใน layouts ชุดเดียวกัน = ValueError (ไม่งั้นจะเขียนทับ output และ state ของกันและกัน)
+        """
+        summary: Dict[str, List[str]] = {"built": [], "skipped": []}
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.seen = set()
+        
+        for screen_id, layout_data in layouts:
+            if screen_id in self.seen:
+                self.save()
+                raise ValueError(f"Duplicate screen_id {screen_id!r}: each screen must have a unique id "
+                                 f"to get its own {screen_id}.dart")
+            self.seen.add(screen_id)
+            content_hash = self.layout_hash(layout_data)
+            output_path = self.output_dir / f"{screen_id}.dart"
+            previous = self.screens.get(screen_id)
+            
+            if not force and previous and previous.get("hash") == content_hash and output_path.exists():
+                summary["skipped"].append(screen_id)
+                instrumentation.count("build.skipped")
+                continue
+            
+            tmp_path = output_path.with_suffix(".dart.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                LayoutHelper.write_flutter_widgets(layout_data, f, self.mode, self.lazy_threshold)
+            os.replace(tmp_path, output_path)
+            
+            self.screens[screen_id] = {"hash": content_hash, "output": output_path.name}
+            summary["built"].append(screen_id)
+        
+        self.save()
+        return summary
+    
+    def prune(self) -> List[str]:
+        """ลบ state และไฟล์ output ของ screens ที่ไม่อยู่ใน build() ครั้งล่าสุด คืน screen ids ที่ลบ
+        
+        เรียกเฉพาะเมื่อ build() ได้ layouts ครบทุก screen (ไม่ใช่ subset หรือมีบรรทัดที่ถูกข้าม)
+        """
+        removed = sorted(set(self.screens) - self.seen)
+        for screen_id in removed:
+            output = self.screens.pop(screen_id).get("output") or f"{screen_id}.dart"
+            try:
+                (self.output_dir / output).unlink()
+            except FileNotFoundError:
+                pass
+        if removed:
+            self.save()
+        return removed
+    
+    def save(self) -> None:
+        state = {"version": self.STATE_VERSION, "generator": self.generator, "screens": self.screens}
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_path, self.state_path)
+
+def sample_layout_structure() -> Dict[str, Any]:
+    """ตัวอย่าง layout ของ SC-09 ที่ --generate-structure แสดง (ใช้เป็น golden case ของ golden_snapshots.py ด้วย)"""
+    return {
+        "screen_id": "SC-09",
+        "layout_type": "form_with_tabs",
+        "containers": [
+            {
+                "type": "column",
+                "elements": [
+                    BUILDER_CACHE.as_dict("create_element", "profile_image", "profile_image"),
+                    BUILDER_CACHE.as_dict("create_element", "button", "upload_button", properties={"text": "อัปโหลด", "style": "secondary"}),
+                    BUILDER_CACHE.as_dict("create_element", "textfield", "first_name", properties={"label": "ชื่อ*", "required": True}),
+                    BUILDER_CACHE.as_dict("create_element", "textfield", "last_name", properties={"label": "นามสกุล*", "required": True}),
+                ],
+                "spacing": 16.0,
+                "alignment": "center",
+                "padding": {"top": 16.0, "bottom": 16.0, "left": 16.0, "right": 16.0}
+            }
+        ]
+    }
+
+def iter_layout_files(paths: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """อ่าน layout JSON files ทีละไฟล์ คืน (screen_id, layout_data)"""
+    for path in paths:
+        with instrumentation.stage("layout.load"):
+            layout_data = json.loads(Path(path).read_text(encoding='utf-8'))
+        instrumentation.count("layouts.loaded")
+        yield layout_data.get("screen_id") or Path(path).stem, layout_data
+
+def iter_layout_jsonl(path: str, validate: bool = True,
+                      failures: Optional[List[str]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """อ่าน layouts จาก JSONL ทีละบรรทัด (path "-" = stdin) คืน (screen_id, layout_data)
+    
+    บรรทัดที่ JSON เสียหรือไม่ผ่าน schema จะถูกรายงานทาง stderr เพิ่มลง failures แล้วข้ามไป
+    """
+    from jsonl_io import iter_jsonl, open_text
+    if validate:
+        from layout_schema import validate_layout
+    
+    def report(line_number: int, message: str) -> None:
+        line = f"{path}:{line_number}: {message}"
+        print(line, file=sys.stderr)
+        if failures is not None:
+            failures.append(line)
+    
+    with open_text(path) as stream:
+        json_errors: List[Tuple[int, str]] = []
+        for line_number, layout_data in iter_jsonl(stream, json_errors):
+            while json_errors:
+                report(*json_errors.pop(0))
+            if not isinstance(layout_data, dict):
+                # --no-validate ข้าม schema แต่ทุกบรรทัดยังต้องเป็น layout object
+                report(line_number, f"expected a layout object, got {type(layout_data).__name__}")
+                instrumentation.count("layouts.rejected")
+                continue
+            with instrumentation.stage("layout.validate"):
+                errors = validate_layout(layout_data) if validate else []
+            if errors:
+                for error in errors:
+                    report(line_number, f"{error['path']}: {error['message']}")
+                instrumentation.count("layouts.rejected")
+                continue
+            instrumentation.count("layouts.loaded")
+            yield layout_data.get("screen_id") or f"line_{line_number}", layout_data
+        for json_error in json_errors:
+            report(*json_error)
+
+def iter_solve_reports(layouts: Iterable[Tuple[str, Dict[str, Any]]], widths: List[float],
+                       text_scale: float = 1.0) -> Iterator[Dict[str, Any]]:
+    """Yield frames ของแต่ละ screen ต่อ viewport width"""
+    for screen_id, layout_data in layouts:
+        for width in widths:
+            with instrumentation.stage("layout.solve"):
+                results = LayoutHelper.solve_screen(layout_data, width, text_scale)
+            yield {
+                "screen_id": screen_id,
+                "viewport_width": width,
+                "content_height": sum(r.content_height for r in results),
+                "overflow": [element_id for r in results for element_id in r.overflow],
+                "containers": [r.to_dict() for r in results],
+            }
+
+def write_records(records: Iterable[Dict[str, Any]], output: Optional[str], jsonl: bool, saved_message: str) -> None:
+    """เขียน records เป็น JSONL ทีละบรรทัด (streaming) หรือเป็น JSON array ก้อนเดียวแบบเดิม"""
+    if jsonl:
+        from jsonl_io import STDIO_PATH, open_text, write_jsonl
+        
+        with open_text(output or STDIO_PATH, 'w') as stream:
+            instrumentation.count("output.records", write_jsonl(records, stream))
+    else:
+        text = json.dumps(list(records), indent=2, ensure_ascii=False)
+        if output:
+            Path(output).write_text(text, encoding='utf-8')
+        else:
+            print(text)
+    if output:
+        print(f"{saved_message} {output}")
 
 def main():
     parser = argparse.ArgumentParser(description="Layout Helper Tool")
@@ -279,33 +2031,99 @@ def main():
     parser.add_argument("--generate-flutter-layout", action="store_true", help="Generate Flutter layout")
     parser.add_argument("--elements", help="Comma-separated list of elements")
     parser.add_argument("--output", help="Output file path")
+    parser.add_argument("--plugin", action="append", default=[],
+                        help="Emitter plugin module or .py file (repeatable)")
+    parser.add_argument("--layout", nargs="+", help="Layout JSON file(s) for --generate-flutter-layout")
+    parser.add_argument("--layout-jsonl", metavar="PATH",
+                        help="Read layouts one per line from a JSONL file (- for stdin)")
+    parser.add_argument("--jsonl-output", action="store_true",
+                        help="Write results one record per line (JSONL) instead of one JSON document")
+    parser.add_argument("--output-dir", help="Write one <screen_id>.dart per layout file into this directory")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only regenerate screens whose layout changed since the last build")
+    parser.add_argument("--build-state", help="Build state file (default: <output-dir>/.layout_build_state.json)")
+    parser.add_argument("--no-prune", action="store_true",
+                        help="Keep outputs of screens that are no longer in the --output-dir build input")
+    parser.add_argument("--mode", choices=sorted(MODE_EMITTERS), default="default",
+                        help="Codegen mode: performance adds const, per-section widgets and lazy lists")
+    parser.add_argument("--lazy-threshold", type=int, default=LAZY_LIST_THRESHOLD,
+                        help="Use ListView.builder for containers with more elements (--mode performance)")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="Emit repeated subtrees of --layout files once as shared StatelessWidgets")
+    parser.add_argument("--dedupe-report", help="Write the --dedupe bytes-saved report (JSON) to this file")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="Skip schema validation of --layout files before processing them")
+    parser.add_argument("--solve-layout", action="store_true",
+                        help="Compute element frames for --layout files and report overflow")
+    parser.add_argument("--viewports", default="320,360,375,390,414,768",
+                        help="Comma-separated viewport widths for --solve-layout")
+    parser.add_argument("--text-scale", type=float, default=1.0, help="Text scale factor for --solve-layout")
+    parser.add_argument("--evaluate-viewports", action="store_true",
+                        help="Check --layout files against a device/text-scale matrix (NumPy)")
+    parser.add_argument("--devices", help="Comma-separated WIDTHxHEIGHT list for --evaluate-viewports")
+    parser.add_argument("--text-scales", help="Comma-separated text scales for --evaluate-viewports")
+    parser.add_argument("--memory-benchmark", type=int, metavar="N",
+                        help="Compare memory of N dataclass vs compact elements")
+    instrumentation.add_arguments(parser)
     
     args = parser.parse_args()
     
+    with instrumentation.session(args.profile, args.timings):
+        run(parser, args)
+
+def run(parser: argparse.ArgumentParser, args) -> None:
+    """ทำงานตาม options ที่ parse แล้ว (แยกจาก main เพื่อให้ --profile ครอบได้ทั้งคำสั่ง)"""
+    
+    if args.generate_flutter_layout:
+        # โหลด plugins เฉพาะคำสั่งที่ generate code
+        load_emitter_plugins(args.plugin)
     helper = LayoutHelper()
     
-    if args.generate_structure:
+    if args.layout and not args.no_validate:
+        # ตรวจทุกไฟล์ในรอบเดียวก่อนเริ่ม generate - ไฟล์เสียไม่ทำให้ได้ output ครึ่ง ๆ กลาง ๆ
+        from layout_schema import format_failures, validate_layout_files
+        
+        with instrumentation.stage("layout.validate"):
+            failures = validate_layout_files(args.layout)
+        if failures:
+            for line in format_failures(failures):
+                print(line, file=sys.stderr)
+            sys.exit(f"{len(failures)} of {len(args.layout)} layout file(s) failed validation")
+    
+    # layouts จากไฟล์ (ตรวจแล้วข้างบน) ตามด้วย JSONL stream (ตรวจทีละบรรทัด)
+    stream_failures: List[str] = []
+    has_layouts = bool(args.layout or args.layout_jsonl)
+    
+    def iter_layouts() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        if args.layout:
+            yield from iter_layout_files(args.layout)
+        if args.layout_jsonl:
+            yield from iter_layout_jsonl(args.layout_jsonl, not args.no_validate, stream_failures)
+    
+    if args.memory_benchmark:
+        print(json.dumps(memory_benchmark(args.memory_benchmark), indent=2))
+    
+    elif args.solve_layout and has_layouts:
+        widths = [float(w) for w in args.viewports.split(",") if w.strip()]
+        write_records(iter_solve_reports(iter_layouts(), widths, args.text_scale),
+                      args.output, args.jsonl_output, "Layout frames saved to")
+    
+    elif args.evaluate_viewports and has_layouts:
+        devices = None
+        if args.devices:
+            devices = [tuple(float(v) for v in d.lower().split("x")) for d in args.devices.split(",") if d.strip()]
+        scales = [float(v) for v in args.text_scales.split(",")] if args.text_scales else None
+        write_records(helper.evaluate_viewports(iter_layouts(), devices, scales),
+                      args.output, args.jsonl_output, "Viewport report saved to")
+    
+    elif args.generate_structure:
         # Generate sample layout structure
-        structure = {
-            "screen_id": "SC-09",
-            "layout_type": "form_with_tabs",
-            "containers": [
-                {
-                    "type": "column",
-                    "elements": [
-                        asdict(helper.create_element("profile_image", "profile_image")),
-                        asdict(helper.create_element("button", "upload_button", properties={"text": "อัปโหลด", "style": "secondary"})),
-                        asdict(helper.create_element("textfield", "first_name", properties={"label": "ชื่อ*", "required": True})),
-                        asdict(helper.create_element("textfield", "last_name", properties={"label": "นามสกุล*", "required": True})),
-                    ],
-                    "spacing": 16.0,
-                    "alignment": "center",
-                    "padding": {"top": 16.0, "bottom": 16.0, "left": 16.0, "right": 16.0}
-                }
-            ]
-        }
+        structure = sample_layout_structure()
         
-        output = json.dumps(structure, indent=2, ensure_ascii=False)
+        if args.jsonl_output:
+            output = json.dumps(structure, ensure_ascii=False, separators=(",", ":"))
+        else:
+            output = json.dumps(structure, indent=2, ensure_ascii=False)
         
         if args.output:
             Path(args.output).write_text(output, encoding='utf-8')
@@ -334,6 +2152,60 @@ def main():
         else:
             print(output)
     
+    elif args.generate_flutter_layout and has_layouts:
+        layouts = iter_layouts()
+        
+        if args.dedupe:
+            if args.output_dir:
+                parser.error("--dedupe writes all screens and their shared widgets to one file; use --output")
+            if args.jsonl_output:
+                parser.error("--dedupe shares widgets across screens and cannot emit one record per screen")
+            code, report = helper.generate_shared_widgets(layout_data for _, layout_data in layouts)
+            if args.output:
+                Path(args.output).write_text(code, encoding='utf-8')
+                print(f"Flutter layout code saved to {args.output}")
+            else:
+                print(code)
+            print(f"Shared widgets: {len(report['shared_widgets'])}, bytes saved: {report['bytes_saved']} "
+                  f"({report['saved_ratio']:.1%})", file=sys.stderr)
+            if args.dedupe_report:
+                Path(args.dedupe_report).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        
+        elif args.output_dir:
+            builder = IncrementalBuilder(args.output_dir, args.build_state, args.mode, args.lazy_threshold)
+            try:
+                summary = builder.build(layouts, force=not args.incremental)
+            except ValueError as e:
+                parser.error(str(e))
+            # บรรทัด JSONL ที่ถูกข้ามไม่ได้แปลว่า screen นั้นถูกลบ - prune เฉพาะเมื่อ input ครบ
+            removed = [] if args.no_prune or stream_failures else builder.prune()
+            print(f"Built {len(summary['built'])} screen(s), skipped {len(summary['skipped'])} unchanged, "
+                  f"removed {len(removed)} -> {args.output_dir}")
+        
+        elif args.jsonl_output:
+            # หนึ่งบรรทัดต่อ screen: {"screen_id", "code"}
+            records = (
+                {"screen_id": screen_id,
+                 "code": helper.generate_flutter_widgets(layout_data, args.mode, args.lazy_threshold)}
+                for screen_id, layout_data in layouts
+            )
+            write_records(records, args.output, True, "Flutter layout code saved to")
+        
+        else:
+            stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+            try:
+                for i, (_, layout_data) in enumerate(layouts):
+                    if i:
+                        stream.write("\n\n")
+                    helper.write_flutter_widgets(layout_data, stream, args.mode, args.lazy_threshold)
+            finally:
+                if args.output:
+                    stream.close()
+            if args.output:
+                print(f"Flutter layout code saved to {args.output}")
+            else:
+                print()
+    
     elif args.generate_flutter_layout and args.elements:
         # Generate Flutter layout for specified elements
         elements = args.elements.split(",")
@@ -354,16 +2226,19 @@ def main():
             spacing=helper.SPACING["md"]
         )
         
-        flutter_code = helper.generate_flutter_column(container)
-        
         if args.output:
-            Path(args.output).write_text(flutter_code, encoding='utf-8')
+            with open(args.output, 'w', encoding='utf-8') as f:
+                helper.write_flutter_column(container, f, args.mode, args.lazy_threshold)
             print(f"Flutter layout code saved to {args.output}")
         else:
-            print(flutter_code)
+            helper.write_flutter_column(container, sys.stdout, args.mode, args.lazy_threshold)
+            print()
     
     else:
         parser.print_help()
+    
+    if stream_failures:
+        sys.exit(f"{len(stream_failures)} problem(s) in {args.layout_jsonl}; affected lines were skipped")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
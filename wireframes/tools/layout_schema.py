@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Layout Schema - ตรวจสอบ layout JSON ก่อน generate Flutter code
+
+Schema ครอบคลุม layout จาก layout_helper.py --generate-structure ("containers")
+และ template จาก agent_visual_workflow.py --prepare-layout ("layout_structure")
+Schema ถูก compile เป็น validator function ครั้งเดียวแล้วใช้ซ้ำกับทุกไฟล์
+error แต่ละรายการบอก path ที่ผิดแบบ $.containers[0].elements[2].width
+
+Usage:
+    python layout_schema.py layouts/*.json
+    python layout_schema.py layouts/*.json --output validation.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterable, Optional
+
+# validator: (value, path, errors) -> None - เพิ่ม {"path", "message"} ลง errors
+Validator = Callable[[Any, str, List[Dict[str, str]]], None]
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    # bool เป็น subclass ของ int ใน Python แต่ไม่ใช่ number ใน JSON
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+_JSON_TYPE_NAMES = {dict: "object", list: "array", str: "string", bool: "boolean",
+                    int: "integer", float: "number", type(None): "null"}
+
+INSETS_SCHEMA = {
+    "anyOf": [
+        {
+            "type": "object",
+            "properties": {key: {"type": "number"} for key in ("top", "bottom", "left", "right")},
+            "additionalProperties": False,
+        },
+        {"type": "array", "items": {"type": "number"}, "minItems": 4, "maxItems": 4},
+    ],
+}
+
+ELEMENT_SCHEMA = {
+    "type": "object",
+    "required": ["type", "id"],
+    "properties": {
+        "type": {"type": "string", "minLength": 1},
+        "id": {"type": "string", "minLength": 1},
+        "x": {"type": "number"},
+        "y": {"type": "number"},
+        "width": {"type": "number", "minimum": 0},
+        "height": {"type": "number", "minimum": 0},
+        "alignment": {"type": "string"},
+        "margin": INSETS_SCHEMA,
+        "padding": INSETS_SCHEMA,
+        "properties": {"type": "object"},
+        # bounding box จาก wireframe_detect (x, y, w, h) - metadata ไม่ใช้ตอน generate
+        "bbox": {"type": "array", "items": {"type": "number"}, "minItems": 4, "maxItems": 4},
+    },
+    "additionalProperties": False,
+}
+
+CONTAINER_SCHEMA = {
+    "type": "object",
+    "required": ["type", "elements"],
+    "properties": {
+        "type": {"type": "string", "enum": ["column", "row", "stack", "container", "card"]},
+        "elements": {"type": "array", "items": ELEMENT_SCHEMA},
+        "spacing": {"type": "number", "minimum": 0},
+        "alignment": {"type": "string"},
+        "padding": INSETS_SCHEMA,
+    },
+    "additionalProperties": False,
+}
+
+LAYOUT_SCHEMA = {
+    "type": "object",
+    "anyRequired": ["containers", "layout_structure"],
+    "properties": {
+        "screen_id": {"type": "string"},
+        "layout_type": {"type": "string"},
+        # screen อยู่ใน scroll view - performance mode จะไม่ห่อ lazy lists ด้วย Expanded
+        "scrollable": {"type": "boolean"},
+        "containers": {"type": "array", "items": CONTAINER_SCHEMA},
+        "layout_structure": {"type": "array", "items": CONTAINER_SCHEMA},
+        "next_steps": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+def _type_name(value: Any) -> str:
+    return _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Compile schema (JSON Schema subset) เป็น validator function
+    
+    รองรับ type, enum, minimum, minLength, minItems, maxItems, required, anyRequired,
+    properties, additionalProperties (bool), items และ anyOf
+    """
+    checks: List[Validator] = []
+    
+    if "anyOf" in schema:
+        options = [compile_schema(option) for option in schema["anyOf"]]
+        
+        def check_any_of(value, path, errors):
+            closest = None
+            for option in options:
+                option_errors: List[Dict[str, str]] = []
+                option(value, path, option_errors)
+                if not option_errors:
+                    return
+                if not any(e["path"] == path and e["message"].startswith("expected ") for e in option_errors):
+                    # type ตรงกับ option นี้ - รายงาน error ภายในแทนข้อความกว้าง ๆ
+                    closest = option_errors
+            if closest:
+                errors.extend(closest)
+            else:
+                errors.append({"path": path, "message": f"{_type_name(value)} does not match any allowed form"})
+        return check_any_of
+    
+    expected = schema.get("type")
+    if expected is not None:
+        types = [expected] if isinstance(expected, str) else list(expected)
+        type_checks = [_TYPE_CHECKS[t] for t in types]
+        expected_text = " or ".join(types)
+    
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append({"path": path, "message": f"{value!r} is not one of {allowed}"})
+        checks.append(check_enum)
+    
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+        
+        def check_minimum(value, path, errors):
+            if value < minimum:
+                errors.append({"path": path, "message": f"{value} is less than {minimum}"})
+        checks.append(check_minimum)
+    
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+        
+        def check_min_length(value, path, errors):
+            if len(value) < min_length:
+                errors.append({"path": path, "message": f"must have at least {min_length} character(s)"})
+        checks.append(check_min_length)
+    
+    if "minItems" in schema or "maxItems" in schema:
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems")
+        
+        def check_items_count(value, path, errors):
+            if len(value) < min_items:
+                errors.append({"path": path, "message": f"must have at least {min_items} items, got {len(value)}"})
+            elif max_items is not None and len(value) > max_items:
+                errors.append({"path": path, "message": f"must have at most {max_items} items, got {len(value)}"})
+        checks.append(check_items_count)
+    
+    if "items" in schema:
+        item_validator = compile_schema(schema["items"])
+        
+        def check_items(value, path, errors):
+            for i, item in enumerate(value):
+                item_validator(item, f"{path}[{i}]", errors)
+        checks.append(check_items)
+    
+    if "required" in schema:
+        required = list(schema["required"])
+        
+        def check_required(value, path, errors):
+            for key in required:
+                if key not in value:
+                    errors.append({"path": f"{path}.{key}", "message": "is required"})
+        checks.append(check_required)
+    
+    if "anyRequired" in schema:
+        any_required = list(schema["anyRequired"])
+        
+        def check_any_required(value, path, errors):
+            if not any(key in value for key in any_required):
+                errors.append({"path": path, "message": f"requires one of: {', '.join(any_required)}"})
+        checks.append(check_any_required)
+    
+    if "properties" in schema or schema.get("additionalProperties") is False:
+        properties = {key: compile_schema(sub) for key, sub in schema.get("properties", {}).items()}
+        allow_additional = schema.get("additionalProperties", True) is not False
+        
+        def check_properties(value, path, errors):
+            for key, item in value.items():
+                validator = properties.get(key)
+                if validator is not None:
+                    validator(item, f"{path}.{key}", errors)
+                elif not allow_additional:
+                    errors.append({"path": f"{path}.{key}", "message": "is not an allowed property"})
+        checks.append(check_properties)
+    
+    def validate(value, path, errors):
+        if expected is not None and not any(check(value) for check in type_checks):
+            errors.append({"path": path, "message": f"expected {expected_text}, got {_type_name(value)}"})
+            return
+        for check in checks:
+            check(value, path, errors)
+    
+    return validate
+
+_LAYOUT_VALIDATOR: Optional[Validator] = None
+
+def validate_layout(layout_data: Any) -> List[Dict[str, str]]:
+    """ตรวจสอบ layout หนึ่งอัน คืน list ของ errors (ว่าง = ผ่าน) - validator compile ครั้งแรกที่เรียก"""
+    global _LAYOUT_VALIDATOR
+    if _LAYOUT_VALIDATOR is None:
+        _LAYOUT_VALIDATOR = compile_schema(LAYOUT_SCHEMA)
+    errors: List[Dict[str, str]] = []
+    _LAYOUT_VALIDATOR(layout_data, "$", errors)
+    return errors
+
+def validate_layout_files(paths: Iterable[str]) -> Dict[str, List[Dict[str, str]]]:
+    """ตรวจสอบ layout files ทั้งหมดในรอบเดียว คืน {path: errors} เฉพาะไฟล์ที่ไม่ผ่าน"""
+    failures = {}
+    for path in paths:
+        try:
+            layout_data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            failures[path] = [{"path": "$", "message": f"cannot read JSON: {e}"}]
+            continue
+        errors = validate_layout(layout_data)
+        if errors:
+            failures[path] = errors
+    return failures
+
+def format_failures(failures: Dict[str, List[Dict[str, str]]]) -> Iterable[str]:
+    for path, errors in failures.items():
+        for error in errors:
+            yield f"{path}: {error['path']}: {error['message']}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Layout Schema Validator")
+    parser.add_argument("layouts", nargs="+", help="Layout JSON file(s) to validate")
+    parser.add_argument("--output", help="Write {file: errors} as JSON to this file")
+    
+    args = parser.parse_args()
+    
+    failures = validate_layout_files(args.layouts)
+    
+    for line in format_failures(failures):
+        print(line, file=sys.stderr)
+    print(f"Validated {len(args.layouts)} layout file(s), {len(failures)} invalid")
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(failures, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Validation report saved to {args.output}")
+    
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('ยกเลิก'),
+),,
+      SizedBox(height: 16.0),
+      ElevatedButton(
+  onPressed: () {},
+  child: Text('บันทึก'),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      Text(
+  'ชื่อ*',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'นามสกุล*',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'ชื่อเล่น',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'อีเมล*',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'เบอร์โทรศัพท์',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'วันเกิด',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'ที่อยู่',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'จังหวัด',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'รหัสไปรษณีย์',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'บริษัท',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'ตำแหน่ง',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'รหัสนักศึกษา*',
+  style: Theme.of(context).textTheme.bodyMedium,
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('ยกเลิก'),
+),,
+      SizedBox(height: 16.0),
+      ElevatedButton(
+  onPressed: () {},
+  child: Text('บันทึก'),
+),
+  ],
+)
\ No newline at end of file
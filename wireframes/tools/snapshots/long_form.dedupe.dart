@@ -0,0 +1,82 @@
+const SharedColumn1()
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      const SharedLabeledTextfield1(labelText: 'ชื่อ*'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'นามสกุล*'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'ชื่อเล่น'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'อีเมล*'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'เบอร์โทรศัพท์'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'วันเกิด'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'ที่อยู่'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'จังหวัด'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'รหัสไปรษณีย์'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'บริษัท'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'ตำแหน่ง'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'รหัสนักศึกษา*')
+  ],
+)
+
+const SharedColumn1()
+
+// Shared widgets (generated by layout_helper.py --dedupe)
+
+class SharedColumn1 extends StatelessWidget {
+  const SharedColumn1({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+          OutlinedButton(
+      onPressed: () {},
+      child: Text('ยกเลิก'),
+    ),,
+          SizedBox(height: 16.0),
+          ElevatedButton(
+      onPressed: () {},
+      child: Text('บันทึก'),
+    ),
+      ],
+    );
+  }
+}
+
+class SharedLabeledTextfield1 extends StatelessWidget {
+  const SharedLabeledTextfield1({super.key, required this.labelText});
+
+  final String labelText;
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+          Text(
+      '${labelText}',
+      style: Theme.of(context).textTheme.bodyMedium,
+    ),,
+          SizedBox(height: 16.0),
+          TextFormField(
+      decoration: InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+      ],
+    );
+  }
+}
\ No newline at end of file
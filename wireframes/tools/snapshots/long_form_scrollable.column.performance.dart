@@ -0,0 +1,123 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    OutlinedButton(
+      onPressed: () {},
+      child: const Text('ยกเลิก'),
+    ),
+    const SizedBox(height: 16.0),
+    ElevatedButton(
+      onPressed: () {},
+      child: const Text('บันทึก'),
+    ),
+  ],
+)
+
+ListView.builder(
+  itemCount: 47,
+  itemBuilder: (context, index) {
+    if (index.isOdd) return const SizedBox(height: 16.0);
+    return switch (index ~/ 2) {
+      0 => const Text('ชื่อ*'),
+      1 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      2 => const Text('นามสกุล*'),
+      3 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      4 => const Text('ชื่อเล่น'),
+      5 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      6 => const Text('อีเมล*'),
+      7 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      8 => const Text('เบอร์โทรศัพท์'),
+      9 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      10 => const Text('วันเกิด'),
+      11 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      12 => const Text('ที่อยู่'),
+      13 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      14 => const Text('จังหวัด'),
+      15 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      16 => const Text('รหัสไปรษณีย์'),
+      17 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      18 => const Text('บริษัท'),
+      19 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      20 => const Text('ตำแหน่ง'),
+      21 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      22 => const Text('รหัสนักศึกษา*'),
+      23 => TextFormField(
+        decoration: const InputDecoration(
+          labelText: '',
+          hintText: '',
+        ),
+      ),
+      _ => const SizedBox.shrink(),
+    };
+  },
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    OutlinedButton(
+      onPressed: () {},
+      child: const Text('ยกเลิก'),
+    ),
+    const SizedBox(height: 16.0),
+    ElevatedButton(
+      onPressed: () {},
+      child: const Text('บันทึก'),
+    ),
+  ],
+)
\ No newline at end of file
@@ -0,0 +1,47 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    const Placeholder(/* TODO: Implement icon widget */),
+    const SizedBox(height: 8.0),
+    const Text('แก้ไขโปรไฟล์', style: TextStyle(fontWeight: FontWeight.bold)),
+    const SizedBox(height: 8.0),
+    ElevatedButton(
+      onPressed: () {},
+      child: const Text('บันทึก'),
+    ),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: 'ค้นหา',
+        hintText: 'ชื่อหรือรหัสนักศึกษา',
+      ),
+    ),
+    const SizedBox(height: 12.0),
+    OutlinedButton(
+      onPressed: () {},
+      child: const Text('ค้นหา'),
+    ),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    const Placeholder(/* TODO: Implement image widget */),
+    CircleAvatar(
+      radius: 40.0,
+      backgroundImage: _profileImage != null
+        ? FileImage(_profileImage!)
+        : null,
+      child: _profileImage == null
+        ? const Icon(Icons.person, size: 48.0)
+        : null,
+    ),
+    const Text('รุ่นที่ 42'),
+  ],
+)
\ No newline at end of file
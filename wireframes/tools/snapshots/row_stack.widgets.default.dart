@@ -0,0 +1,55 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      // TODO: Implement icon widget,
+      SizedBox(height: 8.0),
+      Text(
+  'แก้ไขโปรไฟล์',
+  style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.bold),
+),,
+      SizedBox(height: 8.0),
+      ElevatedButton(
+  onPressed: () {},
+  child: Text('บันทึก'),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: 'ค้นหา',
+    hintText: 'ชื่อหรือรหัสนักศึกษา',
+  ),
+),,
+      SizedBox(height: 12.0),
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('ค้นหา'),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      // TODO: Implement image widget,
+      
+      CircleAvatar(
+  radius: 40.0,
+  backgroundImage: _profileImage != null 
+    ? FileImage(_profileImage!) 
+    : null,
+  child: _profileImage == null 
+    ? Icon(Icons.person, size: 48.0) 
+    : null,
+),,
+      
+      Text(
+  'รุ่นที่ 42',
+  style: Theme.of(context).textTheme.bodyMedium,
+),
+  ],
+)
\ No newline at end of file
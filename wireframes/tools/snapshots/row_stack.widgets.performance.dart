@@ -0,0 +1,79 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    const _GcRowStackSection1(),
+    const _GcRowStackSection2(),
+    _GcRowStackSection3(profileImage: _profileImage),
+  ],
+)
+
+class _GcRowStackSection1 extends StatelessWidget {
+  const _GcRowStackSection1({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        const Placeholder(/* TODO: Implement icon widget */),
+        const SizedBox(height: 8.0),
+        const Text('แก้ไขโปรไฟล์', style: TextStyle(fontWeight: FontWeight.bold)),
+        const SizedBox(height: 8.0),
+        ElevatedButton(
+          onPressed: () {},
+          child: const Text('บันทึก'),
+        ),
+      ],
+    );
+  }
+}
+
+class _GcRowStackSection2 extends StatelessWidget {
+  const _GcRowStackSection2({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: 'ค้นหา',
+            hintText: 'ชื่อหรือรหัสนักศึกษา',
+          ),
+        ),
+        const SizedBox(height: 12.0),
+        OutlinedButton(
+          onPressed: () {},
+          child: const Text('ค้นหา'),
+        ),
+      ],
+    );
+  }
+}
+
+class _GcRowStackSection3 extends StatelessWidget {
+  const _GcRowStackSection3({super.key, required this.profileImage});
+
+  final File? profileImage;
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        const Placeholder(/* TODO: Implement image widget */),
+        CircleAvatar(
+          radius: 40.0,
+          backgroundImage: profileImage != null
+            ? FileImage(profileImage!)
+            : null,
+          child: profileImage == null
+            ? const Icon(Icons.person, size: 48.0)
+            : null,
+        ),
+        const Text('รุ่นที่ 42'),
+      ],
+    );
+  }
+}
\ No newline at end of file
@@ -0,0 +1,99 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      CircleAvatar(
+  radius: 40.0,
+  backgroundImage: _profileImage != null 
+    ? FileImage(_profileImage!) 
+    : null,
+  child: _profileImage == null 
+    ? Icon(Icons.person, size: 48.0) 
+    : null,
+),,
+      SizedBox(height: 8.0),
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('อัปโหลด'),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      Text(
+  'ชื่อ*',
+  style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.w600),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'นามสกุล*',
+  style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.w600),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'ชื่อเล่น',
+  style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.w600),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'รหัสนักศึกษา*',
+  style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.w600),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      Text(
+  'ปีที่จบการศึกษา*',
+  style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.w600),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: '',
+    hintText: '',
+  ),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('ยกเลิก'),
+),,
+      SizedBox(height: 16.0),
+      ElevatedButton(
+  onPressed: () {},
+  child: Text('บันทึก'),
+),
+  ],
+)
\ No newline at end of file
@@ -0,0 +1,84 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    CircleAvatar(
+      radius: 40.0,
+      backgroundImage: _profileImage != null
+        ? FileImage(_profileImage!)
+        : null,
+      child: _profileImage == null
+        ? const Icon(Icons.person, size: 48.0)
+        : null,
+    ),
+    const SizedBox(height: 8.0),
+    OutlinedButton(
+      onPressed: () {},
+      child: const Text('อัปโหลด'),
+    ),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    const Text('ชื่อ*', style: TextStyle(fontWeight: FontWeight.w600)),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+    const SizedBox(height: 16.0),
+    const Text('นามสกุล*', style: TextStyle(fontWeight: FontWeight.w600)),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+    const SizedBox(height: 16.0),
+    const Text('ชื่อเล่น', style: TextStyle(fontWeight: FontWeight.w600)),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+    const SizedBox(height: 16.0),
+    const Text('รหัสนักศึกษา*', style: TextStyle(fontWeight: FontWeight.w600)),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+    const SizedBox(height: 16.0),
+    const Text('ปีที่จบการศึกษา*', style: TextStyle(fontWeight: FontWeight.w600)),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    OutlinedButton(
+      onPressed: () {},
+      child: const Text('ยกเลิก'),
+    ),
+    const SizedBox(height: 16.0),
+    ElevatedButton(
+      onPressed: () {},
+      child: const Text('บันทึก'),
+    ),
+  ],
+)
\ No newline at end of file
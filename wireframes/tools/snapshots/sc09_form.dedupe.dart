@@ -0,0 +1,77 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      CircleAvatar(
+  radius: 40.0,
+  backgroundImage: _profileImage != null 
+    ? FileImage(_profileImage!) 
+    : null,
+  child: _profileImage == null 
+    ? Icon(Icons.person, size: 48.0) 
+    : null,
+),,
+      SizedBox(height: 8.0),
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('อัปโหลด'),
+),
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      const SharedLabeledTextfield1(labelText: 'ชื่อ*'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'นามสกุล*'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'ชื่อเล่น'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'รหัสนักศึกษา*'),
+      SizedBox(height: 16.0),
+      const SharedLabeledTextfield1(labelText: 'ปีที่จบการศึกษา*')
+  ],
+)
+
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('ยกเลิก'),
+),,
+      SizedBox(height: 16.0),
+      ElevatedButton(
+  onPressed: () {},
+  child: Text('บันทึก'),
+),
+  ],
+)
+
+// Shared widgets (generated by layout_helper.py --dedupe)
+
+class SharedLabeledTextfield1 extends StatelessWidget {
+  const SharedLabeledTextfield1({super.key, required this.labelText});
+
+  final String labelText;
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+          Text(
+      '${labelText}',
+      style: Theme.of(context).textTheme.bodyMedium.copyWith(fontWeight: FontWeight.w600),
+    ),,
+          SizedBox(height: 16.0),
+          TextFormField(
+      decoration: InputDecoration(
+        labelText: '',
+        hintText: '',
+      ),
+    ),
+      ],
+    );
+  }
+}
\ No newline at end of file
@@ -0,0 +1,116 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    _Sc09Section1(profileImage: _profileImage),
+    const _Sc09Section2(),
+    const _Sc09Section3(),
+  ],
+)
+
+class _Sc09Section1 extends StatelessWidget {
+  const _Sc09Section1({super.key, required this.profileImage});
+
+  final File? profileImage;
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        CircleAvatar(
+          radius: 40.0,
+          backgroundImage: profileImage != null
+            ? FileImage(profileImage!)
+            : null,
+          child: profileImage == null
+            ? const Icon(Icons.person, size: 48.0)
+            : null,
+        ),
+        const SizedBox(height: 8.0),
+        OutlinedButton(
+          onPressed: () {},
+          child: const Text('อัปโหลด'),
+        ),
+      ],
+    );
+  }
+}
+
+class _Sc09Section2 extends StatelessWidget {
+  const _Sc09Section2({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        const Text('ชื่อ*', style: TextStyle(fontWeight: FontWeight.w600)),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: '',
+            hintText: '',
+          ),
+        ),
+        const SizedBox(height: 16.0),
+        const Text('นามสกุล*', style: TextStyle(fontWeight: FontWeight.w600)),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: '',
+            hintText: '',
+          ),
+        ),
+        const SizedBox(height: 16.0),
+        const Text('ชื่อเล่น', style: TextStyle(fontWeight: FontWeight.w600)),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: '',
+            hintText: '',
+          ),
+        ),
+        const SizedBox(height: 16.0),
+        const Text('รหัสนักศึกษา*', style: TextStyle(fontWeight: FontWeight.w600)),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: '',
+            hintText: '',
+          ),
+        ),
+        const SizedBox(height: 16.0),
+        const Text('ปีที่จบการศึกษา*', style: TextStyle(fontWeight: FontWeight.w600)),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: '',
+            hintText: '',
+          ),
+        ),
+      ],
+    );
+  }
+}
+
+class _Sc09Section3 extends StatelessWidget {
+  const _Sc09Section3({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        OutlinedButton(
+          onPressed: () {},
+          child: const Text('ยกเลิก'),
+        ),
+        const SizedBox(height: 16.0),
+        ElevatedButton(
+          onPressed: () {},
+          child: const Text('บันทึก'),
+        ),
+      ],
+    );
+  }
+}
\ No newline at end of file
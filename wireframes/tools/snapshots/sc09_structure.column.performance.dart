@@ -0,0 +1,33 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    CircleAvatar(
+      radius: 40.0,
+      backgroundImage: _profileImage != null
+        ? FileImage(_profileImage!)
+        : null,
+      child: _profileImage == null
+        ? const Icon(Icons.person, size: 48.0)
+        : null,
+    ),
+    const SizedBox(height: 16.0),
+    OutlinedButton(
+      onPressed: () {},
+      child: const Text('อัปโหลด'),
+    ),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: 'ชื่อ*',
+        hintText: '',
+      ),
+    ),
+    const SizedBox(height: 16.0),
+    TextFormField(
+      decoration: const InputDecoration(
+        labelText: 'นามสกุล*',
+        hintText: '',
+      ),
+    ),
+  ],
+)
\ No newline at end of file
@@ -0,0 +1,33 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+      CircleAvatar(
+  radius: 40.0,
+  backgroundImage: _profileImage != null 
+    ? FileImage(_profileImage!) 
+    : null,
+  child: _profileImage == null 
+    ? Icon(Icons.person, size: 48.0) 
+    : null,
+),,
+      SizedBox(height: 16.0),
+      OutlinedButton(
+  onPressed: () {},
+  child: Text('อัปโหลด'),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: 'ชื่อ*',
+    hintText: '',
+  ),
+),,
+      SizedBox(height: 16.0),
+      TextFormField(
+  decoration: InputDecoration(
+    labelText: 'นามสกุล*',
+    hintText: '',
+  ),
+),
+  ],
+)
\ No newline at end of file
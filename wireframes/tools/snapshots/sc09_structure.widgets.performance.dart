@@ -0,0 +1,49 @@
+Column(
+  crossAxisAlignment: CrossAxisAlignment.stretch,
+  children: [
+    _Sc09Section1(profileImage: _profileImage),
+  ],
+)
+
+class _Sc09Section1 extends StatelessWidget {
+  const _Sc09Section1({super.key, required this.profileImage});
+
+  final File? profileImage;
+
+  @override
+  Widget build(BuildContext context) {
+    return Column(
+      crossAxisAlignment: CrossAxisAlignment.stretch,
+      children: [
+        CircleAvatar(
+          radius: 40.0,
+          backgroundImage: profileImage != null
+            ? FileImage(profileImage!)
+            : null,
+          child: profileImage == null
+            ? const Icon(Icons.person, size: 48.0)
+            : null,
+        ),
+        const SizedBox(height: 16.0),
+        OutlinedButton(
+          onPressed: () {},
+          child: const Text('อัปโหลด'),
+        ),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: 'ชื่อ*',
+            hintText: '',
+          ),
+        ),
+        const SizedBox(height: 16.0),
+        TextFormField(
+          decoration: const InputDecoration(
+            labelText: 'นามสกุล*',
+            hintText: '',
+          ),
+        ),
+      ],
+    );
+  }
+}
\ No newline at end of file
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - วัดเวลา import ตอนเริ่มของ CLI ด้วย python -X importtime
+
+Agent เรียก agent_visual_workflow.py / layout_helper.py เป็น subprocess บ่อยมาก
+ดังนั้น --help และคำสั่งสร้าง prompt ต้องเริ่มได้ในระดับสิบมิลลิวินาที
+benchmark นี้รันแต่ละคำสั่งหลายรอบ เอา median ของเวลา import ทั้งหมด
+แล้ว fail (exit code 1) ถ้าเกิน threshold หรือมี module หนัก (yaml, numpy, cv2) ถูก import
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py --threshold-ms 50 --repeat 7 --output startup.json
+"""
+
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import List, Dict, Any
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_THRESHOLD_MS = 75.0
+DEFAULT_REPEAT = 5
+
+HEAVY_MODULES = ("yaml", "numpy", "cv2", "PIL", "concurrent.futures", "importlib.metadata")
+
+# (ชื่อ, argv ของ script) - คำสั่งที่ไม่ควรต้อง import module หนัก
+STARTUP_CASES = [
+    ("workflow --help", ["agent_visual_workflow.py", "--help"]),
+    ("workflow --request-image", ["agent_visual_workflow.py", "--request-image", "SC-09"]),
+    ("workflow --request-widget", ["agent_visual_workflow.py", "--request-widget", "WG-01"]),
+    ("layout --help", ["layout_helper.py", "--help"]),
+    ("layout --generate-structure", ["layout_helper.py", "--generate-structure"]),
+    ("layout --create-spacing-guide", ["layout_helper.py", "--create-spacing-guide"]),
+]
+
+def _importtime_lines(stderr: str):
+    """คืน (ชื่อ module, ความลึก, cumulative µs) ของแต่ละบรรทัดใน output ของ -X importtime"""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # บรรทัดหัวตาราง
+        name = fields[2].rstrip()
+        # ความลึกของ import ดูจากจำนวน space นำหน้าชื่อ module (2 ต่อระดับ)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        yield name.strip(), depth, int(fields[1])
+
+def total_import_ms(stderr: str) -> float:
+    """เวลา import รวม = ผลรวม cumulative ของ import ระดับบนสุด"""
+    return sum(cumulative for _, depth, cumulative in _importtime_lines(stderr) if depth == 0) / 1000.0
+
+def measure_case(argv: List[str], repeat: int) -> Dict[str, Any]:
+    """รันคำสั่งหลายรอบ คืน median ของเวลา import รวม (ms) และ module หนักที่ถูก import"""
+    totals = []
+    heavy = set()
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", *argv],
+            cwd=TOOLS_DIR, capture_output=True, text=True,
+        )
+        totals.append(total_import_ms(completed.stderr))
+        modules = {name for name, _, _ in _importtime_lines(completed.stderr)}
+        heavy.update(m for m in HEAVY_MODULES if m in modules)
+    return {
+        "median_ms": round(statistics.median(totals), 2),
+        "min_ms": round(min(totals), 2),
+        "heavy_imports": sorted(heavy),
+    }
+
+def run_benchmark(threshold_ms: float = DEFAULT_THRESHOLD_MS, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    results = []
+    for name, argv in STARTUP_CASES:
+        result = {"case": name, **measure_case(argv, repeat)}
+        result["ok"] = result["median_ms"] <= threshold_ms and not result["heavy_imports"]
+        results.append(result)
+    return {
+        "python": sys.version.split()[0],
+        "threshold_ms": threshold_ms,
+        "repeat": repeat,
+        "ok": all(r["ok"] for r in results),
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup Benchmark")
+    parser.add_argument("--threshold-ms", type=float, default=DEFAULT_THRESHOLD_MS,
+                        help="Maximum median import time per command")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per command")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    
+    args = parser.parse_args()
+    
+    report = run_benchmark(args.threshold_ms, args.repeat)
+    
+    for result in report["results"]:
+        status = "ok" if result["ok"] else "FAIL"
+        heavy = f"  heavy: {', '.join(result['heavy_imports'])}" if result["heavy_imports"] else ""
+        print(f"{status:4}  {result['median_ms']:7.2f} ms  {result['case']}{heavy}")
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"Startup report saved to {args.output}")
+    
+    if not report["ok"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
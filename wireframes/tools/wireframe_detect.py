@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Wireframe Detect Tool - ตรวจจับ UI elements จาก pixels ของภาพ wireframe (CPU only)
+
+ใช้ contour + connected-component analysis ของ OpenCV บนภาพที่ preprocess แล้ว
+(grayscale, ย่อขนาด) เพื่อเสนอ element types พร้อม bounding box ตามลำดับการอ่าน:
+- วงกลม → profile_image
+- สี่เหลี่ยมกว้างทึบ → button (primary)
+- สี่เหลี่ยมกว้างแบบเส้นขอบ → textfield (ถ้ากว้างเกือบเต็มจอ) หรือ button (secondary)
+- กลุ่มเส้นเล็ก ๆ ที่เหลือ → text
+
+Usage:
+    python wireframe_detect.py --image SC/SC-09.png
+    python wireframe_detect.py --manifest "../UC-01.1/wireframes-manifest.yml" --jobs 4 --output detections.json
+"""
+
+import os
+import json
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from wireframe_preprocess import (
+    DEFAULT_MAX_WIDTH, image_size, iter_manifest_images, load_preprocessed, preprocess_images,
+)
+
+# เกณฑ์ทั้งหมดคิดเป็นสัดส่วนของความกว้างภาพ เพื่อให้ไม่ขึ้นกับ max width ที่ใช้ preprocess
+MIN_SHAPE_SIZE = 0.04       # ด้านสั้นสุดของ shape
+MIN_CIRCULARITY = 0.78
+MIN_RECTANGULARITY = 0.85
+MIN_WIDE_ASPECT = 2.2       # width / height ของ button/textfield
+TEXTFIELD_MIN_WIDTH = 0.6   # textfield มักกว้างเกือบเต็มจอ
+FILLED_RATIO = 0.55         # สัดส่วน pixel เข้มในกรอบที่ถือว่า "ทึบ"
+TEXT_MERGE_GAP = 0.025      # ระยะห่างแนวนอนที่ยังถือเป็นข้อความเดียวกัน
+MIN_TEXT_AREA = 0.00002     # พื้นที่ขั้นต่ำของกลุ่มข้อความ (สัดส่วนของพื้นที่ภาพ)
+
+def _binarize(image):
+    """แปลงภาพ float [0, 1] เป็น mask ของเส้น/พื้นเข้ม (255 = ink)"""
+    import cv2
+    import numpy as np
+    
+    gray = np.clip(np.asarray(image) * 255.0, 0, 255).astype(np.uint8)
+    _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+    return mask
+
+def _classify_shape(contour, mask, image_width: int) -> Optional[Dict[str, Any]]:
+    import cv2
+    
+    x, y, w, h = cv2.boundingRect(contour)
+    if min(w, h) < MIN_SHAPE_SIZE * image_width:
+        return None
+    
+    area = cv2.contourArea(contour)
+    perimeter = cv2.arcLength(contour, True)
+    if area <= 0 or perimeter <= 0:
+        return None
+    
+    circularity = 4 * math.pi * area / (perimeter * perimeter)
+    aspect = w / h
+    if circularity >= MIN_CIRCULARITY and 0.8 <= aspect <= 1.25:
+        return {"type": "profile_image", "bbox": [x, y, w, h], "confidence": round(min(circularity, 1.0), 2)}
+    
+    rectangularity = area / float(w * h)
+    if rectangularity >= MIN_RECTANGULARITY and aspect >= MIN_WIDE_ASPECT:
+        # วัดความทึบจากพื้นที่ด้านใน (ตัดขอบออก) เพื่อแยกปุ่มทึบจากกรอบ
+        inset = max(2, min(w, h) // 6)
+        inner = mask[y + inset:y + h - inset, x + inset:x + w - inset]
+        fill = float(inner.mean()) / 255.0 if inner.size else 0.0
+        confidence = round(rectangularity, 2)
+        if fill >= FILLED_RATIO:
+            return {"type": "button", "bbox": [x, y, w, h], "confidence": confidence,
+                    "properties": {"style": "primary"}}
+        if w >= TEXTFIELD_MIN_WIDTH * image_width:
+            return {"type": "textfield", "bbox": [x, y, w, h], "confidence": confidence}
+        return {"type": "button", "bbox": [x, y, w, h], "confidence": confidence,
+                "properties": {"style": "secondary"}}
+    
+    return None
+
+def _text_regions(text_mask, image_width: int, image_area: int) -> List[Dict[str, Any]]:
+    """รวม glyph ที่อยู่ใกล้กันในแนวนอนเป็นบรรทัดข้อความด้วย connected components"""
+    import cv2
+    
+    gap = max(3, int(TEXT_MERGE_GAP * image_width))
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (gap, 3))
+    merged = cv2.dilate(text_mask, kernel)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(merged, connectivity=8)
+    
+    regions = []
+    for label in range(1, count):
+        x, y, w, h, area = stats[label]
+        if area < MIN_TEXT_AREA * image_area:
+            continue
+        # ตัดส่วนที่ขยายจาก dilate ออก
+        pad_x = gap // 2
+        x, w = x + pad_x, max(1, w - 2 * pad_x)
+        y, h = y + 1, max(1, h - 2)
+        regions.append({"type": "text", "bbox": [int(x), int(y), int(w), int(h)], "confidence": 0.5})
+    return regions
+
+def reading_order(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """เรียง elements จากบนลงล่าง ซ้ายไปขวา (elements ที่ซ้อนกันแนวตั้งเกินครึ่งถือว่าอยู่บรรทัดเดียวกัน)"""
+    rows: List[List[Dict[str, Any]]] = []
+    for element in sorted(elements, key=lambda e: (e["bbox"][1], e["bbox"][0])):
+        x, y, w, h = element["bbox"]
+        if rows:
+            row_top = min(e["bbox"][1] for e in rows[-1])
+            row_bottom = max(e["bbox"][1] + e["bbox"][3] for e in rows[-1])
+            overlap = min(row_bottom, y + h) - max(row_top, y)
+            if overlap > 0.5 * min(h, row_bottom - row_top):
+                rows[-1].append(element)
+                continue
+        rows.append([element])
+    return [element for row in rows for element in sorted(row, key=lambda e: e["bbox"][0])]
+
+def detect_elements_in_array(image, scale: float = 1.0) -> List[Dict[str, Any]]:
+    """ตรวจจับ elements จากภาพ grayscale float [0, 1] - bbox คูณ scale กลับเป็นพิกัดภาพจริง"""
+    import cv2
+    
+    mask = _binarize(image)
+    height, width = mask.shape
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    
+    elements = []
+    text_mask = mask.copy()
+    for contour in contours:
+        shape = _classify_shape(contour, mask, width)
+        if shape is None:
+            continue
+        elements.append(shape)
+        # ลบ shape (รวมข้อความข้างใน เช่นชื่อปุ่ม) ออกจาก mask ของข้อความ
+        x, y, w, h = shape["bbox"]
+        text_mask[y:y + h, x:x + w] = 0
+    
+    elements.extend(_text_regions(text_mask, width, width * height))
+    
+    if scale != 1.0:
+        for element in elements:
+            element["bbox"] = [int(round(v * scale)) for v in element["bbox"]]
+    return reading_order(elements)
+
+def detect_elements(image_path: str, cache_dir: Optional[str] = None,
+                    max_width: int = DEFAULT_MAX_WIDTH) -> List[Dict[str, Any]]:
+    """ตรวจจับ elements ของภาพ wireframe (ใช้ภาพ preprocess จาก cache) bbox เป็นพิกัดภาพต้นฉบับ"""
+    image = load_preprocessed(image_path, cache_dir, max_width)
+    return detect_elements_in_array(image, image_size(image_path)[0] / float(image.shape[1]))
+
+def _detect_worker(task: Tuple[str, str, Optional[str], int]) -> Dict[str, Any]:
+    entry_id, image_path, cache_dir, max_width = task
+    try:
+        return {"id": entry_id, "image": image_path,
+                "elements": detect_elements(image_path, cache_dir, max_width)}
+    except (OSError, ValueError) as e:
+        return {"id": entry_id, "image": image_path, "error": str(e)}
+
+def detect_manifest(manifest_paths: List[str], cache_dir: Optional[str] = None,
+                    max_width: int = DEFAULT_MAX_WIDTH, jobs: int = 1) -> List[Dict[str, Any]]:
+    """ตรวจจับ elements ของทุก screen ใน manifest แบบ batch (ผลลัพธ์เรียงตาม manifest)"""
+    images = [
+        image
+        for manifest_path in manifest_paths
+        for image in iter_manifest_images(manifest_path, ("screens",))
+    ]
+    # decode ภาพที่ยังไม่อยู่ใน cache แบบขนานก่อน แล้วค่อย detect
+    preprocess_images(images, cache_dir, max_width, jobs)
+    
+    tasks = [(entry_id, str(path), cache_dir, max_width) for entry_id, path in images if path.exists()]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(_detect_worker, tasks))
+    return [_detect_worker(task) for task in tasks]
+
+def main():
+    parser = argparse.ArgumentParser(description="Wireframe Detect Tool")
+    parser.add_argument("--image", help="Single wireframe image to analyze")
+    parser.add_argument("--manifest", nargs="+", help="Detect every screen in these manifest files")
+    parser.add_argument("--cache-dir", help="Directory for preprocessed images")
+    parser.add_argument("--max-width", type=int, default=DEFAULT_MAX_WIDTH, help="Analysis width in pixels")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--output", help="Output file path")
+    
+    args = parser.parse_args()
+    
+    if args.image:
+        result: Any = detect_elements(args.image, args.cache_dir, args.max_width)
+    elif args.manifest:
+        result = detect_manifest(args.manifest, args.cache_dir, args.max_width, args.jobs)
+    else:
+        parser.print_help()
+        return
+    
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Detected elements saved to {args.output}")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Wireframe OCR Tool - อ่านข้อความของ labels/ปุ่มจากภาพ wireframe แล้วเติมลง layout template
+
+OCR เฉพาะ text regions และปุ่มที่ wireframe_detect.py หาไว้ (crop จากภาพต้นฉบับ)
+ส่ง crops ที่ยังไม่เคยอ่านเข้า worker pool เป็นชุด ๆ และ cache ผลตาม hash ของ pixels ใน region
+จึงไม่ต้อง OCR region ที่ไม่เปลี่ยนซ้ำแม้ภาพทั้งภาพจะเปลี่ยน
+ผลลัพธ์ถูกแก้ด้วย dictionary ของ labels ไทย/อังกฤษ (alumni_app/assets/i18n/*.yaml)
+เช่น "นามสกุลริ" → "นามสกุล*" (OCR มักอ่าน * เป็น "ริ")
+
+ต้องมี pytesseract และ tesseract พร้อม language data ไทย (tesseract-ocr-tha)
+
+Usage:
+    python wireframe_ocr.py --image SC/SC-09.png
+    python wireframe_ocr.py --manifest "../UC-01.1/wireframes-manifest.yml" --jobs 4 --output labels.json
+    python wireframe_ocr.py --manifest "../UC-01.1/wireframes-manifest.yml" --labels extra_labels.yaml
+    python agent_visual_workflow.py batch --manifests "../*/wireframes-manifest.yml" --detect-elements --ocr --output-dir out
+"""
+
+import os
+import json
+import difflib
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "ocr"
+I18N_DIR = Path(__file__).resolve().parents[2] / "alumni_app" / "assets" / "i18n"
+
+DEFAULT_LANG = "tha+eng"
+# psm 7 = ภาพเป็นข้อความบรรทัดเดียว (region จาก wireframe_detect เป็นบรรทัดเดียวอยู่แล้ว)
+DEFAULT_CONFIG = "--psm 7"
+DEFAULT_BATCH_SIZE = 16
+
+OCR_ELEMENT_TYPES = ("text", "button")
+REGION_PADDING = 4          # pixel รอบ bbox ที่ crop เพิ่ม
+MIN_REGION_HEIGHT = 32      # crop ที่เตี้ยกว่านี้จะถูกขยายก่อน OCR
+MIN_SIMILARITY = 0.75       # ความคล้ายขั้นต่ำที่จะแก้เป็นคำใน dictionary
+# สิ่งที่ OCR มักอ่านผิดจากเครื่องหมาย * ท้าย label (required) - ไม่ใช่ตัวอักษรจึงตัดออกได้เลย
+REQUIRED_MARK_MISREADS = ("+", "#")
+# ตัวอักษรที่ OCR อ่านผิดจาก * ได้เหมือนกัน แต่อาจเป็นท้ายคำจริง (เช่น "Max") - ใช้แบบตัดออก
+# เฉพาะเมื่อตรงกับ dictionary ดีกว่าแบบไม่ตัดอย่างน้อย REQUIRED_MARK_MARGIN
+REQUIRED_MARK_LETTER_MISREADS = ("ริ", "x", "X")
+REQUIRED_MARK_MARGIN = 0.1
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split()).strip(" :|_")
+
+class LabelDictionary:
+    """Dictionary ของ labels ที่ถูกต้อง ใช้แก้ผล OCR ให้ตรงกับคำที่ app ใช้จริง"""
+    
+    def __init__(self, labels: Iterable[str] = ()):
+        self.labels = sorted({normalize_text(label).rstrip("*").rstrip() for label in labels if label})
+        self._known = set(self.labels)
+        self._corrections: Dict[str, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def _strings(value: Any) -> Iterator[str]:
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from LabelDictionary._strings(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from LabelDictionary._strings(item)
+    
+    @classmethod
+    def from_files(cls, paths: Iterable[Path]) -> "LabelDictionary":
+        """โหลด labels จาก YAML (เช่น i18n th/en) หรือ text file หนึ่ง label ต่อบรรทัด"""
+        labels: List[str] = []
+        for path in paths:
+            path = Path(path)
+            if path.suffix in (".yaml", ".yml"):
+                import yaml
+                
+                data = yaml.load(path.read_bytes(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+                labels.extend(cls._strings(data))
+            else:
+                labels.extend(path.read_text(encoding='utf-8').splitlines())
+        return cls(labels)
+    
+    @classmethod
+    def default(cls, extra: Iterable[str] = ()) -> "LabelDictionary":
+        """Dictionary จาก i18n ของ alumni_app รวมกับไฟล์ labels เพิ่มเติม"""
+        return cls.from_files([*sorted(I18N_DIR.glob("*.yaml")), *map(Path, extra)])
+    
+    def _match(self, candidate: str) -> Tuple[Optional[str], float]:
+        if candidate in self._known:
+            return candidate, 1.0
+        matches = difflib.get_close_matches(candidate, self.labels, n=1, cutoff=MIN_SIMILARITY)
+        if not matches:
+            return None, 0.0
+        return matches[0], difflib.SequenceMatcher(None, candidate, matches[0]).ratio()
+    
+    def correct(self, raw: str) -> Dict[str, Any]:
+        """คืน {"text", "raw", "required", "score"} - score 0 = ไม่พบใน dictionary (ใช้ข้อความที่อ่านได้ตามเดิม)"""
+        cleaned = normalize_text(raw)
+        cached = self._corrections.get(cleaned)
+        if cached is not None:
+            return {**cached, "raw": raw}
+        
+        # (candidate, required, margin ที่ต้องชนะ candidate อื่น)
+        if cleaned.endswith("*"):
+            candidates = [(cleaned.rstrip("*").rstrip(), True, 0.0)]
+        else:
+            candidates = [(cleaned, False, 0.0)]
+            for misreads, margin in ((REQUIRED_MARK_MISREADS, 0.0),
+                                     (REQUIRED_MARK_LETTER_MISREADS, REQUIRED_MARK_MARGIN)):
+                candidates.extend((cleaned[:-len(misread)].rstrip(), True, margin) for misread in misreads
+                                  if cleaned.endswith(misread) and len(cleaned) > len(misread))
+        
+        best: Tuple[Optional[str], float, bool] = (None, 0.0, False)
+        best_rank = 0.0
+        for candidate, required, margin in candidates:
+            match, score = self._match(candidate)
+            if match is not None and score - margin > best_rank:
+                best = (match, score, required)
+                best_rank = score - margin
+        
+        match, score, required = best
+        if match is None:
+            result = {"text": cleaned, "required": cleaned.endswith("*"), "score": 0.0}
+        else:
+            result = {"text": match + ("*" if required else ""), "required": required, "score": round(score, 3)}
+        self._corrections[cleaned] = result
+        return {**result, "raw": raw}
+
+class OCRCache:
+    """ผล OCR ต่อ region hash - หนึ่งไฟล์ต่อ region จึงเขียนพร้อมกันจากหลาย process ได้"""
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.txt"
+    
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._path(key).read_text(encoding='utf-8')
+        except OSError:
+            return None
+    
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(text, encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError:
+            # cache เป็นแค่ optimization
+            pass
+
+def load_grayscale(image_path: str):
+    """Decode ภาพต้นฉบับเป็น grayscale uint8 (ความละเอียดเต็มสำหรับ OCR)"""
+    import numpy as np
+    
+    try:
+        import cv2
+    except ImportError:
+        cv2 = None
+    
+    if cv2 is not None:
+        image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise ValueError(f"Cannot decode image: {image_path}")
+        return image
+    
+    from PIL import Image
+    
+    with Image.open(image_path) as img:
+        return np.asarray(img.convert("L"))
+
+def crop_region(image, bbox: List[int]):
+    x, y, w, h = bbox
+    height, width = image.shape[:2]
+    top, left = max(0, y - REGION_PADDING), max(0, x - REGION_PADDING)
+    bottom, right = min(height, y + h + REGION_PADDING), min(width, x + w + REGION_PADDING)
+    return image[top:bottom, left:right]
+
+def region_key(crop, lang: str, config: str) -> str:
+    """Hash ของ pixels ใน region + OCR settings - region เดิมในภาพที่แก้ส่วนอื่นก็ยังได้ key เดิม"""
+    import numpy as np
+    
+    digest = hashlib.sha256(f"{lang}|{config}|{crop.shape}".encode('utf-8'))
+    digest.update(np.ascontiguousarray(crop).tobytes())
+    return digest.hexdigest()
+
+def _ocr_batch(task: Tuple[List[Tuple[str, Any]], str, str]) -> List[Tuple[str, str]]:
+    """Worker: OCR crops หนึ่งชุด คืน [(region key, ข้อความ)] - ต้องอยู่ระดับ module เพื่อให้ pickle ได้"""
+    crops, lang, config = task
+    try:
+        import pytesseract
+    except ImportError:
+        raise ValueError("OCR needs pytesseract (pip install -r requirements.txt)") from None
+    
+    from PIL import Image
+    
+    results = []
+    for key, crop in crops:
+        crop = Image.fromarray(crop)
+        if crop.height < MIN_REGION_HEIGHT:
+            scale = MIN_REGION_HEIGHT / float(crop.height)
+            crop = crop.resize((max(1, round(crop.width * scale)), MIN_REGION_HEIGHT), Image.BICUBIC)
+        try:
+            text = pytesseract.image_to_string(crop, lang=lang, config=config)
+        except pytesseract.TesseractNotFoundError:
+            raise ValueError("OCR needs the tesseract binary with Thai data (see README)") from None
+        results.append((key, text.strip()))
+    return results
+
+def run_ocr(crops: Dict[str, Any], lang: str = DEFAULT_LANG, config: str = DEFAULT_CONFIG,
+            jobs: int = 1, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, str]:
+    """OCR crops {key: crop} เป็นชุด ๆ ผ่าน process pool คืน {key: ข้อความ}"""
+    items = list(crops.items())
+    tasks = [(items[i:i + batch_size], lang, config) for i in range(0, len(items), batch_size)]
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            batches = list(executor.map(_ocr_batch, tasks))
+    else:
+        batches = [_ocr_batch(task) for task in tasks]
+    return {key: text for batch in batches for key, text in batch}
+
+class WireframeOCR:
+    """OCR regions ของ elements ที่ detect ได้ ผ่าน cache แล้วแก้ผลด้วย LabelDictionary"""
+    
+    def __init__(self, dictionary: Optional[LabelDictionary] = None, cache_dir: Optional[str] = None,
+                 lang: str = DEFAULT_LANG, config: str = DEFAULT_CONFIG, jobs: int = 1,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        self.dictionary = dictionary if dictionary is not None else LabelDictionary.default()
+        self.cache = OCRCache(cache_dir)
+        self.lang = lang
+        self.config = config
+        self.jobs = jobs
+        self.batch_size = batch_size
+        self.stats = {"regions": 0, "cache_hits": 0, "ocr_runs": 0}
+    
+    def read_regions(self, screens: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Dict[int, Dict[str, Any]]]:
+        """อ่านข้อความของทุก region ในหลาย screens พร้อมกัน คืน {element index: correction} ต่อ screen
+        
+        region ที่ pixels ซ้ำกัน (ทั้งใน screen เดียวกันหรือต่าง screen) จะถูก OCR ครั้งเดียว
+        """
+        region_keys: List[Dict[int, str]] = []
+        texts: Dict[str, str] = {}
+        pending: Dict[str, Any] = {}
+        for image_path, elements in screens:
+            keys: Dict[int, str] = {}
+            targets = [(i, e) for i, e in enumerate(elements) if e.get("type") in OCR_ELEMENT_TYPES and e.get("bbox")]
+            if targets:
+                image = load_grayscale(image_path)
+                for i, element in targets:
+                    crop = crop_region(image, element["bbox"])
+                    if crop.size == 0:
+                        continue
+                    key = region_key(crop, self.lang, self.config)
+                    keys[i] = key
+                    self.stats["regions"] += 1
+                    if key in texts or key in pending:
+                        continue
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        texts[key] = cached
+                        self.stats["cache_hits"] += 1
+                    else:
+                        pending[key] = crop
+            region_keys.append(keys)
+        
+        if pending:
+            results = run_ocr(pending, self.lang, self.config, self.jobs, self.batch_size)
+            self.stats["ocr_runs"] += len(results)
+            for key, text in results.items():
+                self.cache.put(key, text)
+            texts.update(results)
+        
+        return [
+            {i: self.dictionary.correct(texts[key]) for i, key in keys.items() if texts.get(key)}
+            for keys in region_keys
+        ]
+    
+    def label_screens(self, screens: List[Tuple[str, List[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """เติมข้อความจาก OCR ให้ elements ของหลาย screens"""
+        corrections = self.read_regions(screens)
+        return [apply_labels(elements, found) for (_, elements), found in zip(screens, corrections)]
+    
+    def label_elements(self, image_path: str, elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.label_screens([(image_path, elements)])[0]
+
+def _is_label_of(text: Dict[str, Any], field: Dict[str, Any]) -> bool:
+    """text อยู่เหนือ textfield และซ้อนกันในแนวนอน = label ของ field นั้น"""
+    tx, ty, tw, th = text["bbox"]
+    fx, fy, fw, fh = field["bbox"]
+    return ty + th <= fy + fh / 2 and tx < fx + fw and fx < tx + tw
+
+def apply_labels(elements: List[Dict[str, Any]], corrections: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """คืน elements ชุดใหม่ที่มีข้อความจาก OCR ใน properties
+    
+    text ที่อยู่ติดเหนือ textfield ถูกรวมเป็น label ของ field นั้น (ไม่แสดงซ้ำเป็น Text แยก)
+    """
+    labelled = []
+    skip = set()
+    for i, element in enumerate(elements):
+        if i in skip:
+            continue
+        element = dict(element)
+        correction = corrections.get(i)
+        following = elements[i + 1] if i + 1 < len(elements) else None
+        
+        if (correction and element.get("type") == "text" and following is not None
+                and following.get("type") == "textfield" and following.get("bbox")
+                and _is_label_of(element, following)):
+            field = dict(following)
+            field["properties"] = {
+                **(following.get("properties") or {}),
+                "label": correction["text"],
+                "required": correction["required"],
+                "validation": "required" if correction["required"] else "none",
+            }
+            labelled.append(field)
+            skip.add(i + 1)
+            continue
+        
+        if correction:
+            element["properties"] = {**(element.get("properties") or {}), "text": correction["text"]}
+        labelled.append(element)
+    return labelled
+
+def main():
+    parser = argparse.ArgumentParser(description="Wireframe OCR Tool")
+    parser.add_argument("--image", help="Single wireframe image to read")
+    parser.add_argument("--manifest", nargs="+", help="Read every screen in these manifest files")
+    parser.add_argument("--labels", nargs="+", default=[],
+                        help="Extra label dictionaries (YAML or one label per line) besides the app i18n files")
+    parser.add_argument("--lang", default=DEFAULT_LANG, help="Tesseract languages")
+    parser.add_argument("--cache-dir", help="Directory for cached OCR results")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Regions per worker task")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--output", help="Output file path")
+    
+    args = parser.parse_args()
+    
+    from wireframe_detect import detect_elements, detect_manifest
+    
+    if args.image:
+        detections = [{"id": Path(args.image).stem, "image": args.image, "elements": detect_elements(args.image)}]
+    elif args.manifest:
+        detections = detect_manifest(args.manifest, jobs=args.jobs)
+    else:
+        parser.print_help()
+        return
+    
+    ocr = WireframeOCR(LabelDictionary.default(args.labels), args.cache_dir, args.lang,
+                       jobs=args.jobs, batch_size=args.batch_size)
+    screens = [d for d in detections if "error" not in d]
+    labelled = ocr.label_screens([(d["image"], d["elements"]) for d in screens])
+    for detection, elements in zip(screens, labelled):
+        detection["elements"] = elements
+    
+    output = json.dumps({"screens": detections, "stats": ocr.stats}, indent=2, ensure_ascii=False)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"OCR labels saved to {args.output}")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
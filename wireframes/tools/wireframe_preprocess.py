@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Wireframe Preprocess Tool - เตรียมภาพ wireframe ครั้งเดียวสำหรับขั้นตอนวิเคราะห์/diff ถัดไป
+
+อ่าน path ของ screens/widgets จาก manifest แล้ว decode ภาพแต่ละไฟล์ครั้งเดียว
+แปลงเป็น grayscale ย่อขนาด normalize เป็น float32 [0, 1] และเก็บเป็น .npy
+(key ตาม hash ของไฟล์ภาพ) เพื่อให้ขั้นตอนอื่นเปิดแบบ memory-mapped ได้ทันที
+
+Usage:
+    python wireframe_preprocess.py --manifest "../UC-01.1/wireframes-manifest.yml"
+    python wireframe_preprocess.py --manifest "../UC-01.1/wireframes-manifest.yml" --max-width 512 --jobs 4
+"""
+
+import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from agent_visual_workflow import AgentVisualWorkflow, ManifestIndex
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "images"
+DEFAULT_MAX_WIDTH = 512
+_HASH_INDEX_FILE = "hash_index.json"
+
+def file_sha256(path: Path) -> str:
+    """Hash ของไฟล์ภาพ (อ่านเป็น chunk เพื่อไม่ต้องโหลดทั้งไฟล์)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ImageHashIndex:
+    """จำ hash ของภาพตาม (path, mtime, size) เพื่อไม่ต้อง hash ไฟล์ที่ไม่เปลี่ยนซ้ำ"""
+    
+    def __init__(self, cache_dir: Path):
+        self.path = cache_dir / _HASH_INDEX_FILE
+        self.dirty = False
+        try:
+            self.entries: Dict[str, List[Any]] = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def digest(self, image_path: Path) -> str:
+        stat = image_path.stat()
+        key = str(image_path.resolve())
+        entry = self.entries.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        
+        digest = file_sha256(image_path)
+        self.entries[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        self.dirty = True
+        return digest
+    
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.entries), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+def cache_file_for(digest: str, max_width: int, cache_dir: Path) -> Path:
+    return cache_dir / f"{digest}_w{max_width}.npy"
+
+def decode_grayscale(image_path: Path, max_width: int):
+    """Decode ภาพเป็น grayscale float32 [0, 1] และย่อให้กว้างไม่เกิน max_width"""
+    import numpy as np
+    
+    try:
+        import cv2
+    except ImportError:
+        cv2 = None
+    
+    if cv2 is not None:
+        # imdecode รองรับ path ภาษาไทย/Unicode บน Windows ได้ ต่างจาก imread
+        image = cv2.imdecode(np.fromfile(str(image_path), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise ValueError(f"Cannot decode image: {image_path}")
+        height, width = image.shape
+        if width > max_width:
+            new_height = max(1, round(height * max_width / width))
+            image = cv2.resize(image, (max_width, new_height), interpolation=cv2.INTER_AREA)
+    else:
+        from PIL import Image
+        
+        with Image.open(image_path) as img:
+            img = img.convert("L")
+            if img.width > max_width:
+                new_height = max(1, round(img.height * max_width / img.width))
+                img = img.resize((max_width, new_height), Image.BOX)
+            image = np.asarray(img)
+    
+    return image.astype(np.float32) / 255.0
+
+def _preprocess_worker(task: Tuple[str, str, int]) -> Dict[str, Any]:
+    """Worker สำหรับ process pool: decode แล้วเขียน .npy แบบ atomic คืน shape หรือ error"""
+    import numpy as np
+    
+    image_path, cache_file, max_width = task
+    try:
+        array = decode_grayscale(Path(image_path), max_width)
+    except (OSError, ValueError) as e:
+        return {"error": str(e)}
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp.npy"
+    np.save(tmp_file, array)
+    os.replace(tmp_file, cache_file)
+    return {"shape": list(array.shape)}
+
+def iter_manifest_images(manifest_path: str, sections: Tuple[str, ...] = ManifestIndex.SECTIONS
+                         ) -> Iterator[Tuple[str, Path]]:
+    """คืน (id, path ของภาพ) ของทุก entry ใน manifest ที่มี path (relative กับโฟลเดอร์ manifest)"""
+    yield from AgentVisualWorkflow(manifest_path).iter_images(sections)
+
+def preprocess_images(images: List[Tuple[str, Path]], cache_dir: Optional[str] = None,
+                      max_width: int = DEFAULT_MAX_WIDTH, jobs: int = 1) -> List[Dict[str, Any]]:
+    """Preprocess ภาพทั้งหมด - ภาพที่มีใน cache แล้วจะไม่ถูก decode ซ้ำ"""
+    cache_root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    cache_root.mkdir(parents=True, exist_ok=True)
+    hash_index = ImageHashIndex(cache_root)
+    
+    records = []
+    pending: Dict[str, Tuple[str, str, int]] = {}
+    for entry_id, image_path in images:
+        record = {"id": entry_id, "image": str(image_path)}
+        if not image_path.exists():
+            record["error"] = "Image not found"
+            records.append(record)
+            continue
+        
+        digest = hash_index.digest(image_path)
+        cache_file = cache_file_for(digest, max_width, cache_root)
+        record.update({"hash": digest, "cache": str(cache_file), "cached": cache_file.exists()})
+        if not record["cached"]:
+            # ภาพเดียวกันหลาย entry decode แค่ครั้งเดียว
+            pending.setdefault(str(cache_file), (str(image_path), str(cache_file), max_width))
+        records.append(record)
+    
+    hash_index.save()
+    
+    tasks = list(pending.values())
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_preprocess_worker, tasks))
+    else:
+        results = [_preprocess_worker(task) for task in tasks]
+    
+    results_by_cache = {task[1]: result for task, result in zip(tasks, results)}
+    for record in records:
+        result = results_by_cache.get(record.get("cache"))
+        if result:
+            record.update(result)
+    
+    return records
+
+def load_preprocessed(image_path: str, cache_dir: Optional[str] = None, max_width: int = DEFAULT_MAX_WIDTH):
+    """เปิดภาพที่ preprocess แล้วแบบ memory-mapped (preprocess ให้ก่อนถ้ายังไม่มีใน cache)"""
+    import numpy as np
+    
+    path = Path(image_path)
+    cache_root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    hash_index = ImageHashIndex(cache_root)
+    cache_file = cache_file_for(hash_index.digest(path), max_width, cache_root)
+    hash_index.save()
+    
+    if not cache_file.exists():
+        cache_root.mkdir(parents=True, exist_ok=True)
+        result = _preprocess_worker((str(path), str(cache_file), max_width))
+        if "error" in result:
+            raise ValueError(result["error"])
+    return np.load(cache_file, mmap_mode="r")
+
+def image_size(image_path: str) -> Tuple[int, int]:
+    """ขนาด (width, height) ของภาพต้นฉบับ โดยอ่านแค่ header"""
+    from PIL import Image
+    
+    with Image.open(image_path) as img:
+        return img.width, img.height
+
+FINGERPRINT_GRID = (8, 16)   # (columns, rows) ของ region grid - wireframe มักเป็นภาพแนวตั้ง
+REGION_THRESHOLD = 3         # ความต่างของค่าเฉลี่ยความสว่าง (0-255) ที่ถือว่า region เปลี่ยน
+
+def _block_means(image, columns: int, rows: int):
+    """ค่าเฉลี่ยของแต่ละ block ใน grid columns x rows (ใช้ได้กับภาพทุกขนาด)"""
+    import numpy as np
+    
+    image = np.asarray(image, dtype=np.float32)
+    height, width = image.shape
+    row_edges = np.linspace(0, height, rows + 1).astype(int)
+    col_edges = np.linspace(0, width, columns + 1).astype(int)
+    sums = np.add.reduceat(np.add.reduceat(image, row_edges[:-1], axis=0), col_edges[:-1], axis=1)
+    counts = np.outer(np.diff(row_edges), np.diff(col_edges)).clip(min=1)
+    return sums / counts
+
+def compute_fingerprint(image) -> Dict[str, Any]:
+    """Perceptual fingerprint ของภาพ: dHash 64 bit + ค่าเฉลี่ยความสว่างของแต่ละ region"""
+    import numpy as np
+    
+    small = _block_means(image, 9, 8)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    dhash = int("".join("1" if bit else "0" for bit in bits), 2)
+    columns, rows = FINGERPRINT_GRID
+    grid = np.rint(_block_means(image, columns, rows) * 255).astype(int)
+    return {
+        "dhash": f"{dhash:016x}",
+        "grid": grid.flatten().tolist(),
+        "grid_size": [columns, rows],
+        "shape": list(np.shape(image)),
+    }
+
+def compare_fingerprints(old: Dict[str, Any], new: Dict[str, Any],
+                         region_threshold: int = REGION_THRESHOLD) -> Dict[str, Any]:
+    """เทียบ fingerprint สองตัว คืน hamming distance ของ dHash และ cells (row, col) ที่เปลี่ยน"""
+    distance = bin(int(old["dhash"], 16) ^ int(new["dhash"], 16)).count("1")
+    columns, rows = new["grid_size"]
+    if old.get("grid_size") != new["grid_size"] or old.get("shape") != new["shape"]:
+        cells = [(row, col) for row in range(rows) for col in range(columns)]
+    else:
+        cells = [
+            divmod(i, columns)
+            for i, (a, b) in enumerate(zip(old["grid"], new["grid"]))
+            if abs(a - b) > region_threshold
+        ]
+    return {"hash_distance": distance, "changed_cells": cells}
+
+def cells_to_regions(cells: List[Tuple[int, int]], grid_size: List[int],
+                     image_width: int, image_height: int) -> List[List[int]]:
+    """รวม cells ที่เปลี่ยนและติดกันเป็น bounding boxes [x, y, w, h] ในพิกัดภาพต้นฉบับ"""
+    columns, rows = grid_size
+    remaining = set(cells)
+    regions = []
+    while remaining:
+        stack = [remaining.pop()]
+        component = []
+        while stack:
+            row, col = stack.pop()
+            component.append((row, col))
+            for neighbour in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if neighbour in remaining:
+                    remaining.remove(neighbour)
+                    stack.append(neighbour)
+        top = min(r for r, _ in component)
+        bottom = max(r for r, _ in component) + 1
+        left = min(c for _, c in component)
+        right = max(c for _, c in component) + 1
+        x0, x1 = left * image_width // columns, right * image_width // columns
+        y0, y1 = top * image_height // rows, bottom * image_height // rows
+        regions.append([x0, y0, x1 - x0, y1 - y0])
+    return sorted(regions, key=lambda r: (r[1], r[0]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Wireframe Preprocess Tool")
+    parser.add_argument("--manifest", required=True, nargs="+", help="Path(s) to wireframes manifest file")
+    parser.add_argument("--cache-dir", help="Directory for preprocessed .npy files")
+    parser.add_argument("--max-width", type=int, default=DEFAULT_MAX_WIDTH, help="Downscale images to this width")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--output", help="Output file path for the JSON summary")
+    
+    args = parser.parse_args()
+    
+    images = [image for manifest in args.manifest for image in iter_manifest_images(manifest)]
+    records = preprocess_images(images, args.cache_dir, args.max_width, args.jobs)
+    
+    summary = {
+        "images": len(records),
+        "cached": sum(1 for r in records if r.get("cached")),
+        "decoded": sum(1 for r in records if "shape" in r),
+        "errors": {r["id"]: r["error"] for r in records if "error" in r},
+        "records": records,
+    }
+    output = json.dumps(summary, indent=2, ensure_ascii=False)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Preprocess summary saved to {args.output}")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
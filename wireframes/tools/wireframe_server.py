@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Wireframe Server - JSON-RPC 2.0 server สำหรับ Agent ที่เรียก wireframe tools บ่อย ๆ
+
+แทนการเรียก agent_visual_workflow.py / layout_helper.py เป็น subprocess ทุกครั้ง
+server นี้ import โมดูลและโหลด manifest ครั้งเดียว แล้วรับ request ทีละบรรทัด (JSON ต่อบรรทัด)
+ผ่าน stdio หรือ Unix socket - manifest จะถูกโหลดใหม่อัตโนมัติเมื่อไฟล์เปลี่ยน (mtime)
+
+Methods:
+    get_screen_info               {"screen_id": "SC-09", "manifest": "..."}
+    prepare_layout_analysis_guide {"screen_id": "SC-09", "manifest": "..."}
+    create_form_layout            {"fields": [{"type": "textfield", "id": "email"}, ...]}
+    generate_flutter_column       {"container": {...}} หรือ {"fields": [...]}
+    builder_cache_stats           {}
+
+Usage:
+    python wireframe_server.py --manifest wireframes-manifest.yml
+    python wireframe_server.py --manifest wireframes-manifest.yml --socket /tmp/wireframe.sock
+    
+    echo '{"jsonrpc": "2.0", "id": 1, "method": "get_screen_info", "params": {"screen_id": "SC-09"}}' \\
+        | python wireframe_server.py --manifest wireframes-manifest.yml
+"""
+
+import os
+import sys
+import json
+import asyncio
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable
+
+from agent_visual_workflow import AgentVisualWorkflow, configure_manifest_cache
+from layout_helper import BUILDER_CACHE, LayoutHelper, load_emitter_plugins
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+class WorkflowRegistry:
+    """เก็บ AgentVisualWorkflow ต่อ manifest ไว้ใน memory และโหลดใหม่เมื่อไฟล์ถูกแก้ไข"""
+    
+    def __init__(self, default_manifest: Optional[str] = None):
+        self.default_manifest = default_manifest
+        self.workflows: Dict[str, tuple] = {}
+        self.reloads = 0
+    
+    def get(self, manifest_path: Optional[str] = None) -> AgentVisualWorkflow:
+        manifest_path = manifest_path or self.default_manifest
+        if not manifest_path:
+            raise RPCError(INVALID_PARAMS, "No manifest given and server has no default --manifest")
+        key = str(Path(manifest_path).resolve())
+        try:
+            mtime = os.stat(key).st_mtime_ns
+        except OSError as e:
+            raise RPCError(INVALID_PARAMS, f"Cannot read manifest: {e}")
+        
+        cached = self.workflows.get(key)
+        if cached is None or cached[0] != mtime:
+            if cached is not None:
+                self.reloads += 1
+            self.workflows[key] = (mtime, AgentVisualWorkflow(key))
+        return self.workflows[key][1]
+
+class WireframeRPCServer:
+    """dispatch JSON-RPC requests ไปยัง wireframe tools"""
+    
+    def __init__(self, registry: WorkflowRegistry):
+        self.registry = registry
+        self.methods: Dict[str, Callable[..., Any]] = {
+            "get_screen_info": self.get_screen_info,
+            "prepare_layout_analysis_guide": self.prepare_layout_analysis_guide,
+            "create_form_layout": self.create_form_layout,
+            "generate_flutter_column": self.generate_flutter_column,
+            "builder_cache_stats": self.builder_cache_stats,
+        }
+    
+    def get_screen_info(self, screen_id: str, manifest: Optional[str] = None) -> Dict[str, Any]:
+        return self.registry.get(manifest).get_screen_info(screen_id)
+    
+    def prepare_layout_analysis_guide(self, screen_id: str, manifest: Optional[str] = None) -> Dict[str, Any]:
+        return self.registry.get(manifest).prepare_layout_analysis_guide(screen_id)
+    
+    def create_form_layout(self, fields: List[Dict[str, str]]) -> Dict[str, Any]:
+        # form เดิมซ้ำบ่อยระหว่าง screens - ใช้ผลจาก BUILDER_CACHE แทนการสร้างใหม่
+        return BUILDER_CACHE.as_dict("create_form_layout", fields)
+    
+    def generate_flutter_column(self, container: Optional[Dict[str, Any]] = None,
+                                fields: Optional[List[Dict[str, str]]] = None) -> str:
+        if container is not None:
+            return LayoutHelper.generate_flutter_column(LayoutHelper.container_from_dict(container))
+        if fields is not None:
+            return BUILDER_CACHE.flutter_code("create_form_layout", fields)
+        raise RPCError(INVALID_PARAMS, "generate_flutter_column requires 'container' or 'fields'")
+    
+    def builder_cache_stats(self) -> Dict[str, Any]:
+        return BUILDER_CACHE.stats()
+    
+    def call(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+            raise RPCError(INVALID_REQUEST, "Invalid Request")
+        method = self.methods.get(request["method"])
+        if method is None:
+            raise RPCError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        
+        params = request.get("params", {})
+        try:
+            if isinstance(params, dict):
+                return method(**params)
+            if isinstance(params, list):
+                return method(*params)
+        except TypeError as e:
+            raise RPCError(INVALID_PARAMS, str(e))
+        except (KeyError, ValueError) as e:
+            raise RPCError(INVALID_PARAMS, f"{type(e).__name__}: {e}")
+        raise RPCError(INVALID_REQUEST, "params must be an object or array")
+    
+    def handle_request(self, request: Any) -> Optional[Dict[str, Any]]:
+        """ประมวลผล request เดียว คืน None สำหรับ notification (ไม่มี id)"""
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": self.call(request)}
+        except RPCError as e:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": e.code, "message": e.message}}
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}}
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+    
+    def handle_line(self, line: str) -> Optional[str]:
+        """ประมวลผล 1 บรรทัด (request หรือ batch) คืน response เป็น JSON หนึ่งบรรทัด"""
+        try:
+            payload = json.loads(line)
+        except ValueError as e:
+            return json.dumps({"jsonrpc": "2.0", "id": None,
+                               "error": {"code": PARSE_ERROR, "message": f"Parse error: {e}"}})
+        
+        if isinstance(payload, list):
+            if not payload:
+                response: Any = {"jsonrpc": "2.0", "id": None,
+                                 "error": {"code": INVALID_REQUEST, "message": "Empty batch"}}
+            else:
+                response = [r for r in map(self.handle_request, payload) if r is not None] or None
+        else:
+            response = self.handle_request(payload)
+        
+        if response is None:
+            return None
+        return json.dumps(response, ensure_ascii=False)
+
+async def serve_stdio(server: WireframeRPCServer) -> None:
+    """อ่าน request ทีละบรรทัดจาก stdin และเขียน response ไปที่ stdout จนกว่าจะ EOF"""
+    loop = asyncio.get_running_loop()
+    while True:
+        # readline ใน thread เพื่อให้ใช้ได้ทุก platform (รวม Windows ที่ไม่รองรับ pipe ใน event loop)
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        if not line.strip():
+            continue
+        response = server.handle_line(line)
+        if response is not None:
+            sys.stdout.write(response + "\n")
+            sys.stdout.flush()
+
+async def serve_unix_socket(server: WireframeRPCServer, socket_path: str) -> None:
+    """รับหลาย client พร้อมกันผ่าน Unix socket (หนึ่ง request ต่อบรรทัด)"""
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = server.handle_line(line.decode('utf-8'))
+                if response is not None:
+                    writer.write(response.encode('utf-8') + b"\n")
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    unix_server = await asyncio.start_unix_server(handle_client, path=socket_path, limit=16 * 1024 * 1024)
+    print(f"Listening on {socket_path}", file=sys.stderr)
+    try:
+        async with unix_server:
+            await unix_server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Wireframe JSON-RPC Server")
+    parser.add_argument("--manifest", help="Default wireframes manifest (requests may pass their own)")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of stdio")
+    parser.add_argument("--plugin", action="append", default=[],
+                        help="Extra widget emitter module or .py file for layout_helper (repeatable)")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the on-disk parsed manifest cache")
+    parser.add_argument("--cache-dir", help="Directory for the parsed manifest cache")
+    
+    args = parser.parse_args()
+    
+    configure_manifest_cache(not args.no_cache, args.cache_dir)
+    load_emitter_plugins(args.plugin)
+    
+    registry = WorkflowRegistry(args.manifest)
+    if args.manifest:
+        # โหลดล่วงหน้าเพื่อให้ request แรกเร็วและ error ของ manifest โผล่ตั้งแต่ start
+        try:
+            registry.get()
+        except (RPCError, ValueError) as e:
+            parser.error(str(e))
+    server = WireframeRPCServer(registry)
+    
+    if args.socket:
+        if not hasattr(asyncio, "start_unix_server"):
+            parser.error("--socket requires a platform with Unix domain sockets")
+        coroutine = serve_unix_socket(server, args.socket)
+    else:
+        coroutine = serve_stdio(server)
+    
+    try:
+        asyncio.run(coroutine)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()